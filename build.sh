@@ -4,4 +4,7 @@ set -o errexit
 
 poetry install
 
-python manage.py migrate
\ No newline at end of file
+python manage.py collectstatic --no-input
+python manage.py migrate
+python manage.py clearsessions
+python manage.py check --deploy --fail-level ERROR
\ No newline at end of file
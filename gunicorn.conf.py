@@ -0,0 +1,28 @@
+"""
+Gunicorn settings, read from the project directory on start.
+
+Threaded workers keep serving requests while one of their threads hashes
+a password: PBKDF2 and Argon2 release the GIL while they compute.
+
+A single worker is started by default. The local-memory cache is per
+process, so cache invalidation only reaches every worker when they share
+the cache of REDIS_URL. Without it, WEB_CONCURRENCY is lowered to one
+worker with a warning.
+"""
+import os
+
+worker_class = 'gthread'
+requested_workers = int(os.getenv('WEB_CONCURRENCY', '1'))
+workers = requested_workers if os.getenv('REDIS_URL') else 1
+threads = int(os.getenv('GUNICORN_THREADS', '4'))
+
+
+def on_starting(server):
+    """Warn when the workers requested by WEB_CONCURRENCY were lowered."""
+    if workers < requested_workers:
+        server.log.warning(
+            'WEB_CONCURRENCY=%s needs a cache shared by the workers, '
+            'starting %s worker: set REDIS_URL to run more.',
+            requested_workers,
+            workers,
+        )
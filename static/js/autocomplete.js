@@ -0,0 +1,71 @@
+// Load choices of `select[data-autocomplete-url]` widgets on demand.
+//
+// The server renders only the selected options. A search box is added in
+// front of every such select, and the options matching the typed prefix are
+// fetched from the JSON endpoint as {"results": [{"id": ..., "text": ...}]}.
+(function () {
+  'use strict';
+
+  var DEBOUNCE_MS = 250;
+
+  function replaceOptions(select, results) {
+    var kept = {};
+    Array.prototype.slice.call(select.options).forEach(function (option) {
+      if (option.selected || option.value === '') {
+        kept[option.value] = true;
+      } else {
+        select.removeChild(option);
+      }
+    });
+    results.forEach(function (result) {
+      var value = String(result.id);
+      if (!kept[value]) {
+        select.appendChild(new Option(result.text, value));
+      }
+    });
+  }
+
+  function attach(select) {
+    var search = document.createElement('input');
+    var timer = null;
+    var controller = null;
+
+    search.type = 'search';
+    search.className = 'form-control form-control-sm mb-1';
+    search.placeholder = select.dataset.autocompletePlaceholder || '';
+    search.setAttribute('aria-controls', select.id);
+    select.parentNode.insertBefore(search, select);
+
+    function load() {
+      var url = select.dataset.autocompleteUrl +
+        '?q=' + encodeURIComponent(search.value.trim());
+      if (controller) {
+        controller.abort();
+      }
+      controller = new AbortController();
+      fetch(url, {credentials: 'same-origin', signal: controller.signal})
+        .then(function (response) {
+          return response.ok ? response.json() : {results: []};
+        })
+        .then(function (data) {
+          replaceOptions(select, data.results);
+        })
+        .catch(function () {});
+    }
+
+    search.addEventListener('input', function () {
+      clearTimeout(timer);
+      timer = setTimeout(load, DEBOUNCE_MS);
+    });
+    search.addEventListener('focus', function onFirstFocus() {
+      search.removeEventListener('focus', onFirstFocus);
+      load();
+    });
+  }
+
+  document.addEventListener('DOMContentLoaded', function () {
+    document
+      .querySelectorAll('select[data-autocomplete-url]')
+      .forEach(attach);
+  });
+}());
@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class ApiConfig(AppConfig):
+    """Configuration class for the JSON API app."""
+
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'task_manager.api'
@@ -0,0 +1,170 @@
+from django.db import transaction
+from django.db.models import Prefetch
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from task_manager.labels.models import Label
+from task_manager.tasks.counters import count_changes, count_tasks
+from task_manager.tasks.forms import TaskCreationForm
+from task_manager.tasks.labels import get_label_changes, save_label_changes
+from task_manager.tasks.models import Task
+
+NAME_FIELD = 'name'
+# `bulk_update` does not apply `auto_now`, `updated_at` is set by `save`.
+UPDATED_FIELDS = (
+    NAME_FIELD,
+    'description',
+    'status',
+    'executor',
+    'updated_at',
+)
+
+
+class BulkTaskForm(TaskCreationForm):
+    """
+    Task form validating a single item of a batch.
+
+    The name of every task is checked against the database by TaskBatch
+    with one query for the whole batch, so the per-form checks are skipped.
+    """
+
+    def validate_unique(self):
+        """Skip the per-task unique checks, the batch checks the names."""
+
+    def _get_validation_exclusions(self):
+        # The choice fields have already resolved the foreign keys through
+        # the choice cache, so the model does not query for them again.
+        exclusions = super()._get_validation_exclusions()
+        exclusions.update(('status', 'executor'))
+        return exclusions
+
+
+class TaskBatch(object):
+    """Validate and save many tasks in a single transaction."""
+
+    def __init__(self, forms, errors=None):
+        """Store the forms of the batch entries by their index."""
+        self.forms = forms
+        self.errors = errors or {}
+
+    @classmethod
+    def for_create(cls, entries):
+        """Return a batch creating a task from every item."""
+        forms = {}
+        errors = {}
+        for index, entry in enumerate(entries):
+            if isinstance(entry, dict):
+                forms[index] = BulkTaskForm(entry)
+            else:
+                errors[index] = _item_error()
+        return cls(forms, errors)
+
+    @classmethod
+    def for_update(cls, entries):
+        """Return a batch updating the task with the `id` of every item."""
+        task_ids = {
+            entry.get('id') for entry in entries if isinstance(entry, dict)
+        }
+        tasks = Task.objects.filter(
+            pk__in=[pk for pk in task_ids if isinstance(pk, int)],
+        ).prefetch_related(
+            Prefetch('labels', queryset=Label.objects.only('pk')),
+        ).in_bulk()
+        forms = {}
+        errors = {}
+        for index, entry in enumerate(entries):
+            task = None
+            if isinstance(entry, dict):
+                task = tasks.get(entry.get('id'))
+            if task is None:
+                errors[index] = _item_error(_('Task not found.'), 'id')
+                continue
+            entry_data = {**_get_task_data(task), **entry}
+            forms[index] = BulkTaskForm(entry_data, instance=task)
+        return cls(forms, errors)
+
+    def is_valid(self):
+        """Validate every entry, and the names of the whole batch."""
+        for index, form in self.forms.items():
+            if not form.is_valid():
+                self.errors[index] = form.errors.get_json_data()
+        self._check_names()
+        return not self.errors
+
+    @transaction.atomic
+    def save(self, author=None):
+        """Save the tasks of a valid batch and return their ids."""
+        tasks = [form.save(commit=False) for form in self.forms.values()]
+        updated_ids = [task.pk for task in tasks if task.pk is not None]
+        if updated_ids:
+            updated_at = timezone.now()
+            for updated_task in tasks:
+                updated_task.updated_at = updated_at
+            with count_changes(updated_ids):
+                Task.objects.bulk_update(tasks, UPDATED_FIELDS)
+                # The current labels were prefetched by `for_update`.
+                save_label_changes({
+                    form.instance.pk: get_label_changes(
+                        form.instance,
+                        form.cleaned_data['labels'],
+                    )
+                    for form in self.forms.values()
+                })
+        else:
+            for new_task in tasks:
+                new_task.author = author
+            Task.objects.bulk_create(tasks)
+            self._save_labels()
+            count_tasks([created_task.pk for created_task in tasks])
+        return [form.instance.pk for form in self.forms.values()]
+
+    def _save_labels(self):
+        Task.labels.through.objects.bulk_create(
+            Task.labels.through(task_id=form.instance.pk, label_id=label.pk)
+            for form in self.forms.values()
+            for label in form.cleaned_data['labels']
+        )
+
+    def _check_names(self):
+        indexes_by_name = {}
+        for index, form in self.forms.items():
+            if index not in self.errors:
+                indexes_by_name.setdefault(
+                    form.cleaned_data[NAME_FIELD],
+                    [],
+                ).append(index)
+        batch_ids = [
+            batch_form.instance.pk for batch_form in self.forms.values()
+        ]
+        taken_names = Task.objects.filter(
+            name__in=indexes_by_name,
+        ).exclude(pk__in=batch_ids).values_list(NAME_FIELD, flat=True)
+        taken = set(taken_names)
+        for task_name, indexes in indexes_by_name.items():
+            duplicates = indexes if task_name in taken else indexes[1:]
+            for duplicate in duplicates:
+                self.errors[duplicate] = _item_error(
+                    _('Task with this name already exists.'),
+                    NAME_FIELD,
+                )
+
+
+def _get_task_data(task):
+    return {
+        NAME_FIELD: task.name,
+        'description': task.description,
+        'status': task.status_id,
+        'executor': task.executor_id,
+        'labels': [label.pk for label in task.labels.all()],
+    }
+
+
+def _item_error(message=None, field_name='__all__'):
+    message = message or _('Each item must be a JSON object.')
+    return {field_name: [{'message': message, 'code': 'invalid'}]}
+
+
+def delete_tasks(task_ids):
+    """Delete the tasks and update the task counters once."""
+    with count_changes(task_ids):
+        Task.objects.filter(pk__in=task_ids).delete()
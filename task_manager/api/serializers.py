@@ -0,0 +1,99 @@
+from django.db.models import Prefetch
+
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task
+from task_manager.users.models import CustomUser
+
+
+class ModelSerializer(object):
+    """
+    Convert model instances into JSON-ready dictionaries.
+
+    Clients may ask for a subset of `field_names` (a sparse fieldset), in
+    which case only the columns of the requested fields are loaded.
+    Foreign keys are serialized as ids and many-to-many fields as lists
+    of ids.
+    """
+
+    model = None
+    field_names = ()
+
+    def __init__(self, requested=None):
+        """Select the fields to serialize, all of them by default."""
+        requested = set(requested or self.field_names)
+        unknown = requested.difference(self.field_names)
+        if unknown:
+            raise ValueError(
+                'Unknown fields: {0}'.format(', '.join(sorted(unknown))),
+            )
+        meta = self.model._meta  # noqa: WPS437
+        self.fields = [
+            meta.get_field(name)
+            for name in self.field_names
+            if name in requested
+        ]
+
+    def prepare(self, queryset, extra_columns=()):
+        """Restrict the queryset to the columns of the selected fields."""
+        columns = {'pk', *extra_columns}
+        for field in self.fields:
+            if field.many_to_many:
+                queryset = queryset.prefetch_related(Prefetch(
+                    field.name,
+                    queryset=field.related_model.objects.only('pk'),
+                ))
+            else:
+                columns.add(field.name)
+        return queryset.only(*columns)
+
+    def serialize(self, instance):
+        """Return the selected fields of a prepared instance."""
+        return {
+            field.name: self.get_field_data(instance, field)
+            for field in self.fields
+        }
+
+    def get_field_data(self, instance, field):
+        """Return the JSON-ready data of a single field."""
+        if field.many_to_many:
+            related = getattr(instance, field.name).all()
+            return [related_object.pk for related_object in related]
+        return getattr(instance, field.attname)
+
+
+class TaskSerializer(ModelSerializer):
+    """Serializer of tasks."""
+
+    model = Task
+    field_names = (
+        'id',
+        'name',
+        'description',
+        'status',
+        'author',
+        'executor',
+        'labels',
+        'created_at',
+    )
+
+
+class StatusSerializer(ModelSerializer):
+    """Serializer of statuses."""
+
+    model = Status
+    field_names = ('id', 'name', 'created_at')
+
+
+class LabelSerializer(ModelSerializer):
+    """Serializer of labels."""
+
+    model = Label
+    field_names = ('id', 'name', 'created_at')
+
+
+class UserSerializer(ModelSerializer):
+    """Serializer of users, without their credentials."""
+
+    model = CustomUser
+    field_names = ('id', 'username', 'first_name', 'last_name', 'date_joined')
@@ -0,0 +1,126 @@
+from http import HTTPStatus
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.http import JsonResponse
+from django.utils.translation import gettext_lazy as _
+from django.views import View
+
+from task_manager.api.bulk import TaskBatch, delete_tasks
+from task_manager.api.serializers import TaskSerializer
+from task_manager.api.views import (
+    ApiDetailView,
+    ApiListView,
+    ApiLoginMixin,
+    get_json_list,
+    json_error,
+)
+from task_manager.tasks.filters import TasksFilter
+from task_manager.tasks.models import Task
+from task_manager.tasks.search import SEARCH_ORDERING
+
+
+class TasksApiView(ApiListView):
+    """Return tasks filtered with the same parameters as the tasks list."""
+
+    model = Task
+    serializer_class = TaskSerializer
+    paginate_ordering = ('created_at', 'id')
+
+    def get_queryset(self):
+        """Return the tasks matching the TasksFilter parameters."""
+        filterset = TasksFilter(
+            self.request.GET,
+            queryset=Task.objects.all(),
+            request=self.request,
+        )
+        if not filterset.form.is_valid():
+            raise ValidationError(filterset.form.errors)
+        return filterset.qs
+
+    def get_paginate_ordering(self, queryset):  # noqa: WPS615
+        """Order search results by rank and other lists by creation."""
+        if 'search_rank' in queryset.query.annotations:
+            return SEARCH_ORDERING
+        return self.paginate_ordering
+
+
+class TaskApiView(ApiDetailView):
+    """Return a single task."""
+
+    model = Task
+    serializer_class = TaskSerializer
+
+
+class TasksBulkView(ApiLoginMixin, View):
+    """
+    Create, update or delete many tasks in a single transaction.
+
+    POST and PATCH expect `{"tasks": [...]}`, where every task of a PATCH
+    has an `id` and only the given fields change. DELETE expects
+    `{"ids": [...]}`, and only the author of all of the tasks may delete
+    them.
+    """
+
+    def post(self, request, *args, **kwargs):
+        """Create the tasks of the request."""
+        return self.save_batch(TaskBatch.for_create, HTTPStatus.CREATED)
+
+    def patch(self, request, *args, **kwargs):
+        """Update the tasks of the request."""
+        return self.save_batch(TaskBatch.for_update, HTTPStatus.OK)
+
+    def delete(self, request, *args, **kwargs):
+        """Delete the tasks with the ids of the request."""
+        try:
+            task_ids = get_json_list(self.request, 'ids')
+        except ValidationError as error:
+            return json_error(error.messages[0])
+        if not all(isinstance(pk, int) for pk in task_ids):
+            return json_error(_('Task ids must be integers.'))
+        tasks = Task.objects.filter(pk__in=task_ids)
+        with transaction.atomic():
+            authors = dict(tasks.select_for_update().values_list(
+                'pk',
+                'author_id',
+            ))
+            missing = sorted(set(task_ids).difference(authors))
+            if missing:
+                return json_error(
+                    _('Not found.'),
+                    HTTPStatus.NOT_FOUND,
+                    ids=missing,
+                )
+            foreign = sorted(
+                pk
+                for pk, author_id in authors.items()
+                if author_id != request.user.pk
+            )
+            if foreign:
+                return json_error(
+                    _('Only the author can delete the task'),
+                    HTTPStatus.FORBIDDEN,
+                    ids=foreign,
+                )
+            delete_tasks(list(authors))
+        return JsonResponse({'deleted': len(authors)})
+
+    def save_batch(self, build_batch, success_status):
+        """Validate and save a batch, respond with the saved tasks."""
+        try:
+            batch = build_batch(get_json_list(self.request, 'tasks'))
+        except ValidationError as error:
+            return json_error(error.messages[0])
+        if not batch.is_valid():
+            return json_error(_('Invalid tasks.'), errors=batch.errors)
+        try:
+            task_ids = batch.save(author=self.request.user)
+        except IntegrityError:
+            return json_error(
+                _('Task with this name already exists.'),
+                HTTPStatus.CONFLICT,
+            )
+        serializer = TaskSerializer()
+        tasks = serializer.prepare(Task.objects.filter(pk__in=task_ids))
+        saved = [serializer.serialize(task) for task in tasks.order_by('pk')]
+        return JsonResponse({'results': saved}, status=success_status)
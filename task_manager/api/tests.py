@@ -0,0 +1,257 @@
+import json
+from http import HTTPStatus
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.tasks.models import Task
+from task_manager.utils.pagination import encode_cursor
+
+LINK_WRITES = frozenset((
+    'DELETE FROM "tasks_task_labels"',
+    'INSERT INTO "tasks_task_labels"',
+))
+
+
+class BaseApiTest(TestCase):
+    """Set up tests for the JSON API."""
+
+    fixtures = ['users.json', 'statuses.json', 'tasks.json', 'labels.json']
+
+    def setUp(self):
+        self.author = User.objects.get(pk=1)
+        self.client.force_login(self.author)
+        self.tasks_url = reverse('api_tasks')
+        self.bulk_url = reverse('api_tasks_bulk')
+
+    def get_json(self, url, query=None):
+        response = self.client.get(url, query or {})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        return response.json()
+
+    def send_json(self, method, payload):
+        return getattr(self.client, method)(
+            self.bulk_url,
+            json.dumps(payload),
+            content_type='application/json',
+        )
+
+
+class ReadApiTest(BaseApiTest):
+    """Test the read-only endpoints of the API."""
+
+    def test_api_requires_login(self):
+        self.client.logout()
+        response = self.client.get(self.tasks_url)
+
+        self.assertEqual(response.status_code, HTTPStatus.UNAUTHORIZED)
+        self.assertIn('detail', response.json())
+
+    def test_tasks_list_returns_all_fields(self):
+        tasks = self.get_json(self.tasks_url)['results']
+
+        self.assertEqual([task['name'] for task in tasks], [
+            'task1', 'task2', 'task3',
+        ])
+        self.assertDictEqual(
+            {key: tasks[0][key] for key in ('status', 'executor', 'labels')},
+            {'status': 1, 'executor': 2, 'labels': [1]},
+        )
+
+    def test_tasks_list_sparse_fieldset(self):
+        with CaptureQueriesContext(connection) as captured:
+            response = self.get_json(self.tasks_url, {'fields': 'id,name'})
+            task_query = captured.captured_queries[-1]['sql']
+
+        self.assertEqual(set(response['results'][0]), {'id', 'name'})
+        self.assertNotIn('description', task_query)
+
+    def test_tasks_list_rejects_unknown_fields(self):
+        response = self.client.get(self.tasks_url, {'fields': 'password'})
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertIn('fields', response.json()['errors'])
+
+    def test_tasks_list_reuses_tasks_filter(self):
+        response = self.get_json(self.tasks_url, {'status': 2})
+        self.assertEqual(
+            [task['name'] for task in response['results']],
+            ['task2'],
+        )
+
+        response = self.client.get(self.tasks_url, {'status': 'x'})
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+    def test_tasks_list_cursor_pagination(self):
+        names = []
+        url = self.tasks_url
+        query = {'limit': 2, 'fields': 'name'}
+        while url:
+            response = self.get_json(url, query)
+            names.extend(task['name'] for task in response['results'])
+            url = response['next']
+            query = None
+
+        self.assertEqual(names, ['task1', 'task2', 'task3'])
+
+    def test_tasks_list_crafted_cursor(self):
+        response = self.get_json(
+            self.tasks_url,
+            {'fields': 'name', 'after': encode_cursor([None, None])},
+        )
+
+        self.assertEqual(
+            [task['name'] for task in response['results']],
+            ['task1', 'task2', 'task3'],
+        )
+
+    def test_detail_endpoints(self):
+        task = self.get_json(reverse('api_tasks_detail', args=[3]))
+        status = self.get_json(reverse('api_statuses_detail', args=[1]))
+        response = self.client.get(reverse('api_labels_detail', args=[99]))
+
+        self.assertEqual(task['author'], 2)
+        self.assertEqual(status['name'], 'done')
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+    def test_users_list_hides_credentials(self):
+        users = self.get_json(reverse('api_users'))['results']
+
+        self.assertEqual(len(users), 2)
+        self.assertNotIn('password', users[0])
+        self.assertEqual(users[0]['username'], 'user1')
+
+
+class BulkApiTest(BaseApiTest):
+    """Test the bulk task endpoints of the API."""
+
+    batch_size = 100
+    max_queries = 20
+
+    def new_tasks(self, count):
+        return [
+            {
+                'name': 'bulk task {0}'.format(index),
+                'description': 'created in bulk',
+                'status': 1,
+                'executor': 2,
+                'labels': [1, 2],
+            }
+            for index in range(count)
+        ]
+
+    def test_bulk_create(self):
+        new_tasks = self.new_tasks(self.batch_size)
+        with CaptureQueriesContext(connection) as captured:
+            response = self.send_json('post', {'tasks': new_tasks})
+            queries = len(captured)
+        self.assertEqual(response.status_code, HTTPStatus.CREATED)
+
+        created = Task.objects.filter(name__startswith='bulk task')
+        links = Task.labels.through.objects.filter(task__in=created)
+        self.assertEqual(created.count(), self.batch_size)
+        self.assertEqual(links.count(), self.batch_size * 2)
+        self.assertTrue(all(task.author == self.author for task in created))
+        self.assertEqual(len(response.json()['results']), self.batch_size)
+        self.assertLess(queries, self.max_queries)
+
+    def test_bulk_create_is_atomic(self):
+        tasks = self.new_tasks(3)
+        tasks[1]['status'] = 99
+        tasks[2]['name'] = 'task1'
+        response = self.send_json('post', {'tasks': tasks})
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(set(response.json()['errors']), {'1', '2'})
+        self.assertFalse(Task.objects.filter(name='bulk task 0').exists())
+
+    def test_bulk_create_rejects_duplicate_names(self):
+        tasks = self.new_tasks(2)
+        tasks[1]['name'] = tasks[0]['name']
+        response = self.send_json('post', {'tasks': tasks})
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(list(response.json()['errors']), ['1'])
+
+    def test_bulk_create_rejects_malformed_body(self):
+        for payload in ({}, {'tasks': []}, {'tasks': 'x'}, [1]):
+            with self.subTest(payload=payload):
+                response = self.send_json('post', payload)
+                self.assertEqual(
+                    response.status_code,
+                    HTTPStatus.BAD_REQUEST,
+                )
+
+    def test_bulk_update(self):
+        updates = [
+            {'id': 1, 'name': 'task1 renamed', 'labels': [2, 3]},
+            {'id': 2, 'status': 3},
+        ]
+        response = self.send_json('patch', {'tasks': updates})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+
+        first = Task.objects.get(pk=1)
+        second = Task.objects.get(pk=2)
+        self.assertEqual(first.name, 'task1 renamed')
+        self.assertEqual(first.status_id, 1)
+        self.assertEqual(
+            sorted(first.labels.values_list('pk', flat=True)),
+            [2, 3],
+        )
+        self.assertEqual(second.name, 'task2')
+        self.assertEqual(second.status_id, 3)
+
+    def test_bulk_update_writes_changed_labels(self):
+        Task.objects.get(pk=2).labels.add(1, 2)
+        updates = [
+            {'id': 1, 'labels': [1]},
+            {'id': 2, 'labels': [2, 3]},
+            {'id': 3, 'labels': [3]},
+        ]
+        with CaptureQueriesContext(connection) as captured:
+            response = self.send_json('patch', {'tasks': updates})
+            link_writes = [
+                query['sql'].split()[0]
+                for query in captured
+                if ' '.join(query['sql'].split()[:3]) in LINK_WRITES
+            ]
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(link_writes, ['DELETE', 'INSERT'])
+        for update in updates:
+            labels = Task.objects.get(pk=update['id']).labels.order_by('pk')
+            self.assertEqual(
+                list(labels.values_list('pk', flat=True)),
+                update['labels'],
+            )
+
+    def test_bulk_update_unknown_task(self):
+        response = self.send_json('patch', {'tasks': [{'id': 99}]})
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertIn('id', response.json()['errors']['0'])
+
+    def test_bulk_delete(self):
+        response = self.send_json('delete', {'ids': [1, 2]})
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json(), {'deleted': 2})
+        self.assertListEqual(
+            list(Task.objects.values_list('pk', flat=True)),
+            [3],
+        )
+
+    def test_bulk_delete_only_by_author(self):
+        response = self.send_json('delete', {'ids': [1, 3]})
+
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+        self.assertEqual(response.json()['ids'], [3])
+        self.assertEqual(Task.objects.count(), 3)
+
+    def test_bulk_delete_missing_tasks(self):
+        response = self.send_json('delete', {'ids': [1, 99]})
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+        self.assertEqual(Task.objects.count(), 3)
@@ -0,0 +1,37 @@
+from django.urls import path
+
+from task_manager.api import serializers, tasks, views
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.users.models import CustomUser
+
+
+def resource_urls(prefix, model, serializer_class):
+    """Return the list and detail URL patterns of a read-only resource."""
+    view_options = {'model': model, 'serializer_class': serializer_class}
+    return [
+        path(
+            '{0}/'.format(prefix),
+            views.ApiListView.as_view(**view_options),
+            name='api_{0}'.format(prefix),
+        ),
+        path(
+            '{0}/<int:pk>/'.format(prefix),
+            views.ApiDetailView.as_view(**view_options),
+            name='api_{0}_detail'.format(prefix),
+        ),
+    ]
+
+
+urlpatterns = [
+    path('tasks/', tasks.TasksApiView.as_view(), name='api_tasks'),
+    path('tasks/bulk/', tasks.TasksBulkView.as_view(), name='api_tasks_bulk'),
+    path(
+        'tasks/<int:pk>/',
+        tasks.TaskApiView.as_view(),
+        name='api_tasks_detail',
+    ),
+    *resource_urls('statuses', Status, serializers.StatusSerializer),
+    *resource_urls('labels', Label, serializers.LabelSerializer),
+    *resource_urls('users', CustomUser, serializers.UserSerializer),
+]
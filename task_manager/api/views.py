@@ -0,0 +1,132 @@
+import json
+from http import HTTPStatus
+
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.exceptions import ValidationError
+from django.http import JsonResponse
+from django.utils.translation import gettext_lazy as _
+from django.views import View
+
+from task_manager.utils.pagination import KeysetPaginationMixin
+
+MAX_BATCH_SIZE = 500
+
+
+def json_error(message, status=HTTPStatus.BAD_REQUEST, **extra):
+    """Return a JSON response describing an error."""
+    return JsonResponse({'detail': message, **extra}, status=status)
+
+
+def get_json_list(request, key, max_length=MAX_BATCH_SIZE):
+    """Return the non-empty list under the key of the JSON request body."""
+    try:
+        body = json.loads(request.body)
+    except ValueError:
+        raise ValidationError(_('Request body must be valid JSON.'))
+    entries = body.get(key) if isinstance(body, dict) else None
+    if not isinstance(entries, list) or not entries:
+        raise ValidationError(
+            _('"%(key)s" must be a non-empty list.'),
+            params={'key': key},
+        )
+    if len(entries) > max_length:
+        raise ValidationError(
+            _('At most %(size)s entries are allowed per request.'),
+            params={'size': max_length},
+        )
+    return entries
+
+
+class ApiLoginMixin(LoginRequiredMixin):
+    """Answer anonymous API requests with 401 instead of a redirect."""
+
+    def handle_no_permission(self):
+        """Return a JSON error for users that are not signed in."""
+        return json_error(
+            _('You are not signed in! Please, sign in'),
+            HTTPStatus.UNAUTHORIZED,
+        )
+
+
+class ApiListView(ApiLoginMixin, KeysetPaginationMixin, View):
+    """
+    Return a page of serialized objects.
+
+    `fields=` selects a sparse fieldset, `limit=` the page size, and the
+    `next` and `previous` URLs of the response carry the page cursors.
+    """
+
+    model = None
+    serializer_class = None
+    paginate_ordering = ('id',)
+    default_limit = 50
+    max_limit = 200
+
+    def get(self, request, *args, **kwargs):
+        """Handle GET requests."""
+        try:
+            queryset, serializer = self.get_queryset(), self.get_serializer()
+        except ValidationError as error:
+            return json_error(_('Invalid query.'), errors=error.message_dict)
+        ordering = self.get_paginate_ordering(queryset)
+        queryset = serializer.prepare(queryset, extra_columns=[
+            name.lstrip('-')
+            for name in ordering
+            if name.lstrip('-') not in queryset.query.annotations
+        ])
+        page = self.paginate_queryset(queryset, self.get_limit())[1]
+        return JsonResponse({
+            'results': [serializer.serialize(row) for row in page],
+            'next': self.get_page_url(self.after_kwarg, page.next_cursor),
+            'previous': self.get_page_url(
+                self.before_kwarg,
+                page.previous_cursor,
+            ),
+        })
+
+    def get_queryset(self):
+        """Return the objects to list."""
+        return self.model.objects.all()
+
+    def get_serializer(self):
+        """Return a serializer of the requested fields."""
+        requested = self.request.GET.get('fields', '')
+        try:
+            return self.serializer_class(
+                [name for name in requested.split(',') if name],
+            )
+        except ValueError as error:
+            raise ValidationError({'fields': [str(error)]})
+
+    def get_limit(self):
+        """Return the requested page size within the bounds."""
+        try:
+            limit = int(self.request.GET.get('limit', self.default_limit))
+        except ValueError:
+            return self.default_limit
+        return min(max(limit, 1), self.max_limit)
+
+    def get_page_url(self, cursor_kwarg, cursor):
+        """Return the absolute URL of a neighbouring page, if there is one."""
+        if cursor is None:
+            return None
+        return self.request.build_absolute_uri('?{0}'.format(
+            self.get_page_query(cursor_kwarg, cursor),
+        ))
+
+
+class ApiDetailView(ApiListView):
+    """Return a single serialized object."""
+
+    def get(self, request, *args, **kwargs):
+        """Handle GET requests."""
+        try:
+            serializer = self.get_serializer()
+        except ValidationError as error:
+            return json_error(_('Invalid query.'), errors=error.message_dict)
+        instance = serializer.prepare(
+            self.get_queryset().filter(pk=kwargs['pk']),
+        ).first()
+        if instance is None:
+            return json_error(_('Not found.'), HTTPStatus.NOT_FOUND)
+        return JsonResponse(serializer.serialize(instance))
@@ -0,0 +1,15 @@
+from django.apps import AppConfig
+
+
+class TaskManagerConfig(AppConfig):
+    """Configuration class for the project-wide app."""
+
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'task_manager'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+
+        from task_manager import checks  # noqa: F401
+        from task_manager.utils.metrics import count_connection
+        connection_created.connect(count_connection)
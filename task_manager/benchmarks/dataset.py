@@ -0,0 +1,152 @@
+import dataclasses
+import random
+import string
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.counters import count_changes, count_tasks
+from task_manager.tasks.models import Task
+from task_manager.utils.cache import bump_version, get_namespace
+
+BATCH_SIZE = 2000
+NAME_WORDS = 3
+DESCRIPTION_WORDS = 20
+
+
+@dataclasses.dataclass
+class DatasetSize(object):
+    """Numbers of rows of a synthetic dataset."""
+
+    tasks: int = 1000
+    users: int = 10
+    statuses: int = 5
+    labels: int = 10
+    # Labels linked to every task.
+    links: int = 2
+
+
+class SyntheticDataset(object):
+    """
+    Generate users, statuses, labels and tasks for benchmarks.
+
+    Every generated row is named with the dataset prefix, so a dataset can
+    be created in a database that already holds real data and removed from
+    it afterwards.
+    """
+
+    def __init__(self, prefix='bench', seed=0, vocabulary_size=500):
+        """Prepare a reproducible word generator for the dataset."""
+        self.prefix = prefix
+        # Benchmarks need reproducible data, not unpredictable data.
+        self.random = random.Random(seed)  # noqa: S311
+        self.vocabulary = [
+            ''.join(self.random.choices(string.ascii_lowercase, k=7))
+            for _ in range(vocabulary_size)
+        ]
+
+    def create(self, size=None):
+        """Create a dataset of the given size in a single transaction."""
+        size = size or DatasetSize()
+        with transaction.atomic():
+            user_ids = self._create_users(size.users)
+            status_ids = create_named(Status, self.prefix, size.statuses)
+            label_ids = create_named(Label, self.prefix, size.labels)
+            self._create_tasks(size.tasks, user_ids, status_ids)
+            link_labels(
+                self.tasks().values_list('id', flat=True),
+                label_ids,
+                self.random,
+                size.links,
+            )
+            count_tasks(self.tasks())
+        invalidate_bulk_changes()
+
+    def delete(self):
+        """Delete every row of the dataset."""
+        with transaction.atomic():
+            tasks = self.tasks()
+            with count_changes(tasks):
+                Task.labels.through.objects.filter(task__in=tasks).delete()
+                tasks.delete()
+            Label.objects.filter(name__startswith=self.prefix).delete()
+            Status.objects.filter(name__startswith=self.prefix).delete()
+            User.objects.filter(username__startswith=self.prefix).delete()
+        invalidate_bulk_changes()
+
+    def tasks(self):
+        """Return the tasks of the dataset."""
+        return Task.objects.filter(name__startswith=self.prefix)
+
+    def words(self, count):
+        """Return random words of the dataset vocabulary."""
+        return ' '.join(self.random.choices(self.vocabulary, k=count))
+
+    def _create_users(self, count):
+        password = make_password(None)
+        User.objects.bulk_create(
+            (
+                User(
+                    username='{0}-user-{1}'.format(self.prefix, index),
+                    first_name=self.words(1).title(),
+                    last_name=self.words(1).title(),
+                    password=password,
+                )
+                for index in range(count)
+            ),
+            batch_size=BATCH_SIZE,
+        )
+        created = User.objects.filter(username__startswith=self.prefix)
+        return list(created.values_list('id', flat=True))
+
+    def _create_tasks(self, count, user_ids, status_ids):
+        for start in range(0, count, BATCH_SIZE):
+            Task.objects.bulk_create(
+                Task(
+                    name='{0} {1} {2}'.format(
+                        self.prefix,
+                        index,
+                        self.words(NAME_WORDS),
+                    ),
+                    description=self.words(DESCRIPTION_WORDS),
+                    status_id=self.random.choice(status_ids),
+                    author_id=self.random.choice(user_ids),
+                    executor_id=self.random.choice(user_ids),
+                )
+                for index in range(start, min(start + BATCH_SIZE, count))
+            )
+
+
+def create_named(model, prefix, count):
+    """Create named objects like statuses and labels, return their ids."""
+    model.objects.bulk_create(
+        model(name='{0}-{1}-{2}'.format(prefix, model.__name__, index))
+        for index in range(count)
+    )
+    created = model.objects.filter(name__startswith=prefix)
+    return list(created.values_list('id', flat=True))
+
+
+def link_labels(task_ids, label_ids, generator, links):
+    """Attach `links` random labels to every task in batches."""
+    through = Task.labels.through
+    links = min(links, len(label_ids))
+    batch = []
+    for task_id in task_ids.iterator(chunk_size=BATCH_SIZE):
+        batch.extend(
+            through(task_id=task_id, label_id=label_id)
+            for label_id in generator.sample(label_ids, links)
+        )
+        if len(batch) >= BATCH_SIZE:
+            through.objects.bulk_create(batch)
+            batch = []
+    through.objects.bulk_create(batch)
+
+
+def invalidate_bulk_changes():
+    """Invalidate the cached users, statuses and labels after bulk queries."""
+    for model in (User, Status, Label):
+        bump_version(get_namespace(model))
@@ -0,0 +1,90 @@
+import dataclasses
+import json
+
+import django
+from django.db import connection
+from django.utils import timezone
+
+
+def build_report(size, repeat, route_results):
+    """
+    Return a JSON-serializable benchmark report.
+
+    `route_results` maps runner modes to lists of route results. The metadata
+    tells whether two reports are comparable: the dataset size, the number
+    of timed requests and the database vendor.
+    """
+    return {
+        'meta': {
+            'created_at': timezone.now().isoformat(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+            'size': dataclasses.asdict(size),
+            'repeat': repeat,
+        },
+        'results': {
+            mode: [route_result.as_dict() for route_result in mode_results]
+            for mode, mode_results in route_results.items()
+        },
+    }
+
+
+def save_report(report, path):
+    """Write the report to the path as indented JSON."""
+    with open(path, 'w') as report_file:
+        json.dump(report, report_file, indent=2)
+        report_file.write('\n')
+
+
+def load_report(path):
+    """Read a report written by `save_report`."""
+    with open(path) as report_file:
+        return json.load(report_file)
+
+
+def compare_reports(baseline, current, max_regression):
+    """
+    Return the descriptions of the regressions against the baseline.
+
+    A route regresses when its p95 grows by more than `max_regression`
+    percent or when it runs more queries. Routes missing from either
+    report are not compared.
+    """
+    regressions = []
+    for mode, mode_results in current['results'].items():
+        baseline_routes = {
+            route_result['name']: route_result
+            for route_result in baseline['results'].get(mode, ())
+        }
+        for route_result in mode_results:
+            previous = baseline_routes.get(route_result['name'])
+            if previous is not None:
+                regressions.extend(
+                    '{0} {1}: {2}'.format(mode, route_result['name'], problem)
+                    for problem in _get_problems(
+                        previous,
+                        route_result,
+                        max_regression,
+                    )
+                )
+    return regressions
+
+
+def _get_problems(previous, current, max_regression):
+    problems = []
+    previous_p95 = previous['timings']['p95']
+    current_p95 = current['timings']['p95']
+    if current_p95 > previous_p95 * (1 + max_regression / 100):
+        problems.append('p95 {0:.1f} ms, was {1:.1f} ms'.format(
+            current_p95,
+            previous_p95,
+        ))
+    previous_queries = previous.get('queries')
+    current_queries = current.get('queries')
+    if None not in {previous_queries, current_queries}:
+        if current_queries > previous_queries:
+            problems.append('{0} queries, was {1}'.format(
+                current_queries,
+                previous_queries,
+            ))
+    return problems
@@ -0,0 +1,98 @@
+import dataclasses
+from types import MappingProxyType
+
+from django.urls import URLResolver, get_resolver, reverse
+
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+
+# Routes that change the state of the session instead of showing a page.
+SKIPPED_ROUTES = frozenset(('logout',))
+SKIPPED_NAMESPACES = frozenset(('admin',))
+
+# Values of the non-pk route arguments.
+ROUTE_ARGUMENTS = MappingProxyType({'export_format': 'csv'})
+
+
+@dataclasses.dataclass
+class Route(object):
+    """A named URL pattern of the project and its parameter names."""
+
+    name: str
+    pattern: str
+    arguments: tuple
+
+    @property
+    def section(self):
+        """Return the resource the route belongs to, like `tasks`."""
+        segments = [
+            segment
+            for segment in self.pattern.split('/')
+            if segment and segment != 'api'
+        ]
+        return segments[0] if segments else ''
+
+
+def get_routes(url_patterns=None, prefix=''):
+    """
+    Return every named route answering GET requests.
+
+    Included URL configurations are walked recursively. The admin site,
+    routes that only accept writes and the logout route are left out.
+    """
+    if url_patterns is None:
+        url_patterns = get_resolver().url_patterns
+    routes = []
+    for url_pattern in url_patterns:
+        pattern = prefix + str(url_pattern.pattern)
+        if isinstance(url_pattern, URLResolver):
+            if url_pattern.namespace not in SKIPPED_NAMESPACES:
+                routes.extend(get_routes(url_pattern.url_patterns, pattern))
+            continue
+        if _is_benchmarked(url_pattern):
+            routes.append(Route(
+                name=url_pattern.name,
+                pattern=pattern,
+                arguments=tuple(url_pattern.pattern.converters),
+            ))
+    return routes
+
+
+def get_route_objects(dataset, user):
+    """
+    Return the primary keys routes of each section are requested with.
+
+    Users may only edit themselves and delete their own tasks, so the
+    logged in user and one of their tasks are used.
+    """
+    prefix = dataset.prefix
+    return {
+        'tasks': _first_pk(dataset.tasks().filter(author=user)),
+        'statuses': _first_pk(Status.objects.filter(name__startswith=prefix)),
+        'labels': _first_pk(Label.objects.filter(name__startswith=prefix)),
+        'users': user.pk,
+    }
+
+
+def get_route_url(route, route_objects):
+    """Return the URL of the route, or None if it has no object to show."""
+    kwargs = {}
+    for argument in route.arguments:
+        if argument == 'pk':
+            kwargs[argument] = route_objects.get(route.section)
+        else:
+            kwargs[argument] = ROUTE_ARGUMENTS.get(argument)
+        if kwargs[argument] is None:
+            return None
+    return reverse(route.name, kwargs=kwargs)
+
+
+def _first_pk(queryset):
+    return queryset.order_by('pk').values_list('pk', flat=True).first()
+
+
+def _is_benchmarked(url_pattern):
+    if url_pattern.name in SKIPPED_ROUTES:
+        return False
+    view_class = getattr(url_pattern.callback, 'view_class', None)
+    return view_class is None or getattr(view_class, 'get', None) is not None
@@ -0,0 +1,80 @@
+import dataclasses
+import tracemalloc
+
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from task_manager.benchmarks.timing import measure, summarize
+
+WARMUP_REQUESTS = 2
+
+
+@dataclasses.dataclass
+class RouteResult(object):
+    """Timings and resource usage of the requests to one route."""
+
+    name: str
+    url: str
+    status_code: int
+    timings: dict
+    queries: int = None
+    memory_kb: int = None
+
+    def as_dict(self):
+        """Return the result as a JSON-serializable dict."""
+        return dataclasses.asdict(self)
+
+
+class ClientRunner(object):
+    """
+    Request routes through the Django test client in this process.
+
+    Every request runs the full middleware stack, so the timings include
+    sessions, authentication and template rendering, but not the HTTP
+    server. Queries are counted per request and memory is the peak traced
+    Python allocation of a single request.
+    """
+
+    mode = 'client'
+
+    def __init__(self, user, repeat):
+        """Log the user in to a fresh test client."""
+        self.client = Client(HTTP_HOST='localhost')
+        self.client.force_login(user)
+        self.repeat = repeat
+
+    def run(self, name, url):
+        """Time the requests to the URL and return the result."""
+        for _ in range(WARMUP_REQUESTS):
+            self.request(url)
+        queries = CaptureQueriesContext(connection)
+        with queries:
+            response = self.request(url)
+        # Captured queries are a slice of a log the next request resets.
+        query_count = len(queries)
+        tracemalloc.start()
+        self.request(url)
+        memory_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        timings = measure(lambda: self.request(url), self.repeat)
+        return RouteResult(
+            name=name,
+            url=url,
+            status_code=response.status_code,
+            timings=summarize(timings),
+            queries=query_count,
+            memory_kb=memory_peak // 1024,
+        )
+
+    def request(self, url):
+        """Request the URL and read the whole response body."""
+        response = self.client.get(url)
+        # Streaming responses only run their queries while being read.
+        if response.streaming:
+            b''.join(response.streaming_content)
+        return response
+
+    def close(self):
+        """Release the resources of the runner."""
+        self.client.logout()
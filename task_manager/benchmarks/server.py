@@ -0,0 +1,138 @@
+import os
+import socket
+import subprocess  # noqa: S404
+import sys
+import time
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from django.conf import settings
+from django.test import Client
+
+from task_manager.benchmarks.runner import WARMUP_REQUESTS, RouteResult
+from task_manager.benchmarks.timing import measure, summarize
+
+SERVER_HOST = '127.0.0.1'
+SERVER_START_TIMEOUT = 30
+POLL_INTERVAL = 0.1
+SERVER_ARGUMENTS = ('-m', 'gunicorn', 'task_manager.wsgi', '--workers', '1')
+
+
+class GunicornRunner(object):
+    """
+    Request routes from a gunicorn worker over HTTP.
+
+    The server runs with the settings and the database of this process,
+    and the session created by logging the user in is shared through the
+    session cookie. Memory is the resident set size of the worker after
+    the requests to the route, as reported by Linux.
+    """
+
+    mode = 'gunicorn'
+
+    def __init__(self, user, repeat):
+        """Start the server and wait until it accepts connections."""
+        client = Client()
+        client.force_login(user)
+        session_cookie = client.cookies[settings.SESSION_COOKIE_NAME]
+        self.cookie = '{0}={1}'.format(
+            settings.SESSION_COOKIE_NAME,
+            session_cookie.value,
+        )
+        self.repeat = repeat
+        self.port = get_free_port()
+        self.process = subprocess.Popen(  # noqa: S603
+            get_server_command(self.port),
+            env=os.environ.copy(),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            wait_for_port(SERVER_HOST, self.port, SERVER_START_TIMEOUT)
+        except OSError:
+            self.close()
+            raise
+
+    def run(self, name, url):
+        """Time the requests to the URL and return the result."""
+        for _ in range(WARMUP_REQUESTS):
+            self.request(url)
+        status_code = self.request(url)
+        timings = measure(lambda: self.request(url), self.repeat)
+        return RouteResult(
+            name=name,
+            url=url,
+            status_code=status_code,
+            timings=summarize(timings),
+            memory_kb=get_rss_kb(get_child_pid(self.process.pid)),
+        )
+
+    def request(self, url):
+        """Request the URL from the server and return the status code."""
+        request = Request(
+            'http://{0}:{1}{2}'.format(SERVER_HOST, self.port, url),
+            headers={'Cookie': self.cookie},
+        )
+        try:
+            with urlopen(request) as response:  # noqa: S310
+                response.read()
+                return response.status
+        except HTTPError as error:
+            return error.code
+
+    def close(self):
+        """Stop the server."""
+        self.process.terminate()
+        self.process.wait()
+
+
+def get_server_command(port):
+    """Return the command running a single gunicorn worker on the port."""
+    address = '{0}:{1}'.format(SERVER_HOST, port)
+    return (sys.executable, *SERVER_ARGUMENTS, '--bind', address)
+
+
+def get_free_port():
+    """Return a local TCP port nobody listens on."""
+    with socket.socket() as probe:
+        probe.bind((SERVER_HOST, 0))
+        return probe.getsockname()[1]
+
+
+def wait_for_port(host, port, timeout):
+    """Wait until the port accepts connections, raise OSError on timeout."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with socket.create_connection((host, port), timeout=timeout):
+                return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+        time.sleep(POLL_INTERVAL)
+
+
+def get_child_pid(pid):
+    """Return the id of the first child of the process on Linux."""
+    children_path = '/proc/{0}/task/{0}/children'.format(pid)
+    try:
+        with open(children_path) as children:
+            child_pids = children.read().split()
+    except OSError:
+        return None
+    return int(child_pids[0]) if child_pids else None
+
+
+def get_rss_kb(pid):
+    """Return the resident set size of the process in KB on Linux."""
+    if pid is None:
+        return None
+    try:
+        with open('/proc/{0}/status'.format(pid)) as status:
+            lines = status.read().splitlines()
+    except OSError:
+        return None
+    for line in lines:
+        if line.startswith('VmRSS:'):
+            return int(line.split()[1])
+    return None
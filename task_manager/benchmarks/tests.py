@@ -0,0 +1,86 @@
+import json
+import os
+import tempfile
+from http import HTTPStatus
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from task_manager.benchmarks.report import compare_reports
+from task_manager.benchmarks.routes import get_routes
+from task_manager.tasks.models import Task
+
+
+class BenchmarkUrlsTest(TestCase):
+    """Smoke test of the `benchmark_urls` command on a tiny dataset."""
+
+    size_options = {
+        'tasks': 20,
+        'users': 2,
+        'statuses': 2,
+        'labels': 3,
+        'links': 1,
+        'repeat': 2,
+    }
+    max_regression = 50
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.report_path = os.path.join(self.directory.name, 'report.json')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def benchmark(self, **options):
+        stdout = StringIO()
+        call_command(
+            'benchmark_urls',
+            stdout=stdout,
+            **self.size_options,
+            **options,
+        )
+        return stdout.getvalue()
+
+    def load_report(self):
+        with open(self.report_path) as report_file:
+            return json.load(report_file)
+
+    def test_every_route_is_requested(self):
+        self.benchmark(output=self.report_path)
+        report = self.load_report()
+        route_results = {
+            route_result['name']: route_result
+            for route_result in report['results']['client']
+        }
+        route_names = {route.name for route in get_routes()}
+        self.assertEqual(set(route_results), route_names)
+        self.assertNotIn('logout', route_names)
+        self.assertNotIn('delete_labels', route_names)
+        for route_result in route_results.values():
+            self.assertEqual(route_result['status_code'], HTTPStatus.OK)
+            self.assertIsInstance(route_result['queries'], int)
+        self.assertEqual(
+            report['meta']['size']['tasks'],
+            self.size_options['tasks'],
+        )
+        self.assertFalse(Task.objects.filter(name__startswith='benchurls'))
+
+    def test_baseline_comparison(self):
+        self.benchmark(output=self.report_path)
+        report = self.load_report()
+        self.assertEqual(compare_reports(report, report, 0), [])
+        tasks_list = next(
+            route_result
+            for route_result in report['results']['client']
+            if route_result['name'] == 'tasks_list'
+        )
+        tasks_list['queries'] -= 1
+        tasks_list['timings']['p95'] /= 2
+        with open(self.report_path, 'w') as baseline_file:
+            json.dump(report, baseline_file)
+        with self.assertRaisesMessage(CommandError, 'client tasks_list'):
+            self.benchmark(
+                baseline=self.report_path,
+                max_regression=self.max_regression,
+            )
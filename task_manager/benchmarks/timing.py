@@ -0,0 +1,37 @@
+import time
+
+PERCENTILES = (('p50', 0.5), ('p95', 0.95), ('p99', 0.99))
+
+
+def percentile(samples, fraction):
+    """Return the sample below which the given fraction of samples lies."""
+    ordered = sorted(samples)
+    return ordered[round(fraction * (len(ordered) - 1))]
+
+
+def summarize(samples):
+    """Return the percentiles and the maximum of the samples."""
+    summary = {
+        name: percentile(samples, fraction)
+        for name, fraction in PERCENTILES
+    }
+    summary['max'] = max(samples)
+    return summary
+
+
+def format_summary(summary):
+    """Return the summary as a single line of milliseconds."""
+    return ', '.join(
+        '{0} {1:.1f} ms'.format(name, timing)
+        for name, timing in summary.items()
+    )
+
+
+def measure(callback, repeat):
+    """Call the callback `repeat` times and return the timings in ms."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        callback()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
@@ -0,0 +1,62 @@
+from importlib.util import find_spec
+from types import MappingProxyType
+
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+from task_manager.utils.templates import warm_up_templates
+from task_manager.utils.vendor import get_missing_assets
+
+# Modules the hashers of the PASSWORD_HASHER setting import.
+PASSWORD_HASHER_LIBRARIES = MappingProxyType({
+    'argon2': 'argon2',
+    'pbkdf2': None,
+})
+
+
+@register(Tags.templates, deploy=True)
+def check_templates_compile(app_configs, **kwargs):
+    """Fail `check --deploy` when a project template does not compile."""
+    return [
+        Error(
+            'Template {0} does not compile: {1}'.format(template_name, error),
+            id='task_manager.E001',
+        )
+        for template_name, error in warm_up_templates().items()
+    ]
+
+
+@register(Tags.staticfiles, deploy=True)
+def check_vendored_assets(app_configs, **kwargs):
+    """Fail `check --deploy` when a vendored static asset is missing."""
+    return [
+        Error(
+            'Vendored asset {0} is missing.'.format(asset.static_path),
+            hint='Restore static/vendor from git.',
+            id='task_manager.E002',
+        )
+        for asset in get_missing_assets()
+    ]
+
+
+@register(Tags.security)
+def check_password_hasher(app_configs, **kwargs):
+    """Fail when the hasher of new passwords cannot be used."""
+    if settings.PASSWORD_HASHER not in PASSWORD_HASHER_LIBRARIES:
+        return [Error(
+            'PASSWORD_HASHER must be one of: {0}.'.format(
+                ', '.join(sorted(PASSWORD_HASHER_LIBRARIES)),
+            ),
+            id='task_manager.E003',
+        )]
+    library = PASSWORD_HASHER_LIBRARIES[settings.PASSWORD_HASHER]
+    if library and find_spec(library) is None:
+        return [Error(
+            'The {0} password hasher requires the {1} module.'.format(
+                settings.PASSWORD_HASHER,
+                library,
+            ),
+            hint='Install the argon2-cffi package.',
+            id='task_manager.E004',
+        )]
+    return []
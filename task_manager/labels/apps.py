@@ -8,10 +8,9 @@ class LabelsConfig(AppConfig):
     name = 'task_manager.labels'
 
     def ready(self):
-        from django.db.models.signals import pre_delete
+        from django.db.models.signals import post_delete, post_save
 
         from task_manager.labels.models import Label
-        from task_manager.labels.signals import (
-            prevent_delete_of_related_labels,
-        )
-        pre_delete.connect(prevent_delete_of_related_labels, sender=Label)
+        from task_manager.utils.cache import invalidate_choices
+        post_save.connect(invalidate_choices, sender=Label)
+        post_delete.connect(invalidate_choices, sender=Label)
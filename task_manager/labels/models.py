@@ -1,4 +1,57 @@
-from django.db import models
+import dataclasses
+
+from django.db import models, transaction
+from django.utils.translation import gettext_lazy as _
+
+IN_USE_MESSAGE = _('The label cannot be deleted because it is in use')
+
+
+@dataclasses.dataclass
+class LabelDeletionReport(object):
+    """Names of deleted labels and task counts of the labels kept in use."""
+
+    deleted: list = dataclasses.field(default_factory=list)
+    blocked: dict = dataclasses.field(default_factory=dict)
+
+
+class LabelQuerySet(models.QuerySet):
+    """Queryset of labels that protects the labels used by tasks."""
+
+    def usage_counts(self):
+        """Return the number of tasks of every label in use, by label id."""
+        through = self.model.task_set.through
+        counts = through.objects.filter(label__in=self).order_by().values(
+            'label_id',
+        ).annotate(tasks=models.Count('task_id'))
+        return dict(counts.values_list('label_id', 'tasks'))
+
+    def delete(self):
+        """Delete the labels, unless any of them is used by a task."""
+        with transaction.atomic():
+            used_ids = self.usage_counts()
+            if used_ids:
+                raise models.ProtectedError(
+                    IN_USE_MESSAGE,
+                    set(self.filter(pk__in=used_ids)),
+                )
+            return super().delete()
+
+    def delete_unused(self):
+        """Delete the labels that no task uses and report on every label."""
+        report = LabelDeletionReport()
+        with transaction.atomic():
+            names = dict(self.order_by('pk').values_list('pk', 'name'))
+            used_ids = self.usage_counts()
+            for pk, name in names.items():
+                task_count = used_ids.get(pk)
+                if task_count:
+                    report.blocked[name] = task_count
+                else:
+                    report.deleted.append(name)
+            self.model.objects.filter(
+                pk__in=names.keys() - used_ids.keys(),
+            ).delete()
+        return report
 
 
 class Label(models.Model):
@@ -6,7 +59,17 @@ class Label(models.Model):
 
     name = models.CharField(max_length=100, unique=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = LabelQuerySet.as_manager()  # noqa: WPS110
 
     def __str__(self):
         """Return a string representation of the label."""
         return self.name
+
+    def delete(self, *args, **kwargs):
+        """Delete the label, unless it is used by a task."""
+        with transaction.atomic():
+            if type(self).objects.filter(pk=self.pk).usage_counts():
+                raise models.ProtectedError(IN_USE_MESSAGE, {self})
+            return super().delete(*args, **kwargs)
@@ -1,7 +1,11 @@
 from http import HTTPStatus
 
 from django.contrib.auth.models import User
-from django.test import Client, TestCase
+from django.contrib.messages import get_messages
+from django.db import connection
+from django.db.models import ProtectedError
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from task_manager.labels.models import Label
@@ -53,11 +57,67 @@ class LabelsListViewTest(BaseSetup):
         self.assertEqual(labels.count(), response_labels.count())
         self.assertListEqual(label_names, response_label_names)
 
+    def test_labels_list_task_counts(self):
+        Task.objects.get(pk=2).labels.add(self.used_label)
+        response = self.client.get(self.labels_list_url)
+        tasks_counts = {
+            label.name: label.tasks_count
+            for label in response.context['object_list']
+        }
+
+        self.assertEqual(
+            tasks_counts,
+            {'urgent': 2, 'important': 0, 'preferably': 0},
+        )
+        self.assertNotContains(
+            response,
+            reverse('delete_label', kwargs={'pk': self.used_label.pk}),
+        )
+
+    @override_settings(FRAGMENT_CACHE_TIMEOUT=0)
+    def test_labels_list_query_count(self):
+        with CaptureQueriesContext(connection) as captured:
+            self.client.get(self.labels_list_url)
+            queries = len(captured)
+        new_labels = Label.objects.bulk_create(
+            Label(name='label {0}'.format(index)) for index in range(5)
+        )
+        self.task.labels.add(*new_labels)
+
+        with self.assertNumQueries(queries):
+            self.client.get(self.labels_list_url)
+
     def test_labels_list_view_unauthenticated_user(self):
         self.client.logout()
         response = self.client.get(self.labels_list_url)
         self.test_unauthenticated_user(response)
 
+    def test_labels_list_etag_changes_on_login(self):
+        password = 'secret password'  # noqa: S105
+        self.author.set_password(password)
+        self.author.save()
+        self.client.force_login(self.author)
+        etag = self.client.get(self.labels_list_url)['ETag']
+        self.assertEqual(
+            self.client.get(
+                self.labels_list_url,
+                HTTP_IF_NONE_MATCH=etag,
+            ).status_code,
+            HTTPStatus.NOT_MODIFIED,
+        )
+        self.client.logout()
+        self.client.post(reverse('login'), follow=True, data={
+            'username': self.author.username,
+            'password': password,
+        })
+
+        response = self.client.get(
+            self.labels_list_url,
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertNotEqual(response['ETag'], etag)
+
 
 class CreateLabelViewTest(BaseSetup):
     """Test case class for the CreateLabelView."""
@@ -176,3 +236,80 @@ class DeleteLabelViewTest(BaseSetup):
             'Невозможно удалить метку, потому что она используется',
         )
         self.assertEqual(new_count, old_count - 1)
+
+
+class DeleteLabelsTest(BaseSetup):
+    """Test the bulk deletion of labels."""
+
+    extra_labels = 20
+
+    def test_delete_unused_reports_every_label(self):
+        self.task.labels.add(2)
+        report = Label.objects.all().delete_unused()
+
+        self.assertListEqual(report.deleted, ['preferably'])
+        self.assertDictEqual(report.blocked, {'urgent': 1, 'important': 1})
+        self.assertListEqual(
+            list(Label.objects.order_by('pk').values_list('name', flat=True)),
+            ['urgent', 'important'],
+        )
+
+    def count_delete_queries(self, labels):
+        with CaptureQueriesContext(connection) as captured:
+            report = labels.delete_unused()
+            return report, len(captured)
+
+    def test_delete_unused_query_count(self):
+        few_queries = self.count_delete_queries(
+            Label.objects.filter(pk=2),
+        )[1]
+        Label.objects.bulk_create(
+            Label(name=f'extra {index}') for index in range(self.extra_labels)
+        )
+        report, many_queries = self.count_delete_queries(Label.objects.all())
+
+        self.assertEqual(len(report.deleted), self.extra_labels + 1)
+        self.assertEqual(many_queries, few_queries)
+
+    def test_queryset_delete_protects_used_labels(self):
+        with self.assertRaises(ProtectedError):
+            Label.objects.all().delete()
+        self.assertEqual(Label.objects.count(), 3)
+
+        with self.assertRaises(ProtectedError):
+            self.used_label.delete()
+        self.assertEqual(Label.objects.count(), 3)
+
+    def test_delete_labels_view(self):
+        response = self.client.post(
+            reverse('delete_labels'),
+            {'labels': [1, 2, 'x']},
+        )
+        messages = [str(message) for message in get_messages(
+            response.wsgi_request,
+        )]
+
+        self.assertRedirects(response, self.labels_list_url)
+        self.assertListEqual(messages, [
+            'Удалены метки: important',
+            'Метка urgent используется в 1 задаче',
+        ])
+        self.assertFalse(Label.objects.filter(pk=2).exists())
+
+    def test_delete_labels_view_unauthenticated_user(self):
+        self.client.logout()
+        response = self.client.post(reverse('delete_labels'))
+        self.test_unauthenticated_user(response)
+
+
+class LabelsAutocompleteViewTest(BaseSetup):
+    """Test case class for the LabelsAutocompleteView."""
+
+    def test_labels_autocomplete_prefix(self):
+        response = self.client.get(reverse('labels_autocomplete'), {'q': 'ur'})
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            response.json(),
+            {'results': [{'id': self.used_label.id, 'text': 'urgent'}]},
+        )
@@ -2,7 +2,9 @@ from django.urls import path
 
 from task_manager.labels.views import (
     CreateLabelView,
+    DeleteLabelsView,
     DeleteLabelView,
+    LabelsAutocompleteView,
     LabelsListView,
     UpdateLabelView,
 )
@@ -10,6 +12,12 @@ from task_manager.labels.views import (
 urlpatterns = [
     path('', LabelsListView.as_view(), name='labels_list'),
     path('create/', CreateLabelView.as_view(), name='create_label'),
+    path('delete/', DeleteLabelsView.as_view(), name='delete_labels'),
+    path(
+        'autocomplete/',
+        LabelsAutocompleteView.as_view(),
+        name='labels_autocomplete',
+    ),
     path('<int:pk>/update/', UpdateLabelView.as_view(), name='update_label'),
     path('<int:pk>/delete/', DeleteLabelView.as_view(), name='delete_label'),
 ]
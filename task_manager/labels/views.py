@@ -3,13 +3,24 @@ from django.db.models.deletion import ProtectedError
 from django.shortcuts import redirect
 from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
-from django.views.generic import CreateView, DeleteView, ListView, UpdateView
+from django.utils.translation import ngettext
+from django.views.generic import (
+    CreateView,
+    DeleteView,
+    ListView,
+    UpdateView,
+    View,
+)
 
 from task_manager.labels.forms import LabelCreattionForm
 from task_manager.labels.models import Label
+from task_manager.utils.autocomplete import AutocompleteView
+from task_manager.utils.conditional import ConditionalGetMixin
 from task_manager.utils.tm_utils import (
+    ObjectPermissionMixin,
     TaskManagerFormValidMixin,
     TaskManagerLoginMixin,
+    TaskUsageMixin,
 )
 
 
@@ -20,10 +31,19 @@ class LabelsMixin(TaskManagerLoginMixin, TaskManagerFormValidMixin):
     success_url = reverse_lazy('labels_list')
 
 
-class LabelsListView(LabelsMixin, ListView):
+class LabelsListView(  # noqa: WPS215
+    LabelsMixin,
+    TaskUsageMixin,
+    ConditionalGetMixin,
+    ListView,
+):
     """A view for displaying a list of labels."""
 
     template_name = 'labels/labels_list.html'
+    task_lookups = ('labels',)
+    etag_namespaces = ('labels.label', 'tasks.task', 'tasks.task_labels')
+    # The page holds the bulk delete form.
+    etag_csrf = True
 
 
 class CreateLabelView(LabelsMixin, CreateView):
@@ -34,7 +54,7 @@ class CreateLabelView(LabelsMixin, CreateView):
     success_message = _('The label was successfully created')
 
 
-class DeleteLabelView(LabelsMixin, DeleteView):
+class DeleteLabelView(LabelsMixin, ObjectPermissionMixin, DeleteView):
     """A view for deleting a label."""
 
     template_name = 'labels/delete_label.html'
@@ -62,9 +82,43 @@ class DeleteLabelView(LabelsMixin, DeleteView):
             return redirect(self.success_url)
 
 
-class UpdateLabelView(LabelsMixin, UpdateView):
+class DeleteLabelsView(LabelsMixin, View):
+    """A view for deleting the selected labels that no task uses."""
+
+    def post(self, request, *args, **kwargs):
+        """Delete the labels and report the ones that are in use."""
+        label_ids = [
+            pk for pk in request.POST.getlist('labels') if pk.isdigit()
+        ]
+        report = Label.objects.filter(pk__in=label_ids).delete_unused()
+        if report.deleted:
+            messages.success(request, _('Deleted labels: %(names)s') % {
+                'names': ', '.join(report.deleted),
+            })
+        for name, task_count in report.blocked.items():
+            message = ngettext(
+                'The label %(name)s is used by %(count)d task',
+                'The label %(name)s is used by %(count)d tasks',
+                task_count,
+            )
+            messages.error(
+                request,
+                message % {'name': name, 'count': task_count},
+            )
+        return redirect(self.success_url)
+
+
+class UpdateLabelView(LabelsMixin, ObjectPermissionMixin, UpdateView):
     """A view for updating a label."""
 
     success_message = _('The label was successfully updated')
     template_name = 'labels/update_label.html'
     form_class = LabelCreattionForm
+
+
+class LabelsAutocompleteView(AutocompleteView):
+    """JSON endpoint for searching labels by a name prefix."""
+
+    model = Label
+    search_fields = ('name',)
+    ordering = ('name', 'id')
@@ -0,0 +1,64 @@
+import functools
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth.hashers import check_password, get_hasher
+from django.core.management.base import BaseCommand
+
+from task_manager.benchmarks.timing import format_summary, measure, summarize
+
+DEFAULT_REPEAT = 20
+DEFAULT_THREADS = 4
+PASSWORD = 'benchmark password'  # noqa: S105
+
+
+class Command(BaseCommand):
+    """Time the password checks of logins with the configured hasher."""
+
+    help = (
+        'Hash a password with the hasher of new passwords, time checking '
+        'it, then count the checks per second done by one thread and by '
+        'several threads at once, like the threads of a gunicorn worker.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=DEFAULT_REPEAT,
+            help='Number of password checks to time.',
+        )
+        parser.add_argument(
+            '--threads',
+            type=int,
+            default=DEFAULT_THREADS,
+            help='Number of threads checking passwords at once.',
+        )
+
+    def handle(self, *args, **options):
+        hasher = get_hasher()
+        encoded = hasher.encode(PASSWORD, hasher.salt())
+        check = functools.partial(check_password, PASSWORD, encoded)
+        self.stdout.write('{0}: {1}'.format(
+            hasher.algorithm,
+            format_summary(summarize(measure(check, options['repeat']))),
+        ))
+        for threads in sorted({1, options['threads']}):
+            self.stdout.write('{0} thread(s): {1:.1f} logins/s'.format(
+                threads,
+                self.get_throughput(encoded, threads, options['repeat']),
+            ))
+
+    def get_throughput(self, encoded, threads, repeat):
+        """Return the password checks per second done by the threads."""
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            checks = executor.map(
+                check_password,
+                itertools.repeat(PASSWORD, repeat),
+                itertools.repeat(encoded, repeat),
+            )
+            if not all(checks):
+                raise AssertionError('The password does not verify.')
+        return repeat / (time.perf_counter() - started)
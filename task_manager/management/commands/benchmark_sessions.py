@@ -0,0 +1,65 @@
+from collections import Counter
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task
+from task_manager.users.models import CustomUser
+
+SESSION_BACKENDS = ('db', 'cached_db', 'signed_cookies')
+SESSION_TABLE = '"django_session"'
+TASK_NAME = 'Session benchmark task'
+
+
+class Command(BaseCommand):
+    """Count the queries of the task flows with every session backend."""
+
+    help = (
+        'Create, update and delete a task through the test client with '
+        'each session backend, following the redirects that show the flash '
+        'messages, and print the queries made, those to the session table '
+        'apart. Changes are rolled back.'
+    )
+
+    def handle(self, *args, **options):
+        user = CustomUser.objects.order_by('pk').first()
+        status = Status.objects.order_by('pk').first()
+        if user is None or status is None:
+            raise CommandError('Create a user and a status to run the flows.')
+        for backend in SESSION_BACKENDS:
+            engine = 'django.contrib.sessions.backends.{0}'.format(backend)
+            with override_settings(SESSION_ENGINE=engine):
+                with transaction.atomic():
+                    queries = self.run_flows(user, status)
+                    transaction.set_rollback(True)
+            session_queries = Counter(
+                query['sql'].split()[0]
+                for query in queries
+                if SESSION_TABLE in query['sql']
+            )
+            self.stdout.write('{0}: {1} queries, session {2}'.format(
+                backend,
+                len(queries),
+                dict(session_queries) or 'none',
+            ))
+
+    def run_flows(self, user, status):
+        """Run the task flows as the user and return their queries."""
+        client = Client(HTTP_HOST='localhost')
+        client.force_login(user)
+        form_data = {'name': TASK_NAME, 'description': '', 'status': status.pk}
+        with CaptureQueriesContext(connection) as captured:
+            client.post(reverse('create_task'), form_data, follow=True)
+            task_id = Task.objects.get(name=TASK_NAME).pk
+            client.post(
+                reverse('update_task', args=[task_id]),
+                form_data,
+                follow=True,
+            )
+            client.post(reverse('delete_task', args=[task_id]), follow=True)
+            # Captured queries are a slice of a log the next request resets.
+            return captured.captured_queries
@@ -0,0 +1,61 @@
+import functools
+
+from django.core.management.base import BaseCommand, CommandError
+from django.template import Engine, loader
+from django.test import RequestFactory, override_settings
+from django.urls import reverse
+
+from task_manager.benchmarks.timing import format_summary, measure, summarize
+from task_manager.tasks.views import TasksListView
+from task_manager.users.models import CustomUser
+from task_manager.utils.templates import reset_template_cache
+
+DEFAULT_REPEAT = 50
+TEMPLATE_NAME = 'tasks/tasks_list.html'
+
+
+class Command(BaseCommand):
+    """Time the tasks list template with a cold and a warm template cache."""
+
+    help = (
+        'Render tasks/tasks_list.html for the first user, parsing every '
+        'template again before each cold render and reusing the compiled '
+        'templates for warm renders.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=DEFAULT_REPEAT,
+            help='Number of renders to time in each mode.',
+        )
+
+    def handle(self, *args, **options):
+        user = CustomUser.objects.order_by('pk').first()
+        if user is None:
+            raise CommandError('Create a user to render the tasks list.')
+        request = RequestFactory().get(reverse('tasks_list'))
+        request.user = user
+        response = TasksListView.as_view()(request)
+        # Rendered rows must not come from the fragment cache.
+        with override_settings(FRAGMENT_CACHE_TIMEOUT=0):
+            for mode, cold in (('cold', True), ('warm', False)):
+                render = functools.partial(
+                    self.render,
+                    request,
+                    response.context_data,
+                    cold=cold,
+                )
+                render()
+                timings = measure(render, options['repeat'])
+                self.stdout.write('{0}: {1}'.format(
+                    mode,
+                    format_summary(summarize(timings)),
+                ))
+
+    def render(self, request, context, cold):
+        """Render the template, parsing every template first if cold."""
+        if cold:
+            reset_template_cache(Engine.get_default())
+        return loader.get_template(TEMPLATE_NAME).render(context, request)
@@ -0,0 +1,163 @@
+import dataclasses
+from types import MappingProxyType
+
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.benchmarks.dataset import DatasetSize, SyntheticDataset
+from task_manager.benchmarks.report import (
+    build_report,
+    compare_reports,
+    load_report,
+    save_report,
+)
+from task_manager.benchmarks.routes import (
+    get_route_objects,
+    get_route_url,
+    get_routes,
+)
+from task_manager.benchmarks.runner import ClientRunner
+from task_manager.benchmarks.server import GunicornRunner
+from task_manager.benchmarks.timing import format_summary
+from task_manager.users.models import CustomUser
+
+DEFAULT_REPEAT = 20
+DEFAULT_MAX_REGRESSION = 20
+
+RUNNERS = MappingProxyType({
+    runner.mode: runner for runner in (ClientRunner, GunicornRunner)
+})
+
+
+class Command(BaseCommand):
+    """Time every page of the project on a synthetic dataset."""
+
+    help = (
+        'Create a synthetic dataset, time GET requests to every route of '
+        'the project through the test client and a gunicorn worker, and '
+        'compare the results with a saved baseline.'
+    )
+
+    def add_arguments(self, parser):
+        for field in dataclasses.fields(DatasetSize):
+            parser.add_argument(
+                '--{0}'.format(field.name),
+                type=int,
+                default=field.default,
+                help='Number of synthetic {0} (default {1}).'.format(
+                    field.name,
+                    field.default,
+                ),
+            )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=DEFAULT_REPEAT,
+            help='Number of timed requests per route.',
+        )
+        parser.add_argument(
+            '--server',
+            choices=(*RUNNERS, 'both'),
+            default='client',
+            help='Where to send the requests.',
+        )
+        parser.add_argument('--output', help='Path of the JSON report.')
+        parser.add_argument(
+            '--baseline',
+            help='Path of a JSON report to compare the results with.',
+        )
+        parser.add_argument(
+            '--max-regression',
+            type=float,
+            default=DEFAULT_MAX_REGRESSION,
+            help='Allowed p95 growth over the baseline, in percent.',
+        )
+        parser.add_argument(
+            '--prefix',
+            default='benchurls',
+            help='Name prefix of the synthetic rows.',
+        )
+
+    def handle(self, *args, **options):
+        size = DatasetSize(**{
+            field.name: options[field.name]
+            for field in dataclasses.fields(DatasetSize)
+        })
+        dataset = SyntheticDataset(prefix=options['prefix'])
+        self.stdout.write('Creating {0}...'.format(size))
+        dataset.create(size)
+        try:
+            route_results = self.run_benchmarks(dataset, options)
+        except Exception:
+            dataset.delete()
+            raise
+        dataset.delete()
+        report = build_report(size, options['repeat'], route_results)
+        if options['output']:
+            save_report(report, options['output'])
+        if options['baseline']:
+            self.check_baseline(report, options)
+
+    def run_benchmarks(self, dataset, options):
+        """Time the routes with every requested runner."""
+        user = CustomUser.objects.filter(
+            username__startswith=dataset.prefix,
+        ).order_by('pk').first()
+        if user is None:
+            raise CommandError('The dataset needs at least one user.')
+        route_objects = get_route_objects(dataset, user)
+        urls = {}
+        for route in get_routes():
+            url = get_route_url(route, route_objects)
+            if url is None:
+                self.stdout.write('Skipping {0}: no object to request.'.format(
+                    route.name,
+                ))
+            else:
+                urls[route.name] = url
+        modes = RUNNERS if options['server'] == 'both' else (options['server'],)
+        return {
+            mode: self.run_mode(mode, user, urls, options['repeat'])
+            for mode in modes
+        }
+
+    def run_mode(self, mode, user, urls, repeat):
+        """Time every URL with the runner of the mode."""
+        runner = RUNNERS[mode](user, repeat)
+        route_results = []
+        try:
+            for name, url in urls.items():
+                route_results.append(runner.run(name, url))
+                self.write_result(mode, route_results[-1])
+        except Exception:
+            runner.close()
+            raise
+        runner.close()
+        return route_results
+
+    def write_result(self, mode, route_result):
+        """Print a line with the result of a route."""
+        self.stdout.write(
+            '{0} {1} [{2}]: {3}, {4} queries, {5} KB'.format(
+                mode,
+                route_result.name,
+                route_result.status_code,
+                format_summary(route_result.timings),
+                '-' if route_result.queries is None else route_result.queries,
+                route_result.memory_kb or '-',
+            ),
+        )
+
+    def check_baseline(self, report, options):
+        """Fail if the report regresses against the baseline report."""
+        regressions = compare_reports(
+            load_report(options['baseline']),
+            report,
+            options['max_regression'],
+        )
+        if regressions:
+            raise CommandError(
+                'Regressions against the baseline:\n{0}'.format(
+                    '\n'.join(regressions),
+                ),
+            )
+        self.stdout.write(self.style.SUCCESS('No regressions.'))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from task_manager.utils.cache_stats import get_stats, reset_stats
+
+
+class Command(BaseCommand):
+    """Print the hit and miss counters of the choice cache."""
+
+    help = 'Print the hit and miss counters of the choice cache.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='Reset the counters after printing them.',
+        )
+
+    def handle(self, *args, **options):
+        stats = get_stats()
+        self.stdout.write(
+            'hits: {hits}\nmisses: {misses}\nhit ratio: {hit_ratio:.2%}'.format(
+                **stats,
+            ),
+        )
+        if options['reset']:
+            reset_stats()
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.utils.vendor import (
+    VENDOR_ASSETS,
+    VendorError,
+    download_asset,
+    get_missing_assets,
+)
+
+
+class Command(BaseCommand):
+    """Download the third-party static assets into the static files."""
+
+    help = (
+        'Download the pinned Bootstrap and jQuery builds into static/vendor, '
+        'checking their integrity hashes, to update the committed copies '
+        'after changing the pins. Assets already present are kept unless '
+        '--force is given.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Download every asset again.',
+        )
+
+    def handle(self, *args, **options):
+        assets = VENDOR_ASSETS if options['force'] else get_missing_assets()
+        for asset in assets:
+            try:
+                download_asset(asset)
+            except VendorError as error:
+                raise CommandError(str(error))
+            self.stdout.write('Downloaded {0}'.format(asset.static_path))
+        if not assets:
+            self.stdout.write('Every vendored asset is present.')
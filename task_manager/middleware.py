@@ -0,0 +1,186 @@
+import contextlib
+import json
+import logging
+import random
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import connection, connections
+
+from task_manager.utils.metrics import (
+    UNNAMED_VIEW,
+    observe_request,
+    record_db_connection,
+)
+
+logger = logging.getLogger(__name__)
+
+# Slow requests are appended to the sample file by several threads.
+slow_log_lock = threading.Lock()
+
+
+class RequestProfile(object):
+    """
+    Costs of a single request.
+
+    The profile is installed as an execute wrapper of every database
+    connection and records the SQL and duration of each query.
+    """
+
+    def __init__(self):
+        """Start the wall clock of the request."""
+        self.started = time.perf_counter()
+        self.queries = []
+        self.render_started = None
+        self.render_time = 0
+
+    def __call__(self, execute, sql, *args):
+        """Run the query and record its duration, even if it fails."""
+        started = time.perf_counter()
+        try:
+            query_result = execute(sql, *args)
+        except Exception:
+            self.record_query(sql, started)
+            raise
+        self.record_query(sql, started)
+        return query_result
+
+    def record_query(self, sql, started):
+        """Record a query that started at the given time."""
+        self.queries.append({
+            'sql': sql,
+            'duration_ms': _milliseconds(time.perf_counter() - started),
+        })
+
+    def start_render(self, response):
+        """Time the rendering of a template response."""
+        self.render_started = time.perf_counter()
+        response.add_post_render_callback(self.finish_render)
+
+    def finish_render(self, response):
+        """Record the rendering time once the template is rendered."""
+        self.render_time += time.perf_counter() - self.render_started
+
+    def get_duplicates(self):
+        """
+        Return the number of repeated queries.
+
+        Queries are compared without their parameters, so a query run for
+        each row of a list (an N+1 pattern) is reported as well.
+        """
+        counts = Counter(query['sql'] for query in self.queries)
+        return sum(count - 1 for count in counts.values())
+
+    def as_dict(self, request, response):
+        """Return the summary of the request costs up to now."""
+        total_time = time.perf_counter() - self.started
+        db_ms = sum(query['duration_ms'] for query in self.queries)
+        return {
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'total_ms': _milliseconds(total_time),
+            'db_ms': round(db_ms, 3),
+            'queries': len(self.queries),
+            'duplicate_queries': self.get_duplicates(),
+            'render_ms': _milliseconds(self.render_time),
+            'response_bytes': (
+                None if response.streaming else len(response.content)
+            ),
+        }
+
+
+class RequestProfilingMiddleware(object):
+    """
+    Measure the cost of a sample of requests.
+
+    `REQUEST_PROFILING_RATE` is the share of requests to measure, from 0
+    (disabled) to 1. A measured request gets a `Server-Timing` header and
+    a JSON log line. Requests slower than `REQUEST_PROFILING_SLOW_MS` are
+    appended with their SQL to the `REQUEST_PROFILING_SLOW_LOG` file.
+    """
+
+    def __init__(self, get_response):
+        """Read the sampling settings once per process."""
+        self.get_response = get_response
+        self.rate = settings.REQUEST_PROFILING_RATE
+        self.slow_ms = settings.REQUEST_PROFILING_SLOW_MS
+        self.slow_log = settings.REQUEST_PROFILING_SLOW_LOG
+
+    def __call__(self, request):
+        """Profile the request if it is sampled."""
+        # Unsampled requests must cost no more than this comparison.
+        if not self.rate or random.random() >= self.rate:  # noqa: S311
+            return self.get_response(request)
+        profile = RequestProfile()
+        request.profile = profile
+        with contextlib.ExitStack() as stack:
+            for db_connection in connections.all():
+                stack.enter_context(db_connection.execute_wrapper(profile))
+            response = self.get_response(request)
+        summary = profile.as_dict(request, response)
+        response.headers['Server-Timing'] = format_server_timing(summary)
+        logger.info('%s', json.dumps(summary))
+        if self.slow_log and summary['total_ms'] >= self.slow_ms:
+            self.write_slow_request(summary, profile.queries)
+        return response
+
+    def process_template_response(self, request, response):
+        """Start timing the rendering of the response."""
+        profile = getattr(request, 'profile', None)
+        if profile is not None:
+            profile.start_render(response)
+        return response
+
+    def write_slow_request(self, summary, queries):
+        """Append the request summary and its queries to the sample file."""
+        line = json.dumps({**summary, 'sql': queries})
+        with slow_log_lock:
+            with open(self.slow_log, 'a') as slow_log:
+                slow_log.write('{0}\n'.format(line))
+
+
+class MetricsMiddleware(object):
+    """Count requests in latency histograms by URL name."""
+
+    def __init__(self, get_response):
+        """Store the next handler."""
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Time the request and record it under its URL name."""
+        started = time.perf_counter()
+        # Expired connections are closed when the request starts, so an
+        # open connection here is reused thanks to CONN_MAX_AGE.
+        if connection.connection is not None:
+            record_db_connection(reused=True)
+        response = self.get_response(request)
+        resolver_match = request.resolver_match
+        view_name = UNNAMED_VIEW
+        if resolver_match is not None and resolver_match.url_name:
+            view_name = resolver_match.view_name
+        observe_request(view_name, time.perf_counter() - started)
+        return response
+
+
+def format_server_timing(summary):
+    """Return the `Server-Timing` header value of a request summary."""
+    db_description = '{0} queries, {1} duplicates'.format(
+        summary['queries'],
+        summary['duplicate_queries'],
+    )
+    metrics = (
+        ('total', summary['total_ms'], 'Total'),
+        ('db', summary['db_ms'], db_description),
+        ('render', summary['render_ms'], 'Templates'),
+    )
+    return ', '.join(
+        '{0};dur={1};desc="{2}"'.format(name, duration, description)
+        for name, duration, description in metrics
+    )
+
+
+def _milliseconds(seconds):
+    return round(seconds * 1000, 3)
@@ -13,9 +13,10 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 import os
 from pathlib import Path
 
-import dj_database_url
 from dotenv import load_dotenv
 
+from task_manager.utils.database import get_conn_max_age, get_database_config
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -59,9 +60,12 @@ INSTALLED_APPS = [
     'task_manager.statuses',
     'task_manager.tasks',
     'task_manager.labels',
+    'task_manager.api',
 ]
 
 MIDDLEWARE = [
+    'task_manager.middleware.MetricsMiddleware',
+    'task_manager.middleware.RequestProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -76,11 +80,12 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = 'task_manager.urls'
 
+# Compiled templates are kept by the cached loader for the life of the
+# process. In DEBUG the runserver autoreloader clears it on changes.
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [BASE_DIR / 'templates'],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.debug',
@@ -88,36 +93,127 @@ TEMPLATES = [
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            'loaders': [
+                (
+                    'django.template.loaders.cached.Loader',
+                    [
+                        'django.template.loaders.filesystem.Loader',
+                        'django.template.loaders.app_directories.Loader',
+                    ],
+                ),
+            ],
         },
     },
 ]
 
+# Compile every project template when a worker starts, see
+# task_manager/utils/templates.py. On by default in production.
+TEMPLATE_WARMUP = os.getenv(
+    'TEMPLATE_WARMUP',
+    str(not DEBUG),
+).lower() in {'yes', '1', 'true'}
+
 WSGI_APPLICATION = 'task_manager.wsgi.application'
 
 
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
+# The SQLite backend of task_manager.sqlite lets concurrent writes wait
+# for each other. The test database is a file rather than in memory, so
+# that tests can open several connections to it, like requests do.
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
+        'ENGINE': 'task_manager.sqlite',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'TEST': {'NAME': BASE_DIR / 'test_db.sqlite3'},
     },
 }
 
 
+# DATABASE_URL switches to another database, like PostgreSQL. Each worker
+# thread keeps its connection for DB_CONN_MAX_AGE seconds and checks it
+# before reuse unless DB_CONN_HEALTH_CHECKS is false. Django 4.2 has no
+# pool of its own: with many workers put PgBouncer in transaction mode in
+# front of the database, size its pool there and set DB_PGBOUNCER=true.
+# DB_CONNECT_TIMEOUT bounds the wait for a PostgreSQL connection.
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-CONN_MAX_AGE = 500
+CONN_MAX_AGE = get_conn_max_age(os.environ)
 
 if DATABASE_URL:
     DATABASES = {
-        "default": dj_database_url.config(
-            default=DATABASE_URL,
-            conn_max_age=CONN_MAX_AGE,
-        ),
+        "default": get_database_config(DATABASE_URL, os.environ),
+    }
+
+# Covering indexes are PostgreSQL-only, SQLite builds them without the
+# included columns.
+SILENCED_SYSTEM_CHECKS = ['models.W040']
+
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# The local-memory cache is per process: with several gunicorn workers set
+# REDIS_URL (requires the `redis` package) so that invalidation reaches all
+# of them. The metrics counters have their own cache, so that they are not
+# culled to make room for cached choices and fragments.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'task-manager',
+    },
+    'metrics': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'task-manager-metrics',
+        # Counters are bounded by the URL names, far below this.
+        'OPTIONS': {'MAX_ENTRIES': 100000},
+    },
+}
+
+REDIS_URL = os.getenv('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'task-manager',
+        },
+        'metrics': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'task-manager-metrics',
+        },
     }
 
+# Rendered list rows are cached for this many seconds, 0 disables it. The
+# default is 0 without REDIS_URL, as the version bumps that drop outdated
+# rows would not reach the other workers.
+FRAGMENT_CACHE_TIMEOUT = int(os.getenv(
+    'FRAGMENT_CACHE_TIMEOUT',
+    '300' if REDIS_URL else '0',
+))
+
+# Sessions and messages
+# https://docs.djangoproject.com/en/4.2/topics/http/sessions/
+# SESSION_BACKEND is 'db', 'cached_db' or 'signed_cookies'. Cached sessions
+# are read from the cache and written to both, which needs a cache shared
+# by the workers: with the local-memory cache a worker would keep serving
+# a session another one has ended. Signed cookies keep sessions out of the
+# server, readable but not forgeable by the browser. Expired database
+# sessions are removed by `make clearsessions` and on every deploy.
+
+SESSION_BACKEND = os.getenv(
+    'SESSION_BACKEND',
+    'cached_db' if REDIS_URL else 'db',
+)
+SESSION_ENGINE = 'django.contrib.sessions.backends.{0}'.format(
+    SESSION_BACKEND,
+)
+
+# Flash messages travel in a cookie, never in the session.
+MESSAGE_STORAGE = 'django.contrib.messages.storage.cookie.CookieStorage'
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -148,6 +244,36 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing
+# https://docs.djangoproject.com/en/4.2/topics/auth/passwords/
+# PASSWORD_HASHER picks the hasher of new passwords, 'pbkdf2' or 'argon2'
+# (requires the `argon2-cffi` package), with the costs below. Passwords
+# hashed otherwise still verify and are rehashed on the next login.
+
+PASSWORD_HASHER = os.getenv('PASSWORD_HASHER', 'pbkdf2')
+PASSWORD_PBKDF2_ITERATIONS = int(
+    os.getenv('PASSWORD_PBKDF2_ITERATIONS', '600000'),
+)
+PASSWORD_ARGON2_TIME_COST = int(os.getenv('PASSWORD_ARGON2_TIME_COST', '2'))
+PASSWORD_ARGON2_MEMORY_COST = int(
+    os.getenv('PASSWORD_ARGON2_MEMORY_COST', '102400'),
+)
+PASSWORD_ARGON2_PARALLELISM = int(
+    os.getenv('PASSWORD_ARGON2_PARALLELISM', '8'),
+)
+
+PASSWORD_HASHERS = [
+    'task_manager.users.hashers.TunedPBKDF2PasswordHasher',
+    'task_manager.users.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+if PASSWORD_HASHER == 'argon2':  # noqa: S105
+    # The first hasher hashes new passwords, the others verify old ones.
+    PASSWORD_HASHERS.insert(0, PASSWORD_HASHERS.pop(1))
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/4.2/topics/i18n/
@@ -165,6 +291,23 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 STATICFILES_DIRS = [os.path.join(BASE_DIR, "static")]
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+
+# In production collectstatic fingerprints the files and precompresses
+# them with gzip and brotli. WhiteNoise serves the fingerprinted files
+# with far-future cache headers.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': (
+            'django.contrib.staticfiles.storage.StaticFilesStorage'
+            if DEBUG
+            else 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+        ),
+    },
+}
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
@@ -179,6 +322,38 @@ TEST = {
     'FIXTURE_DIRS': ['task_manager/fixtures'],
 }
 
+# Request profiling, see task_manager/middleware.py.
+# Share of requests to measure, from 0 (disabled) to 1.
+REQUEST_PROFILING_RATE = float(os.getenv('REQUEST_PROFILING_RATE', '0'))
+REQUEST_PROFILING_SLOW_MS = float(
+    os.getenv('REQUEST_PROFILING_SLOW_MS', '500'),
+)
+# JSON lines file receiving slow requests with their SQL.
+REQUEST_PROFILING_SLOW_LOG = os.getenv('REQUEST_PROFILING_SLOW_LOG')
+
+# Metrics endpoint, see task_manager/utils/prometheus.py.
+# Task counts are aggregated at most once per this many seconds.
+METRICS_REFRESH_SECONDS = int(os.getenv('METRICS_REFRESH_SECONDS', '60'))
+# When set, scrapes must send `Authorization: Bearer <METRICS_TOKEN>`.
+METRICS_TOKEN = os.getenv('METRICS_TOKEN')
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'task_manager.middleware': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}
+
 ROLLBAR = {
     'access_token': os.getenv('ROLLBAR_TOKEN'),
     'environment': 'development' if DEBUG else 'production',
@@ -0,0 +1,16 @@
+from django.db.backends.sqlite3 import base
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    SQLite backend starting its transactions with `BEGIN IMMEDIATE`.
+
+    A deferred transaction takes the write lock on its first write. When
+    another connection holds it, SQLite cannot wait for a transaction that
+    has already read, and concurrent requests fail with "database is
+    locked". An immediate transaction takes the write lock at once, so
+    writers wait for each other up to the connection timeout.
+    """
+
+    def _start_transaction_under_autocommit(self):
+        self.cursor().execute('BEGIN IMMEDIATE')
@@ -6,3 +6,11 @@ class StatusesConfig(AppConfig):
 
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'task_manager.statuses'
+
+    def ready(self):
+        from django.db.models.signals import post_delete, post_save
+
+        from task_manager.statuses.models import Status
+        from task_manager.utils.cache import invalidate_choices
+        post_save.connect(invalidate_choices, sender=Status)
+        post_delete.connect(invalidate_choices, sender=Status)
@@ -0,0 +1,24 @@
+# Generated by Django 4.2 on 2026-10-18 19:39
+
+from django.db import migrations, models
+
+
+def copy_created_at(apps, schema_editor):
+    Status = apps.get_model('statuses', 'Status')
+    Status.objects.update(updated_at=models.F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('statuses', '0003_alter_status_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='status',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(copy_created_at, migrations.RunPython.noop),
+    ]
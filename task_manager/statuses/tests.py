@@ -1,7 +1,9 @@
 from http import HTTPStatus
 
 from django.contrib.auth.models import User
-from django.test import Client, TestCase
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from task_manager.statuses.models import Status
@@ -51,6 +53,37 @@ class StatusesListViewTestCase(BaseSetupTestCase):
         )
         self.assertListEqual(status_names, response_statuses)
 
+    def test_statuses_list_task_counts(self):
+        response = self.client.get(self.statuses_list_url)
+        tasks_counts = {
+            status.name: status.tasks_count
+            for status in response.context['object_list']
+        }
+
+        self.assertEqual(tasks_counts, {
+            'done': 1, 'rejected': 1, 'postponed': 1, 'not used': 0,
+        })
+        self.assertContains(
+            response,
+            reverse('delete_status', kwargs={'pk': 4}),
+        )
+        self.assertNotContains(
+            response,
+            reverse('delete_status', kwargs={'pk': 1}),
+        )
+
+    @override_settings(FRAGMENT_CACHE_TIMEOUT=0)
+    def test_statuses_list_query_count(self):
+        with CaptureQueriesContext(connection) as captured:
+            self.client.get(self.statuses_list_url)
+            queries = len(captured)
+        Status.objects.bulk_create(
+            Status(name='status {0}'.format(index)) for index in range(5)
+        )
+
+        with self.assertNumQueries(queries):
+            self.client.get(self.statuses_list_url)
+
 
 class CreateStatusViewTestCase(BaseSetupTestCase):
     """Test status creating view."""
@@ -165,3 +198,20 @@ class DeleteStatusViewTestCase(BaseSetupTestCase):
             'Невозможно удалить статус, потому что он используется',
         )
         self.assertTrue(Status.objects.filter(pk=self.status.pk).exists())
+
+
+class StatusesAutocompleteViewTestCase(BaseSetupTestCase):
+    """Test StatusesAutocompleteView."""
+
+    def test_statuses_autocomplete_prefix(self):
+        response = self.client.get(
+            reverse('statuses_autocomplete'),
+            {'q': 'DO'},
+        )
+        status = Status.objects.get(name='done')
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            response.json(),
+            {'results': [{'id': status.id, 'text': 'done'}]},
+        )
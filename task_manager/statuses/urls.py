@@ -5,6 +5,11 @@ from task_manager.statuses import views
 urlpatterns = [
     path('', views.StatusesListView.as_view(), name='statuses_list'),
     path('create/', views.CreateStatusView.as_view(), name='create_status'),
+    path(
+        'autocomplete/',
+        views.StatusesAutocompleteView.as_view(),
+        name='statuses_autocomplete',
+    ),
     path(
         '<int:pk>/update/',
         views.UpdateStatusView.as_view(),
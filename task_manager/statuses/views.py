@@ -7,9 +7,13 @@ from django.views.generic import CreateView, DeleteView, ListView, UpdateView
 
 from task_manager.statuses.forms import StatusCreationForm
 from task_manager.statuses.models import Status
+from task_manager.utils.autocomplete import AutocompleteView
+from task_manager.utils.conditional import ConditionalGetMixin
 from task_manager.utils.tm_utils import (
+    ObjectPermissionMixin,
     TaskManagerFormValidMixin,
     TaskManagerLoginMixin,
+    TaskUsageMixin,
 )
 
 
@@ -20,10 +24,17 @@ class StatusesMixin(TaskManagerLoginMixin, TaskManagerFormValidMixin):
     success_url = reverse_lazy('statuses_list')
 
 
-class StatusesListView(StatusesMixin, ListView):
+class StatusesListView(  # noqa: WPS215
+    StatusesMixin,
+    TaskUsageMixin,
+    ConditionalGetMixin,
+    ListView,
+):
     """View for displaying a list of statuses."""
 
     template_name = 'statuses/statuses_list.html'
+    task_lookups = ('status',)
+    etag_namespaces = ('statuses.status', 'tasks.task')
 
 
 class CreateStatusView(StatusesMixin, CreateView):
@@ -34,7 +45,7 @@ class CreateStatusView(StatusesMixin, CreateView):
     form_class = StatusCreationForm
 
 
-class UpdateStatusView(StatusesMixin, UpdateView):
+class UpdateStatusView(StatusesMixin, ObjectPermissionMixin, UpdateView):
     """View for updating an existing status."""
 
     success_message = _('The status was successfully updated')
@@ -42,7 +53,7 @@ class UpdateStatusView(StatusesMixin, UpdateView):
     form_class = StatusCreationForm
 
 
-class DeleteStatusView(StatusesMixin, DeleteView):
+class DeleteStatusView(StatusesMixin, ObjectPermissionMixin, DeleteView):
     """View for deleting a status."""
 
     template_name = 'statuses/delete_status.html'
@@ -70,3 +81,11 @@ class DeleteStatusView(StatusesMixin, DeleteView):
                 ),
             )
         return redirect(reverse_lazy('statuses_list'))
+
+
+class StatusesAutocompleteView(AutocompleteView):
+    """JSON endpoint for searching statuses by a name prefix."""
+
+    model = Status
+    search_fields = ('name',)
+    ordering = ('name', 'id')
@@ -6,3 +6,29 @@ class TasksConfig(AppConfig):
 
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'task_manager.tasks'
+
+    def ready(self):
+        from django.db.models.signals import (
+            m2m_changed,
+            post_delete,
+            post_migrate,
+            post_save,
+            pre_delete,
+            pre_save,
+        )
+
+        from task_manager.tasks import search, signals
+        from task_manager.tasks.models import Task
+        from task_manager.utils.cache import invalidate_choices
+        pre_save.connect(signals.remember_task_keys, sender=Task)
+        post_save.connect(signals.count_saved_task, sender=Task)
+        pre_delete.connect(signals.remember_deleted_task_keys, sender=Task)
+        post_delete.connect(signals.count_deleted_task, sender=Task)
+        post_save.connect(invalidate_choices, sender=Task)
+        post_delete.connect(invalidate_choices, sender=Task)
+        m2m_changed.connect(
+            signals.count_label_changes,
+            sender=Task.labels.through,
+        )
+        m2m_changed.connect(invalidate_choices, sender=Task.labels.through)
+        post_migrate.connect(search.install_sqlite_triggers, sender=self)
@@ -0,0 +1,136 @@
+import contextlib
+import functools
+import operator
+import threading
+from collections import Counter, defaultdict
+
+from django.db import models, transaction
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from task_manager.tasks.models import (
+    DIMENSION_DAY,
+    DIMENSION_EXECUTOR,
+    DIMENSION_LABEL,
+    DIMENSION_STATUS,
+    Task,
+    TaskCounter,
+)
+from task_manager.utils.cache import bump_version, get_namespace
+
+# Signal handlers do nothing while a bulk change counts its tasks itself.
+counting_state = threading.local()
+
+
+def is_counting_suspended():
+    """Return whether a bulk change in this thread counts tasks itself."""
+    return getattr(counting_state, 'suspended', False)
+
+
+def get_task_deltas(task_ids, task_model=Task):
+    """
+    Return the counter values of the given tasks.
+
+    The tasks are grouped by status, executor, label and creation day with
+    one query per dimension, so the cost grows with the number of tasks
+    given, not with the size of the table.
+    """
+    deltas = Counter()
+    for dimension, queryset, expression in _get_groups(task_ids, task_model):
+        grouped = queryset.values_list(expression).annotate(
+            tasks_count=models.Count('pk'),
+        )
+        for group_value, tasks_count in grouped:
+            group_key = '' if group_value is None else str(group_value)
+            deltas[dimension, group_key] += tasks_count
+    return deltas
+
+
+def apply_deltas(deltas, counter_model=TaskCounter):
+    """
+    Add the deltas to the counters.
+
+    Missing counters are created first, then counters changing by the
+    same amount are updated with a single query.
+    """
+    changed = {
+        counter_key: delta for counter_key, delta in deltas.items() if delta
+    }
+    if not changed:
+        return
+    counter_model.objects.bulk_create(
+        (
+            counter_model(dimension=counter_key[0], key=counter_key[1])
+            for counter_key in changed
+        ),
+        ignore_conflicts=True,
+    )
+    keys_by_delta = defaultdict(list)
+    for (dimension, key), amount in changed.items():
+        keys_by_delta[amount].append(models.Q(dimension=dimension, key=key))
+    for delta, conditions in keys_by_delta.items():
+        counter_model.objects.filter(
+            functools.reduce(operator.or_, conditions),
+        ).update(count=models.F('count') + delta)
+
+
+def count_tasks(task_ids):
+    """Count tasks created without signals, like `bulk_create` does."""
+    apply_deltas(get_task_deltas(task_ids))
+    bump_version(get_namespace(Task))
+
+
+@contextlib.contextmanager
+def count_changes(task_ids):
+    """
+    Update the counters once for a bulk change of the given tasks.
+
+    The counters of the tasks are subtracted before the change and added
+    back after it, deleted tasks are simply not added back. Signal
+    handlers are suspended in the block, so deleting tasks does not
+    update the counters once per task. The cached task lists are
+    invalidated once as well.
+
+    Yields:
+        Nothing, the tasks are changed in the block.
+    """
+    with transaction.atomic():
+        deltas = Counter()
+        deltas.subtract(get_task_deltas(task_ids))
+        counting_state.suspended = True
+        try:
+            yield
+        except Exception:
+            counting_state.suspended = False
+            raise
+        counting_state.suspended = False
+        deltas.update(get_task_deltas(task_ids))
+        apply_deltas(deltas)
+        bump_version(get_namespace(Task))
+
+
+def rebuild_counters(task_model=Task, counter_model=TaskCounter):
+    """Recompute every counter from the tasks table."""
+    with transaction.atomic():
+        counter_model.objects.all().delete()
+        apply_deltas(
+            get_task_deltas(task_model.objects.all(), task_model),
+            counter_model,
+        )
+
+
+def _get_groups(task_ids, task_model):
+    tasks = task_model.objects.filter(pk__in=task_ids).order_by()
+    links = task_model.labels.through.objects.filter(
+        task_id__in=task_ids,
+    ).order_by()
+    return (
+        (DIMENSION_STATUS, tasks, models.F('status_id')),
+        (DIMENSION_EXECUTOR, tasks, models.F('executor_id')),
+        (DIMENSION_LABEL, links, models.F('label_id')),
+        (
+            DIMENSION_DAY,
+            tasks,
+            TruncDate('created_at', tzinfo=timezone.get_default_timezone()),
+        ),
+    )
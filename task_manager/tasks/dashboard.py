@@ -0,0 +1,74 @@
+import datetime
+
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import (
+    DIMENSION_DAY,
+    DIMENSION_EXECUTOR,
+    DIMENSION_LABEL,
+    DIMENSION_STATUS,
+    DIMENSIONS,
+    TaskCounter,
+)
+from task_manager.users.models import CHOICE_FIELDS, CustomUser
+from task_manager.utils.cache import get_cached_choices
+
+DASHBOARD_DAYS = 30
+NAMED_DIMENSIONS = (
+    ('statuses', DIMENSION_STATUS, Status.objects.all()),
+    ('executors', DIMENSION_EXECUTOR, CustomUser.objects.only(*CHOICE_FIELDS)),
+    ('labels', DIMENSION_LABEL, Label.objects.all()),
+)
+
+
+def get_dashboard(days=DASHBOARD_DAYS):
+    """
+    Return the task counts shown on the index page.
+
+    Counts are read from the precomputed counters with a single query and
+    their names come from the choice cache, so the cost does not depend
+    on the number of tasks. Rows are `(name, count)` pairs, the largest
+    counts first, and days are the most recent first.
+    """
+    counts = _get_counts(days)
+    dashboard = {
+        'total': sum(counts[DIMENSION_STATUS].values()),
+        'days': sorted(
+            (
+                (datetime.date.fromisoformat(day), day_count)
+                for day, day_count in counts[DIMENSION_DAY].items()
+            ),
+            reverse=True,
+        ),
+    }
+    for name, dimension, queryset in NAMED_DIMENSIONS:
+        dashboard[name] = _get_named_rows(queryset, counts[dimension])
+    return dashboard
+
+
+def _get_counts(days):
+    first_day = timezone.localdate() - datetime.timedelta(days=days - 1)
+    counters = TaskCounter.objects.filter(count__gt=0).exclude(
+        dimension=DIMENSION_DAY,
+        key__lt=first_day.isoformat(),
+    ).values_list('dimension', 'key', 'count')
+    counts = {choice[0]: {} for choice in DIMENSIONS}
+    for dimension, key, count in counters:
+        counts[dimension][key] = count
+    return counts
+
+
+def _get_named_rows(queryset, counts):
+    choices = get_cached_choices(
+        queryset,
+        [key for key in counts if key],
+    )
+    rows = [
+        (str(choices[key]) if key else _('Not assigned'), count)
+        for key, count in counts.items()
+        if key in choices or not key
+    ]
+    return sorted(rows, key=lambda row: row[1], reverse=True)
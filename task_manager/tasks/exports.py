@@ -0,0 +1,56 @@
+from django.utils import dateformat, timezone
+from django.utils.translation import gettext_lazy as _
+
+from task_manager.tasks.views import TasksListView
+from task_manager.utils.spreadsheets import spreadsheet_response
+
+EXPORT_CHUNK_SIZE = 2000
+
+
+class TasksExportView(TasksListView):
+    """
+    Stream the filtered tasks list as a CSV or XLSX file.
+
+    Tasks are fetched with a chunked iterator and written as they arrive,
+    so the download starts at once and memory use does not depend on the
+    number of tasks.
+    """
+
+    def get(self, request, *args, **kwargs):
+        """Handle GET requests."""
+        filterset = self.get_filterset(self.get_filterset_class())
+        tasks = filterset.qs.order_by(
+            *self.get_paginate_ordering(filterset.qs),
+        ).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        # The header is translated now, as the rows are produced after the
+        # view has returned and the request language is deactivated.
+        return spreadsheet_response(
+            kwargs['export_format'],
+            self.get_export_header(),
+            map(self.get_export_row, tasks),
+            'tasks',
+        )
+
+    def get_export_header(self):
+        """Return the column titles of the tasks list."""
+        titles = (
+            'ID',
+            _('Name'),
+            _('Status'),
+            _('Author'),
+            _('Executor'),
+            _('Created date'),
+        )
+        return [str(title) for title in titles]
+
+    def get_export_row(self, task):
+        """Return the cells of a task as shown by the tasks list."""
+        created_at = timezone.localtime(task.created_at)
+        return [
+            task.id,
+            task.name,
+            str(task.status),
+            str(task.author),
+            str(task.executor or ''),
+            dateformat.format(created_at, 'd.m.Y H:i'),
+        ]
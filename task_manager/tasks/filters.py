@@ -1,37 +1,70 @@
 import django_filters
 from django import forms
+from django.utils.translation import gettext_lazy as _
 
 from task_manager.labels.models import Label
 from task_manager.statuses.models import Status
 from task_manager.tasks.models import Task
-from task_manager.users.models import CustomUser
+from task_manager.tasks.search import search_tasks
+from task_manager.users.models import CHOICE_FIELDS, CustomUser
+from task_manager.utils.autocomplete import AutocompleteSelect
+from task_manager.utils.fields import CachedFilterModelChoiceField
+
+
+class CachedModelChoiceFilter(django_filters.ModelChoiceFilter):
+    """Model choice filter validating its value through the choice cache."""
+
+    field_class = CachedFilterModelChoiceField
 
 
 class TasksFilter(django_filters.FilterSet):
     """Filter for tasks."""
 
-    status = django_filters.ModelChoiceFilter(
+    status = CachedModelChoiceFilter(
         label='',
         queryset=Status.objects.all(),
         to_field_name='id',
-        widget=forms.Select(attrs={'class': 'form-control'}),
+        widget=AutocompleteSelect(
+            'statuses_autocomplete',
+            attrs={'class': 'form-control'},
+        ),
     )
-    executor = django_filters.ModelChoiceFilter(
+    executor = CachedModelChoiceFilter(
         label='',
-        queryset=CustomUser.objects.all(),
+        queryset=CustomUser.objects.only(*CHOICE_FIELDS),
         to_field_name='id',
-        widget=forms.Select(attrs={'class': 'form-control'}),
+        widget=AutocompleteSelect(
+            'users_autocomplete',
+            attrs={'class': 'form-control'},
+        ),
     )
-    labels = django_filters.ModelChoiceFilter(
+    labels = CachedModelChoiceFilter(
         label='',
         queryset=Label.objects.all(),
         to_field_name='id',
-        widget=forms.Select(attrs={'class': 'form-control'}),
+        widget=AutocompleteSelect(
+            'labels_autocomplete',
+            attrs={'class': 'form-control'},
+        ),
+    )
+
+    q = django_filters.CharFilter(  # noqa: WPS111
+        label='',
+        method='filter_search',
+        widget=forms.TextInput(attrs={
+            'class': 'form-control',
+            'placeholder': _('Search'),
+            'type': 'search',
+        }),
     )
 
     class Meta:
         model = Task
-        fields = ['status', 'executor', 'labels']
+        fields = ['q', 'status', 'executor', 'labels']
+
+    def filter_search(self, queryset, name, query):
+        """Filter tasks by the words of their name and description."""
+        return search_tasks(queryset, query)
 
     @property
     def qs(self):
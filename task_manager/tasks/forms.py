@@ -4,8 +4,17 @@ from django.utils.translation import gettext_lazy as _
 
 from task_manager.labels.models import Label
 from task_manager.statuses.models import Status
+from task_manager.tasks.labels import set_task_labels
 from task_manager.tasks.models import Task
-from task_manager.users.models import CustomUser
+from task_manager.users.models import CHOICE_FIELDS, CustomUser
+from task_manager.utils.autocomplete import (
+    AutocompleteSelect,
+    AutocompleteSelectMultiple,
+)
+from task_manager.utils.fields import (
+    CachedModelChoiceField,
+    CachedModelMultipleChoiceField,
+)
 
 
 class TaskCreationForm(forms.ModelForm):
@@ -25,27 +34,37 @@ class TaskCreationForm(forms.ModelForm):
             'cols': 40,
         }),
     )
-    status = forms.ModelChoiceField(
+    status = CachedModelChoiceField(
         label=_('Status'),
         queryset=Status.objects.all(),
+        widget=AutocompleteSelect('statuses_autocomplete'),
     )
-    executor = forms.ModelChoiceField(
+    executor = CachedModelChoiceField(
         label=_('Executor'),
-        queryset=CustomUser.objects.all(),
+        queryset=CustomUser.objects.only(*CHOICE_FIELDS),
         required=False,
+        widget=AutocompleteSelect('users_autocomplete'),
     )
-    labels = forms.ModelMultipleChoiceField(
+    labels = CachedModelMultipleChoiceField(
         label=_('Labels'),
         required=False,
         queryset=Label.objects.all(),
+        widget=AutocompleteSelectMultiple('labels_autocomplete'),
     )
 
-    def clean_name(self):
-        """Check if label with the same name already exists."""
-        name = self.cleaned_data['name']
-        if Task.objects.filter(name=name).exists():
-            raise ValidationError(_('Task with this name already exists.'))
-        return name
+    def validate_unique(self):
+        """Check unique fields but the name, see `UniqueNameMixin`."""
+        exclusions = self._get_validation_exclusions()
+        exclusions.add('name')
+        try:
+            self.instance.validate_unique(exclude=exclusions)
+        except ValidationError as error:
+            self._update_errors(error)
+
+    def _save_m2m(self):
+        # Labels are the only many-to-many field, only their changes are
+        # written.
+        set_task_labels(self.instance, self.cleaned_data['labels'])
 
     class Meta:
         model = Task
@@ -0,0 +1,80 @@
+import functools
+import operator
+
+from django.db import models, router
+from django.db.models.signals import m2m_changed
+
+from task_manager.labels.models import Label
+from task_manager.tasks.models import Task
+
+TaskLabel = Task.labels.through
+
+
+def get_label_changes(task, labels):
+    """
+    Return the ids of the labels to add to the task and to remove from it.
+
+    The current labels are read with `task.labels.all()`, so prefetching
+    them spares the query.
+    """
+    current_ids = {label.pk for label in task.labels.all()}
+    label_ids = {label.pk for label in labels}
+    return label_ids - current_ids, current_ids - label_ids
+
+
+def save_label_changes(changes):
+    """
+    Write the label changes of many tasks, the links left alone untouched.
+
+    `changes` maps task ids to the `(added, removed)` label ids returned
+    by `get_label_changes`. Every removed link goes in one delete and
+    every added link in one insert, without sending `m2m_changed`.
+    """
+    removed_links = [
+        models.Q(task_id=task_id, label_id__in=removed)
+        for task_id, (_, removed) in changes.items()
+        if removed
+    ]
+    if removed_links:
+        TaskLabel.objects.filter(
+            functools.reduce(operator.or_, removed_links),
+        ).delete()
+    TaskLabel.objects.bulk_create(
+        TaskLabel(task_id=task_id, label_id=label_id)
+        for task_id, (added, _) in changes.items()
+        for label_id in added
+    )
+
+
+def set_task_labels(task, labels):
+    """
+    Set the labels of a saved task like `task.labels.set(labels)`.
+
+    Only the links that changed are written, with at most one delete and
+    one insert, and `m2m_changed` is sent for them as the related manager
+    would.
+    """
+    added, removed = get_label_changes(task, labels)
+    if removed:
+        _send_changed(task, 'pre_remove', removed)
+        save_label_changes({task.pk: (set(), removed)})
+        _send_changed(task, 'post_remove', removed)
+    if added:
+        _send_changed(task, 'pre_add', added)
+        save_label_changes({task.pk: (added, set())})
+        _send_changed(task, 'post_add', added)
+    # The related manager forgets its prefetched labels the same way.
+    prefetched = getattr(task, '_prefetched_objects_cache', {})
+    prefetched.pop('labels', None)
+
+
+def _send_changed(task, action, label_ids):
+    m2m_changed.send(
+        sender=TaskLabel,
+        instance=task,
+        action=action,
+        reverse=False,
+        model=Label,
+        pk_set=label_ids,
+        using=router.db_for_write(TaskLabel, instance=task),
+    )
@@ -0,0 +1,74 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.benchmarks.dataset import DatasetSize, SyntheticDataset
+from task_manager.benchmarks.timing import format_summary, measure, summarize
+from task_manager.tasks.search import SEARCH_ORDERING, search_tasks
+from task_manager.tasks.views import TasksListView
+
+DEFAULT_TASKS = 10000
+DEFAULT_REPEAT = 50
+
+
+class Command(BaseCommand):
+    """Time the first page of task search results on synthetic data."""
+
+    help = (
+        'Create synthetic tasks, time the first page of full-text search '
+        'results and remove the tasks again.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tasks',
+            type=int,
+            default=DEFAULT_TASKS,
+            help='Number of synthetic tasks to create.',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=DEFAULT_REPEAT,
+            help='Number of searches to time.',
+        )
+        parser.add_argument(
+            '--max-ms',
+            type=float,
+            help='Exit with an error if p95 exceeds this many milliseconds.',
+        )
+        parser.add_argument(
+            '--prefix',
+            default='benchsearch',
+            help='Name prefix of the synthetic rows.',
+        )
+
+    def handle(self, *args, **options):
+        dataset = SyntheticDataset(prefix=options['prefix'])
+        self.stdout.write('Creating {0} tasks...'.format(options['tasks']))
+        dataset.create(DatasetSize(tasks=options['tasks']))
+        try:
+            timings = measure(
+                lambda: self.search(dataset),
+                options['repeat'],
+            )
+        except Exception:
+            dataset.delete()
+            raise
+        dataset.delete()
+        summary = summarize(timings)
+        self.stdout.write('First search page: {0}'.format(
+            format_summary(summary),
+        ))
+        max_ms = options['max_ms']
+        if max_ms is not None and summary['p95'] > max_ms:
+            raise CommandError(
+                'p95 {0:.1f} ms exceeds {1} ms.'.format(summary['p95'], max_ms),
+            )
+
+    def search(self, dataset):
+        """Load the first tasks list page of a search for random words."""
+        queryset = search_tasks(
+            TasksListView().get_queryset(),
+            dataset.words(2),
+        )
+        ordered = queryset.order_by(*SEARCH_ORDERING)
+        return list(ordered[:TasksListView.paginate_by])
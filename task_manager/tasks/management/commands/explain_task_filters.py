@@ -0,0 +1,101 @@
+import itertools
+import re
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.filters import TasksFilter
+from task_manager.tasks.views import TasksListView
+from task_manager.users.models import CustomUser
+
+FILTER_NAMES = ('status', 'executor', 'labels', 'self_tasks')
+
+# Full scans of the tasks table, as reported by PostgreSQL and SQLite.
+FULL_SCAN_PATTERN = re.compile(
+    r'Seq Scan on tasks_task\b|SCAN (TABLE )?tasks_task\b(?! USING)',
+)
+
+
+class Command(BaseCommand):
+    """Print query plans of the tasks list for every filter combination."""
+
+    help = (
+        'Print EXPLAIN output of the first tasks list page for every '
+        'combination of the TasksFilter parameters.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--status', type=int, help='Status id to use.')
+        parser.add_argument('--executor', type=int, help='User id to use.')
+        parser.add_argument('--label', type=int, help='Label id to use.')
+        parser.add_argument(
+            '--user',
+            type=int,
+            help='Id of the user requesting self tasks.',
+        )
+        parser.add_argument(
+            '--analyze',
+            action='store_true',
+            help='Run the queries and show actual timings (PostgreSQL).',
+        )
+        parser.add_argument(
+            '--fail-on-full-scan',
+            action='store_true',
+            help='Exit with an error if any plan scans the whole table.',
+        )
+
+    def handle(self, *args, **options):
+        filter_values = self.get_filter_values(options)
+        user = CustomUser.objects.get(pk=filter_values.pop('user'))
+        explain_options = {'analyze': True} if options['analyze'] else {}
+        full_scans = []
+        for size in range(len(FILTER_NAMES) + 1):
+            for names in itertools.combinations(FILTER_NAMES, size):
+                query = {name: filter_values[name] for name in names}
+                plan = self.get_queryset(query, user).explain(
+                    **explain_options,
+                )
+                title = ', '.join(names) or 'no filters'
+                self.stdout.write(self.style.MIGRATE_HEADING(title))
+                self.stdout.write(plan)
+                self.stdout.write('')
+                if FULL_SCAN_PATTERN.search(plan):
+                    full_scans.append(title)
+        if options['fail_on_full_scan'] and full_scans:
+            raise CommandError(
+                'Full table scans in: {0}'.format('; '.join(full_scans)),
+            )
+
+    def get_filter_values(self, options):
+        """Return filter values from the options or the first rows."""
+        first_user = CustomUser.objects.order_by('pk').first()
+        defaults = {
+            'status': Status.objects.order_by('pk').first(),
+            'executor': first_user,
+            'labels': Label.objects.order_by('pk').first(),
+            'user': first_user,
+        }
+        option_names = {'labels': 'label'}
+        filter_values = {'self_tasks': 'on'}
+        for name, default in defaults.items():
+            option_value = options[option_names.get(name, name)]
+            if option_value is None and default is None:
+                raise CommandError(
+                    'No {0} found, pass its id explicitly.'.format(name),
+                )
+            filter_values[name] = option_value or default.pk
+        return filter_values
+
+    def get_queryset(self, query, user):
+        """Return the first page query the tasks list runs for the filter."""
+        request = RequestFactory().get('/tasks/', query)
+        request.user = user
+        filterset = TasksFilter(
+            request.GET,
+            queryset=TasksListView().get_queryset(),
+            request=request,
+        )
+        ordered = filterset.qs.order_by(*TasksListView.paginate_ordering)
+        return ordered[:TasksListView.paginate_by]
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand
+
+from task_manager.tasks.models import Task
+from task_manager.tasks.transfer import (
+    DEFAULT_CHUNK_SIZE,
+    FORMATS,
+    export_rows,
+    get_format,
+    write_rows,
+)
+
+
+class Command(BaseCommand):
+    """Stream all tasks to a CSV or JSON lines file."""
+
+    help = (
+        'Export tasks as CSV or JSON lines, with statuses, users and labels '
+        'referred to by name. Tasks are read in chunks, so memory use does '
+        'not depend on the number of tasks.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path',
+            nargs='?',
+            default='-',
+            help='Output file, "-" (the default) writes to stdout.',
+        )
+        parser.add_argument(
+            '--format',
+            choices=FORMATS,
+            help='Output format, guessed from the file extension by default.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help='Number of tasks fetched per query.',
+        )
+
+    def handle(self, *args, **options):
+        path = options['path']
+        file_format = get_format(path, options['format'])
+        rows = export_rows(Task.objects.all(), options['chunk_size'])
+        if path == '-':
+            write_rows(rows, self.stdout, file_format)
+            return
+        with open(path, 'w', newline='', encoding='utf-8') as stream:
+            write_rows(rows, stream, file_format)
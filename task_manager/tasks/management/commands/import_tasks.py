@@ -0,0 +1,73 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.tasks.transfer import (
+    DEFAULT_CHUNK_SIZE,
+    FORMATS,
+    TaskImporter,
+    get_format,
+    read_rows,
+)
+
+
+class Command(BaseCommand):
+    """Create tasks from a CSV or JSON lines file."""
+
+    help = (
+        'Import tasks exported by export_tasks. Rows are read and inserted '
+        'in chunks, and the whole import runs in a single transaction.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path',
+            help='Input file, "-" reads from stdin.',
+        )
+        parser.add_argument(
+            '--format',
+            choices=FORMATS,
+            help='Input format, guessed from the file extension by default.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help='Number of tasks inserted per query.',
+        )
+        parser.add_argument(
+            '--author',
+            help='Username of the author of rows without one.',
+        )
+        parser.add_argument(
+            '--skip-existing',
+            action='store_true',
+            help='Skip tasks whose name is taken instead of failing.',
+        )
+
+    def handle(self, *args, **options):
+        path = options['path']
+        importer = TaskImporter(
+            default_author=options['author'],
+            chunk_size=options['chunk_size'],
+            skip_existing=options['skip_existing'],
+        )
+        file_format = get_format(path, options['format'])
+        if path == '-':
+            self.run_import(importer, sys.stdin, file_format)
+        else:
+            with open(path, newline='', encoding='utf-8') as stream:
+                self.run_import(importer, stream, file_format)
+        self.stdout.write(self.style.SUCCESS(
+            'Imported {0} tasks, skipped {1}.'.format(
+                importer.created,
+                importer.skipped,
+            ),
+        ))
+
+    def run_import(self, importer, stream, file_format):
+        """Import the rows of the stream, reporting invalid rows."""
+        try:
+            importer.run(read_rows(stream, file_format))
+        except ValueError as error:
+            raise CommandError(str(error))
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from task_manager.tasks.counters import rebuild_counters
+from task_manager.tasks.models import TaskCounter
+
+
+class Command(BaseCommand):
+    """Recompute the task counters of the dashboard."""
+
+    help = (
+        'Recompute the task counters from the tasks table, after changing '
+        'tasks with queryset updates or raw SQL.'
+    )
+
+    def handle(self, *args, **options):
+        rebuild_counters()
+        self.stdout.write('Rebuilt {0} counters.'.format(
+            TaskCounter.objects.count(),
+        ))
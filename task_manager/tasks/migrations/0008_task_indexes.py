@@ -0,0 +1,39 @@
+# Generated by Django 4.2 on 2026-10-18 18:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0007_alter_task_executor'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['created_at', 'id'], include=('name', 'status', 'author', 'executor'), name='task_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['status', 'created_at', 'id'], name='task_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['executor', 'created_at', 'id'], name='task_executor_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['author', 'created_at', 'id'], name='task_author_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['status', 'executor', 'created_at', 'id'], name='task_status_executor_idx'),
+        ),
+        # The implicit unique (task_id, label_id) index only serves the
+        # task -> label direction, the labels filter goes label -> task.
+        migrations.RunSQL(
+            sql='CREATE INDEX tasks_task_labels_label_task_idx ON tasks_task_labels (label_id, task_id)',
+            reverse_sql='DROP INDEX tasks_task_labels_label_task_idx',
+        ),
+    ]
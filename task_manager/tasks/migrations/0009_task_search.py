@@ -0,0 +1,108 @@
+# Generated by Django 4.2 on 2026-10-18 18:38
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+POSTGRESQL_INSTALL = (
+    """
+    CREATE FUNCTION tasks_task_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('simple', coalesce(NEW.name, '')), 'A')
+            || setweight(
+                to_tsvector('simple', coalesce(NEW.description, '')), 'B'
+            );
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER tasks_task_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF name, description ON tasks_task
+    FOR EACH ROW EXECUTE PROCEDURE tasks_task_search_vector_update()
+    """,
+    # Fill the vectors of existing tasks through the trigger.
+    'UPDATE tasks_task SET name = name',
+    """
+    CREATE INDEX tasks_task_search_vector_idx
+    ON tasks_task USING gin (search_vector)
+    """,
+)
+
+POSTGRESQL_UNINSTALL = (
+    'DROP INDEX IF EXISTS tasks_task_search_vector_idx',
+    'DROP TRIGGER IF EXISTS tasks_task_search_vector_trigger ON tasks_task',
+    'DROP FUNCTION IF EXISTS tasks_task_search_vector_update()',
+)
+
+SQLITE_INSTALL = (
+    """
+    CREATE VIRTUAL TABLE tasks_task_fts USING fts5(
+        name, description, content='tasks_task', content_rowid='id'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_task_fts_insert
+    AFTER INSERT ON tasks_task BEGIN
+        INSERT INTO tasks_task_fts (rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_task_fts_delete
+    AFTER DELETE ON tasks_task BEGIN
+        INSERT INTO tasks_task_fts (tasks_task_fts, rowid, name, description)
+        VALUES ('delete', old.id, old.name, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_task_fts_update
+    AFTER UPDATE OF name, description ON tasks_task BEGIN
+        INSERT INTO tasks_task_fts (tasks_task_fts, rowid, name, description)
+        VALUES ('delete', old.id, old.name, old.description);
+        INSERT INTO tasks_task_fts (rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    """,
+    "INSERT INTO tasks_task_fts (tasks_task_fts) VALUES ('rebuild')",
+)
+
+SQLITE_UNINSTALL = (
+    'DROP TRIGGER IF EXISTS tasks_task_fts_insert',
+    'DROP TRIGGER IF EXISTS tasks_task_fts_delete',
+    'DROP TRIGGER IF EXISTS tasks_task_fts_update',
+    'DROP TABLE IF EXISTS tasks_task_fts',
+)
+
+
+def execute(schema_editor, postgresql_statements, sqlite_statements):
+    statements = {
+        'postgresql': postgresql_statements,
+        'sqlite': sqlite_statements,
+    }.get(schema_editor.connection.vendor, ())
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def install_search(apps, schema_editor):
+    execute(schema_editor, POSTGRESQL_INSTALL, SQLITE_INSTALL)
+
+
+def uninstall_search(apps, schema_editor):
+    execute(schema_editor, POSTGRESQL_UNINSTALL, SQLITE_UNINSTALL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0008_task_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(install_search, uninstall_search),
+    ]
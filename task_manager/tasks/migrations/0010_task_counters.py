@@ -0,0 +1,57 @@
+# Generated by Django 4.2 on 2026-10-18 19:14
+
+from django.db import migrations, models
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+
+def count_existing_tasks(apps, schema_editor):
+    Task = apps.get_model('tasks', 'Task')
+    TaskCounter = apps.get_model('tasks', 'TaskCounter')
+    tasks = Task.objects.order_by()
+    links = Task.labels.through.objects.order_by()
+    groups = (
+        ('status', tasks, models.F('status_id')),
+        ('executor', tasks, models.F('executor_id')),
+        ('label', links, models.F('label_id')),
+        (
+            'day',
+            tasks,
+            TruncDate('created_at', tzinfo=timezone.get_default_timezone()),
+        ),
+    )
+    TaskCounter.objects.bulk_create(
+        TaskCounter(
+            dimension=dimension,
+            key='' if group_value is None else str(group_value),
+            count=tasks_count,
+        )
+        for dimension, queryset, expression in groups
+        for group_value, tasks_count in queryset.values_list(
+            expression,
+        ).annotate(tasks_count=models.Count('pk'))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0009_task_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimension', models.CharField(choices=[('status', 'status'), ('executor', 'executor'), ('label', 'label'), ('day', 'day')], max_length=16)),
+                ('key', models.CharField(blank=True, max_length=32)),
+                ('count', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='taskcounter',
+            constraint=models.UniqueConstraint(fields=('dimension', 'key'), name='task_counter_key_unique'),
+        ),
+        migrations.RunPython(count_existing_tasks, migrations.RunPython.noop),
+    ]
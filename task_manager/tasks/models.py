@@ -1,3 +1,4 @@
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
 from task_manager.labels.models import Label
@@ -6,6 +7,19 @@ from task_manager.users.models import CustomUser
 
 max_length = 150
 
+DIMENSION_STATUS = 'status'
+DIMENSION_EXECUTOR = 'executor'
+DIMENSION_LABEL = 'label'
+DIMENSION_DAY = 'day'
+DIMENSIONS = (
+    (DIMENSION_STATUS, DIMENSION_STATUS),
+    (DIMENSION_EXECUTOR, DIMENSION_EXECUTOR),
+    (DIMENSION_LABEL, DIMENSION_LABEL),
+    (DIMENSION_DAY, DIMENSION_DAY),
+)
+dimension_max_length = 16
+counter_key_max_length = 32
+
 
 class Task(models.Model):
     """Model representing a task."""
@@ -27,7 +41,67 @@ class Task(models.Model):
     )
     labels = models.ManyToManyField(Label)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Bulk updates have to set it themselves, see api/bulk.py.
+    updated_at = models.DateTimeField(auto_now=True)
+    # Maintained by a database trigger on PostgreSQL, see tasks/search.py.
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['created_at', 'id'],
+                name='task_created_idx',
+                include=['name', 'status', 'author', 'executor'],
+            ),
+            models.Index(
+                fields=['status', 'created_at', 'id'],
+                name='task_status_created_idx',
+            ),
+            models.Index(
+                fields=['executor', 'created_at', 'id'],
+                name='task_executor_created_idx',
+            ),
+            models.Index(
+                fields=['author', 'created_at', 'id'],
+                name='task_author_created_idx',
+            ),
+            models.Index(
+                fields=['status', 'executor', 'created_at', 'id'],
+                name='task_status_executor_idx',
+            ),
+        ]
 
     def __str__(self):
         """Return a string representation of the task."""
         return self.name
+
+
+class TaskCounter(models.Model):
+    """
+    Number of tasks sharing a status, an executor, a label or a day.
+
+    Counters are maintained incrementally by `tasks/signals.py` and by the
+    bulk code paths through `tasks/counters.py`, so that the dashboard
+    reads them instead of grouping the whole tasks table.
+    """
+
+    dimension = models.CharField(
+        max_length=dimension_max_length,
+        choices=DIMENSIONS,
+    )
+    # Primary key of the status, executor or label, or an ISO date. Tasks
+    # without an executor are counted under an empty key.
+    key = models.CharField(max_length=counter_key_max_length, blank=True)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['dimension', 'key'],
+                name='task_counter_key_unique',
+            ),
+        ]
+
+    def __str__(self):
+        """Return a string representation of the counter."""
+        return '{0} {1}: {2}'.format(self.dimension, self.key, self.count)
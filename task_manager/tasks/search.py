@@ -0,0 +1,102 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connections, models
+from django.db.models.expressions import RawSQL
+
+SEARCH_CONFIG = 'simple'
+SEARCH_ORDERING = ('-search_rank', 'id')
+SQLITE_TABLE = 'tasks_task_fts'
+
+# The full-text index is created by the 0009_task_search migration. SQLite
+# rebuilds tasks_task to alter it, which drops the triggers keeping the
+# index up to date, so they are installed again after every migration.
+SQLITE_INSERT_TRIGGER = """
+    CREATE TRIGGER IF NOT EXISTS tasks_task_fts_insert
+    AFTER INSERT ON tasks_task BEGIN
+        INSERT INTO tasks_task_fts (rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+"""
+
+SQLITE_DELETE_TRIGGER = """
+    CREATE TRIGGER IF NOT EXISTS tasks_task_fts_delete
+    AFTER DELETE ON tasks_task BEGIN
+        INSERT INTO tasks_task_fts (tasks_task_fts, rowid, name, description)
+        VALUES ('delete', old.id, old.name, old.description);
+    END
+"""
+
+SQLITE_UPDATE_TRIGGER = """
+    CREATE TRIGGER IF NOT EXISTS tasks_task_fts_update
+    AFTER UPDATE OF name, description ON tasks_task BEGIN
+        INSERT INTO tasks_task_fts (tasks_task_fts, rowid, name, description)
+        VALUES ('delete', old.id, old.name, old.description);
+        INSERT INTO tasks_task_fts (rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+"""
+
+SQLITE_TRIGGERS = (
+    SQLITE_INSERT_TRIGGER,
+    SQLITE_DELETE_TRIGGER,
+    SQLITE_UPDATE_TRIGGER,
+)
+
+# Name matches weigh ten times more than description matches.
+SQLITE_RANK = """
+    SELECT -bm25(tasks_task_fts, 10.0, 1.0) FROM tasks_task_fts
+    WHERE tasks_task_fts MATCH %s AND tasks_task_fts.rowid = tasks_task.id
+"""
+
+SQLITE_MATCHES = (
+    'SELECT rowid FROM tasks_task_fts WHERE tasks_task_fts MATCH %s'
+)
+
+
+def install_sqlite_triggers(using, **kwargs):
+    """
+    Recreate the SQLite triggers that keep the full-text index up to date.
+
+    Connected to `post_migrate`, as SQLite migrations altering `tasks_task`
+    drop its triggers. Nothing is done on other databases or before the
+    index exists.
+    """
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        return
+    if SQLITE_TABLE not in connection.introspection.table_names():
+        return
+    with connection.cursor() as cursor:
+        for trigger in SQLITE_TRIGGERS:
+            cursor.execute(trigger)
+
+
+def search_tasks(queryset, query):
+    """
+    Filter tasks matching the words of the query.
+
+    Matching tasks are annotated with `search_rank`, higher is better.
+    PostgreSQL matches the trigger-maintained `search_vector` column through
+    its GIN index, SQLite falls back to the FTS5 table `tasks_task_fts`.
+    """
+    if connections[queryset.db].vendor == 'postgresql':
+        search_query = SearchQuery(
+            query,
+            config=SEARCH_CONFIG,
+            search_type='websearch',
+        )
+        return queryset.annotate(
+            search_rank=SearchRank(models.F('search_vector'), search_query),
+        ).filter(search_vector=search_query)
+    words = re.findall(r'\w+', query)
+    if not words:
+        return queryset.none()
+    # Every word is quoted, so user input never reaches the FTS5 syntax.
+    match = ' '.join('"{0}"*'.format(word) for word in words)
+    # The match string is always passed as a query parameter.
+    match_params = (match,)
+    float_field = models.FloatField()
+    matches = RawSQL(SQLITE_MATCHES, match_params)  # noqa: S611
+    rank = RawSQL(SQLITE_RANK, match_params, float_field)  # noqa: S611
+    return queryset.filter(id__in=matches).annotate(search_rank=rank)
@@ -0,0 +1,114 @@
+from collections import Counter
+
+from django.utils import timezone
+
+from task_manager.tasks.counters import apply_deltas, is_counting_suspended
+from task_manager.tasks.models import (
+    DIMENSION_DAY,
+    DIMENSION_EXECUTOR,
+    DIMENSION_LABEL,
+    DIMENSION_STATUS,
+    Task,
+)
+
+LABEL_REMOVALS = frozenset(('pre_remove', 'pre_clear'))
+
+
+def get_task_keys(status_id, executor_id, created_at):
+    """Return the counter keys of a task, except its labels."""
+    created_on = timezone.localdate(
+        created_at,
+        timezone.get_default_timezone(),
+    )
+    return [
+        (DIMENSION_STATUS, str(status_id)),
+        (DIMENSION_EXECUTOR, str(executor_id or '')),
+        (DIMENSION_DAY, created_on.isoformat()),
+    ]
+
+
+def remember_task_keys(sender, instance, **kwargs):
+    """Store the counter keys of the saved task as it is in the database."""
+    instance.counted_keys = []
+    if instance.pk is None or is_counting_suspended():
+        return
+    stored = Task.objects.filter(pk=instance.pk).values_list(
+        'status_id',
+        'executor_id',
+        'created_at',
+    ).first()
+    if stored is not None:
+        instance.counted_keys = get_task_keys(*stored)
+
+
+def count_saved_task(sender, instance, **kwargs):
+    """Move the saved task between counters."""
+    if is_counting_suspended():
+        return
+    deltas = Counter(get_task_keys(
+        instance.status_id,
+        instance.executor_id,
+        instance.created_at,
+    ))
+    deltas.subtract(instance.counted_keys)
+    apply_deltas(deltas)
+
+
+def remember_deleted_task_keys(sender, instance, **kwargs):
+    """Store the counter keys of the deleted task, labels included."""
+    if is_counting_suspended():
+        return
+    label_ids = Task.labels.through.objects.filter(
+        task_id=instance.pk,
+    ).values_list('label_id', flat=True)
+    instance.counted_keys = [
+        *get_task_keys(
+            instance.status_id,
+            instance.executor_id,
+            instance.created_at,
+        ),
+        *((DIMENSION_LABEL, str(label_id)) for label_id in label_ids),
+    ]
+
+
+def count_deleted_task(sender, instance, **kwargs):
+    """Remove the deleted task from its counters."""
+    if is_counting_suspended():
+        return
+    deltas = Counter()
+    deltas.subtract(instance.counted_keys)
+    apply_deltas(deltas)
+
+
+def count_label_changes(sender, instance, **kwargs):
+    """Count labels added to tasks and removed from them."""
+    action = kwargs['action']
+    if is_counting_suspended():
+        return
+    if action == 'post_add':
+        label_ids = kwargs['pk_set']
+        if kwargs['reverse']:
+            label_ids = [instance.pk for _ in label_ids]
+        sign = 1
+    elif action in LABEL_REMOVALS:
+        label_ids = get_linked_label_ids(sender, instance, **kwargs)
+        sign = -1
+    else:
+        return
+    deltas = Counter()
+    for label_id in label_ids:
+        deltas[DIMENSION_LABEL, str(label_id)] += sign
+    apply_deltas(deltas)
+
+
+def get_linked_label_ids(sender, instance, reverse, pk_set, **kwargs):
+    """Return the label ids of the links about to be removed."""
+    if reverse:
+        links = sender.objects.filter(label_id=instance.pk)
+        if pk_set is not None:
+            links = links.filter(task_id__in=pk_set)
+    else:
+        links = sender.objects.filter(task_id=instance.pk)
+        if pk_set is not None:
+            links = links.filter(label_id__in=pk_set)
+    return list(links.values_list('label_id', flat=True))
@@ -1,13 +1,46 @@
+import csv
+import os
+import tempfile
+import threading
+import zipfile
+from collections import Counter
+from datetime import datetime
 from http import HTTPStatus
+from io import BytesIO, StringIO
+from unittest.mock import patch
 
 from django.contrib.auth.models import User
-from django.test import Client, TestCase
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.db.models import Sum, Value
+from django.db.models.functions import Concat
+from django.test import Client, TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 
 from task_manager.labels.models import Label
 from task_manager.statuses.models import Status
-from task_manager.tasks.models import Task
+from task_manager.tasks.counters import count_tasks, rebuild_counters
+from task_manager.tasks.forms import TaskCreationForm
+from task_manager.tasks.models import Task, TaskCounter
+from task_manager.tasks.views import TasksListView
+from task_manager.utils.cache import get_cached_choices
+from task_manager.utils.cache_stats import get_stats, reset_stats
 from task_manager.utils.fixtures import test_message, test_unauthenticated_user
+from task_manager.utils.pagination import encode_cursor
+
+LINK_WRITES = frozenset((
+    'DELETE FROM "tasks_task_labels"',
+    'INSERT INTO "tasks_task_labels"',
+))
+CRAFTED_CURSOR_KEYS = (
+    [None, None],
+    [1.5, 2],
+    [{}, 1],
+    ['2020-01-01', []],
+)
 
 
 class BaseSetup(TestCase):
@@ -17,6 +50,7 @@ class BaseSetup(TestCase):
 
     def setUp(self):
         self.tasks_list_url = reverse('tasks_list')
+        self.create_url = reverse('create_task')
         self.task = Task.objects.get(pk=1)
         self.author = User.objects.get(pk=1)
         self.executor = User.objects.get(pk=2)
@@ -97,6 +131,33 @@ class CreateTaskViewTest(BaseSetup):
         self.assertEqual(tasks_count_new, tasks_count_old)
 
 
+class TaskFormWidgetsTest(BaseSetup):
+    """Test that task forms render only the selected choices."""
+
+    def test_create_task_form_renders_no_choices(self):
+        response = self.client.get(reverse('create_task'))
+
+        self.assertContains(response, 'data-autocomplete-url="/users/')
+        self.assertNotContains(response, str(self.executor))
+        self.assertNotContains(response, self.status.name)
+
+    def test_update_task_form_renders_selected(self):
+        response = self.client.get(
+            reverse('update_task', kwargs={'pk': self.task.pk}),
+        )
+        other_user = User.objects.exclude(pk=self.executor.pk).first()
+
+        self.assertContains(
+            response,
+            '<option value="{0}" selected>{1}</option>'.format(
+                self.executor.pk,
+                self.executor.get_full_name(),
+            ),
+            html=True,
+        )
+        self.assertNotContains(response, other_user.get_full_name())
+
+
 class UpdateTaskViewTest(BaseSetup):
     """Test case class for the UpdateTaskView."""
 
@@ -138,6 +199,9 @@ class UpdateTaskViewTest(BaseSetup):
 class DeleteTaskViewTest(BaseSetup):
     """Test case class for the DeleteTaskView."""
 
+    # Session, user and the task, loaded once for the check and the page.
+    page_queries = 3
+
     def setUp(self):
         super().setUp()
         self.url = reverse('delete_task', kwargs={'pk': self.task.pk})
@@ -167,6 +231,18 @@ class DeleteTaskViewTest(BaseSetup):
         self.test_message(response, 'Задача успешно удалена')
         self.assertEqual(old_count, new_count + 1)
 
+    def test_delete_task_loads_task_once(self):
+        with self.assertNumQueries(self.page_queries):
+            self.client.get(self.url)
+
+    def test_delete_task_by_other_user(self):
+        self.client.force_login(self.executor)
+        for method in (self.client.get, self.client.post):
+            response = method(self.url)
+            self.assertRedirects(response, self.tasks_list_url)
+            self.test_message(response, 'Задачу может удалить только ее автор')
+        self.assertTrue(Task.objects.filter(pk=self.task.pk).exists())
+
 
 class TasksFilterTestCase(TestCase):
     """Test for tasks filter."""
@@ -208,3 +284,854 @@ class TasksFilterTestCase(TestCase):
         self.assertEqual(response.status_code, HTTPStatus.OK)
         self.assertContains(response, self.task1.name)
         self.assertContains(response, self.task2.name)
+
+
+class TasksListQueriesTest(BaseSetup):
+    """Test that the tasks list runs a fixed number of queries."""
+
+    # Session, user and the tasks.
+    list_queries = 3
+    extra_tasks = 30
+
+    def create_tasks(self, count):
+        tasks = Task.objects.bulk_create(
+            Task(
+                name=f'bulk task {index}',
+                description='bulk task description',
+                status=self.status,
+                author=self.author,
+                executor=self.executor,
+            )
+            for index in range(count)
+        )
+        count_tasks([task.pk for task in tasks])
+
+    def test_tasks_list_queries_are_bounded(self):
+        with self.assertNumQueries(self.list_queries):
+            self.client.get(self.tasks_list_url)
+
+        self.create_tasks(self.extra_tasks)
+
+        with self.assertNumQueries(self.list_queries):
+            response = self.client.get(self.tasks_list_url)
+        self.assertContains(response, 'bulk task 29')
+
+
+class TasksPaginationTest(BaseSetup):
+    """Test the keyset pagination of the tasks list."""
+
+    page_size = 2
+    extra_tasks = 5
+
+    def setUp(self):
+        super().setUp()
+        paginate_by = patch.object(
+            TasksListView,
+            'paginate_by',
+            self.page_size,
+        )
+        paginate_by.start()
+        self.addCleanup(paginate_by.stop)
+        Task.objects.bulk_create(
+            Task(
+                name=f'page task {index}',
+                description='page task description',
+                status=self.status,
+                author=self.author,
+            )
+            for index in range(self.extra_tasks)
+        )
+        self.ordered_names = list(
+            Task.objects.order_by('created_at', 'id').values_list(
+                'name',
+                flat=True,
+            ),
+        )
+
+    def walk_pages(self, query, direction):
+        responses = []
+        while query is not None:
+            url = '{0}?{1}'.format(self.tasks_list_url, query)
+            response = self.client.get(url)
+            responses.append(response)
+            page = response.context['page_obj']
+            has_more = (
+                page.has_next() if direction == 'next' else page.has_previous()
+            )
+            query = None
+            if has_more:
+                query = response.context['{0}_page_query'.format(direction)]
+        return responses
+
+    def get_names(self, responses):
+        return [
+            task.name
+            for response in responses
+            for task in response.context['task_list']
+        ]
+
+    def count_queries(self, query):
+        with CaptureQueriesContext(connection) as captured:
+            self.client.get('{0}?{1}'.format(self.tasks_list_url, query))
+            return len(captured)
+
+    def test_tasks_list_walks_pages_forward(self):
+        responses = self.walk_pages('', 'next')
+
+        self.assertEqual(len(responses), 4)
+        self.assertListEqual(self.get_names(responses), self.ordered_names)
+
+    def test_tasks_list_walks_pages_backward(self):
+        last_page = self.walk_pages('', 'next')[-1]
+        query = last_page.context['previous_page_query']
+
+        responses = self.walk_pages(query, 'previous')
+        responses.reverse()
+        responses.append(last_page)
+
+        self.assertListEqual(self.get_names(responses), self.ordered_names)
+
+    def test_tasks_list_pages_keep_filters(self):
+        status_query = 'status={0}'.format(self.status.id)
+        responses = self.walk_pages(status_query, 'next')
+        expected = Task.objects.filter(status=self.status).order_by(
+            'created_at',
+            'id',
+        ).values_list('name', flat=True)
+
+        self.assertListEqual(self.get_names(responses), list(expected))
+        for response in responses[:-1]:
+            self.assertIn(status_query, response.context['next_page_query'])
+
+    def test_tasks_list_deep_page_costs(self):
+        responses = self.walk_pages('', 'next')
+        deep_page_query = responses[-2].context['next_page_query']
+
+        self.assertEqual(
+            self.count_queries(deep_page_query),
+            self.count_queries(''),
+        )
+
+    def test_tasks_list_invalid_cursor(self):
+        response = self.client.get(self.tasks_list_url, {'after': 'broken'})
+        names = self.get_names([response])
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertListEqual(names, self.ordered_names[:self.page_size])
+
+    def test_tasks_list_crafted_cursors(self):
+        for key in CRAFTED_CURSOR_KEYS:
+            with self.subTest(key=key):
+                response = self.client.get(
+                    self.tasks_list_url,
+                    {'after': encode_cursor(key)},
+                )
+                names = self.get_names([response])
+
+                self.assertEqual(response.status_code, HTTPStatus.OK)
+                self.assertListEqual(
+                    names,
+                    self.ordered_names[:self.page_size],
+                )
+
+
+class ExplainTaskFiltersCommandTest(TestCase):
+    """Test the explain_task_filters management command."""
+
+    fixtures = ['users.json', 'statuses.json', 'tasks.json', 'labels.json']
+
+    def test_explain_task_filters_command(self):
+        stdout = StringIO()
+        call_command('explain_task_filters', stdout=stdout, no_color=True)
+        output = stdout.getvalue()
+
+        self.assertIn('no filters', output)
+        self.assertIn('status, executor, labels, self_tasks', output)
+        self.assertIn('task_status_created_idx', output)
+
+
+class TasksExportViewTest(BaseSetup):
+    """Test the CSV and XLSX export of the tasks list."""
+
+    def export(self, export_format, query=None):
+        response = self.client.get(
+            reverse('export_tasks', args=[export_format]),
+            query or {},
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertTrue(response.streaming)
+        return b''.join(response.streaming_content)
+
+    def read_csv(self, query=None):
+        exported = self.export('csv', query).decode('utf-8-sig')
+        return list(csv.reader(StringIO(exported)))
+
+    def test_export_csv(self):
+        rows = self.read_csv()
+
+        self.assertEqual(rows[0][:3], ['ID', 'Имя', 'Статус'])
+        self.assertListEqual(
+            [row[1] for row in rows[1:]],
+            ['task1', 'task2', 'task3'],
+        )
+        self.assertEqual(rows[1][3], 'John Smith')
+
+    def test_export_keeps_filters(self):
+        rows = self.read_csv({'status': 2})
+        names = [row[1] for row in rows[1:]]
+
+        self.assertListEqual(names, ['task2'])
+
+    def test_export_csv_escapes_formulas(self):
+        Task.objects.filter(pk=1).update(name='=HYPERLINK("http://x")')
+        self.author.first_name = '@SUM(A1)'
+        self.author.save()
+        rows = self.read_csv()
+
+        self.assertEqual(rows[1][1], '\'=HYPERLINK("http://x")')
+        self.assertEqual(rows[1][3], "'@SUM(A1) Smith")
+        self.assertEqual(rows[2][1], 'task2')
+
+    def test_export_xlsx(self):
+        Task.objects.filter(pk=1).update(name='<task> & "1"')
+        exported = BytesIO(self.export('xlsx'))
+
+        with zipfile.ZipFile(exported) as archive:
+            self.assertIsNone(archive.testzip())
+            self.assertIn('xl/workbook.xml', archive.namelist())
+            sheet = archive.read('xl/worksheets/sheet1.xml').decode()
+
+        self.assertEqual(sheet.count('<row>'), 4)
+        self.assertIn('<c><v>1</v></c>', sheet)
+        self.assertIn('&lt;task&gt; &amp; &quot;1&quot;', sheet)
+
+    def test_export_unknown_format(self):
+        response = self.client.get(reverse('export_tasks', args=['pdf']))
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+    def test_export_requires_login(self):
+        self.client.logout()
+        response = self.client.get(reverse('export_tasks', args=['csv']))
+
+        self.assertRedirects(response, reverse('login'))
+
+
+class TaskTransferCommandsTest(TestCase):
+    """Test the export_tasks and import_tasks management commands."""
+
+    fixtures = ['users.json', 'statuses.json', 'tasks.json', 'labels.json']
+    imported_rows = 50
+    max_import_queries = 15
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def get_tasks(self):
+        return [
+            (
+                task.name,
+                task.status.name,
+                task.author.username,
+                task.executor.username if task.executor else None,
+                sorted(task.labels.values_list('name', flat=True)),
+                task.created_at,
+            )
+            for task in Task.objects.order_by('name')
+        ]
+
+    def export(self, file_name):
+        path = os.path.join(self.directory.name, file_name)
+        call_command('export_tasks', path)
+        return path
+
+    def import_tasks(self, path, *args):
+        stdout = StringIO()
+        call_command('import_tasks', path, *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def test_export_import_round_trip(self):
+        exported = self.get_tasks()
+        for file_name in ('tasks.csv', 'tasks.jsonl'):
+            with self.subTest(file_name=file_name):
+                path = self.export(file_name)
+                Task.objects.all().delete()
+
+                output = self.import_tasks(path, '--chunk-size', '2')
+
+                self.assertIn('Imported 3 tasks', output)
+                self.assertListEqual(self.get_tasks(), exported)
+
+    def test_export_to_stdout(self):
+        stdout = StringIO()
+        call_command('export_tasks', format='jsonl', stdout=stdout)
+        lines = stdout.getvalue().splitlines()
+
+        self.assertEqual(len(lines), 3)
+        self.assertIn('"status": "done"', lines[0])
+
+    def test_import_queries_do_not_grow_with_rows(self):
+        path = os.path.join(self.directory.name, 'many.jsonl')
+        with open(path, 'w') as stream:
+            for index in range(self.imported_rows):
+                stream.write(
+                    '{{"name": "imported {0}", "status": "done", '
+                    '"author": "user1", "labels": ["urgent"]}}\n'.format(
+                        index,
+                    ),
+                )
+
+        with CaptureQueriesContext(connection) as captured:
+            self.import_tasks(path)
+            queries = len(captured)
+
+        self.assertEqual(Task.objects.count(), self.imported_rows + 3)
+        self.assertLess(queries, self.max_import_queries)
+
+    def test_import_is_atomic(self):
+        path = self.export('tasks.csv')
+        Status.objects.filter(name='postponed').update(name='renamed')
+        Task.objects.all().delete()
+
+        with self.assertRaisesMessage(CommandError, 'postponed'):
+            self.import_tasks(path, '--chunk-size', '1')
+        self.assertEqual(Task.objects.count(), 0)
+
+    def test_import_existing_tasks(self):
+        path = self.export('tasks.jsonl')
+
+        with self.assertRaisesMessage(CommandError, 'already exists'):
+            self.import_tasks(path)
+        output = self.import_tasks(path, '--skip-existing')
+
+        self.assertIn('Imported 0 tasks, skipped 3', output)
+
+    def test_import_created_at(self):
+        path = os.path.join(self.directory.name, 'dated.jsonl')
+        dated_row = (
+            '{"name": "dated", "status": "done", "author": "user1", '
+            '"created_at": "2020-01-02T03:04:05"}\n'
+        )
+        with open(path, 'w') as dated_stream:
+            dated_stream.write(dated_row)
+            dated_stream.write(
+                '{"name": "undated", "status": "done", "author": "user1", '
+                '"created_at": "yesterday"}\n',
+            )
+
+        with self.assertRaisesMessage(CommandError, 'Row 2: created_at'):
+            self.import_tasks(path)
+        with open(path, 'w') as valid_stream:
+            valid_stream.write(dated_row)
+        self.import_tasks(path)
+
+        self.assertEqual(
+            Task.objects.get(name='dated').created_at,
+            timezone.make_aware(datetime.fromisoformat('2020-01-02T03:04:05')),
+        )
+
+
+class ChoiceCacheTest(BaseSetup):
+    """Test the cache of status, executor and label choices."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.form_data = {
+            **self.valid_data,
+            'labels': list(Label.objects.values_list('id', flat=True)),
+        }
+
+    def post_task(self, name):
+        form_data = {**self.form_data, 'name': name}
+        return self.client.post(self.create_url, form_data)
+
+    def test_choice_cache_skips_choice_queries(self):
+        with CaptureQueriesContext(connection) as first_post:
+            self.post_task('first cached task')
+            first_queries = len(first_post)
+        reset_stats()
+        with CaptureQueriesContext(connection) as second_post:
+            self.post_task('second cached task')
+            second_queries = len(second_post)
+
+        self.assertEqual(first_queries - second_queries, 3)
+        self.assertEqual(get_stats()['misses'], 0)
+        self.assertGreater(get_stats()['hits'], 0)
+
+    def test_choice_cache_invalidated_on_save(self):
+        queryset = Status.objects.all()
+        status_key = str(self.status.id)
+        cached = get_cached_choices(queryset, [self.status.id])
+        self.assertEqual(cached[status_key].name, self.status.name)
+
+        self.status.name = 'renamed status'
+        self.status.save()
+        cached = get_cached_choices(queryset, [self.status.id])
+
+        self.assertEqual(cached[status_key].name, 'renamed status')
+
+    def test_choice_cache_invalidated_on_delete(self):
+        label = Label.objects.get(pk=2)
+        get_cached_choices(Label.objects.all(), [label.id])
+
+        label.delete()
+
+        self.assertEqual(get_cached_choices(Label.objects.all(), [2]), {})
+
+    def test_cached_users_leave_out_passwords(self):
+        self.post_task('task with cached executor')
+        queryset = TaskCreationForm.base_fields['executor'].queryset
+        reset_stats()
+        cached = get_cached_choices(queryset, [self.executor.pk])
+        executor = cached[str(self.executor.pk)]
+
+        self.assertEqual(get_stats()['hits'], 1)
+        self.assertEqual(str(executor), self.executor.get_full_name())
+        self.assertIn('password', executor.get_deferred_fields())
+
+
+class TaskSearchTest(BaseSetup):
+    """Test the full-text search of the tasks list."""
+
+    def setUp(self):
+        super().setUp()
+        self.create_task('quarterly report', 'collect the numbers')
+        self.create_task('team meeting', 'discuss the quarterly report')
+        self.create_task('release notes', 'write the changelog')
+
+    def create_task(self, name, description):
+        return Task.objects.create(
+            name=name,
+            description=description,
+            status=self.status,
+            author=self.author,
+        )
+
+    def search(self, query, **extra):
+        response = self.client.get(
+            self.tasks_list_url,
+            {'q': query, **extra},
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        return [task.name for task in response.context['task_list']]
+
+    def test_search_matches_name_and_description(self):
+        self.assertListEqual(
+            self.search('changelog'),
+            ['release notes'],
+        )
+        self.assertListEqual(self.search('meeting'), ['team meeting'])
+
+    def test_search_ranks_name_matches_first(self):
+        self.assertListEqual(
+            self.search('quarterly report'),
+            ['quarterly report', 'team meeting'],
+        )
+
+    def test_search_matches_word_prefixes(self):
+        self.assertListEqual(self.search('relea'), ['release notes'])
+
+    def test_search_follows_task_changes(self):
+        task = Task.objects.get(name='release notes')
+        task.name = 'hotfix notes'
+        task.save()
+
+        self.assertListEqual(self.search('release'), [])
+        self.assertListEqual(self.search('hotfix'), ['hotfix notes'])
+
+        task.delete()
+        self.assertListEqual(self.search('hotfix'), [])
+
+    def test_migrate_restores_sqlite_triggers(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('The triggers are specific to SQLite.')
+        with connection.cursor() as cursor:
+            cursor.execute('DROP TRIGGER tasks_task_fts_insert')
+        call_command('migrate', verbosity=0)
+        self.create_task('restored trigger', '')
+
+        self.assertListEqual(self.search('restored'), ['restored trigger'])
+
+    def test_search_ignores_query_syntax(self):
+        for query in ('"', '*', 'report" OR "', "'; DROP TABLE tasks_task"):
+            with self.subTest(query=query):
+                self.search(query)
+        self.assertListEqual(self.search('()*'), [])
+        self.assertListEqual(
+            self.search('"quarterly" (report)'),
+            ['quarterly report', 'team meeting'],
+        )
+
+    def test_search_results_are_paginated(self):
+        for index in range(3):
+            self.create_task(f'quarterly plan {index}', 'plan')
+        with patch.object(TasksListView, 'paginate_by', 2):
+            response = self.client.get(self.tasks_list_url, {'q': 'quarterly'})
+            names = [task.name for task in response.context['task_list']]
+            while response.context['page_obj'].has_next():
+                response = self.client.get('{0}?{1}'.format(
+                    self.tasks_list_url,
+                    response.context['next_page_query'],
+                ))
+                names.extend(
+                    task.name for task in response.context['task_list']
+                )
+
+        self.assertEqual(len(names), 5)
+        self.assertCountEqual(names, set(names))
+        self.assertEqual(names[-1], 'team meeting')
+
+    def test_search_combines_with_filters(self):
+        other_status = Status.objects.exclude(pk=self.status.pk).first()
+        Task.objects.filter(name='team meeting').update(status=other_status)
+
+        self.assertListEqual(
+            self.search('report', status=self.status.pk),
+            ['quarterly report'],
+        )
+
+
+class TaskCountersTest(BaseSetup):
+    """Test the counters of the dashboard and their maintenance."""
+
+    many_tasks = 5
+
+    def get_counters(self):
+        return dict(
+            TaskCounter.objects.exclude(count=0).values_list(
+                'dimension',
+                'key',
+            ).annotate(total=Sum('count')).values_list(
+                Concat('dimension', Value(':'), 'key'),
+                'total',
+            ),
+        )
+
+    def assert_counters_are_exact(self):
+        counters = self.get_counters()
+        rebuild_counters()
+        self.assertDictEqual(counters, self.get_counters())
+
+    def test_fixtures_are_counted(self):
+        counters = self.get_counters()
+        self.assertEqual(counters['status:1'], 1)
+        self.assertEqual(counters['executor:1'], 2)
+        self.assertEqual(counters['label:1'], 1)
+        self.assert_counters_are_exact()
+
+    def test_task_views(self):
+        label = Label.objects.get(pk=2)
+        self.client.post(
+            reverse('create_task'),
+            data={**self.valid_data, 'labels': [label.pk]},
+        )
+        self.assert_counters_are_exact()
+        self.client.post(
+            reverse('update_task', kwargs={'pk': self.task.pk}),
+            data={
+                **self.valid_data,
+                'name': 'Renamed task',
+                'status': 3,
+                'executor': '',
+                'labels': [2, 3],
+            },
+        )
+        self.assertEqual(self.get_counters()['executor:'], 1)
+        self.assert_counters_are_exact()
+        self.client.post(reverse('delete_task', kwargs={'pk': self.task.pk}))
+        self.assertFalse(Task.objects.filter(pk=self.task.pk).exists())
+        self.assert_counters_are_exact()
+
+    def test_label_changes_from_both_sides(self):
+        label = Label.objects.get(pk=3)
+        label.task_set.add(1, 2, 3)
+        self.assertEqual(self.get_counters()['label:3'], 3)
+        label.task_set.remove(2, 2)
+        self.assert_counters_are_exact()
+        self.task.labels.remove(3, 2)
+        self.assert_counters_are_exact()
+        label.task_set.clear()
+        self.task.labels.clear()
+        self.assertNotIn('label:3', self.get_counters())
+
+    def test_api_batches(self):
+        url = reverse('api_tasks_bulk')
+        new_tasks = [
+            {**self.valid_data, 'name': 'batch 1', 'labels': [1, 2]},
+            {**self.valid_data, 'name': 'batch 2'},
+        ]
+        response = self.client.post(
+            url,
+            {'tasks': new_tasks},
+            content_type='application/json',
+        )
+        self.assert_counters_are_exact()
+        created_ids = [task['id'] for task in response.json()['results']]
+        self.client.patch(
+            url,
+            {'tasks': [{'id': created_ids[0], 'status': 2, 'labels': [3]}]},
+            content_type='application/json',
+        )
+        self.assert_counters_are_exact()
+        self.client.delete(
+            url,
+            {'ids': created_ids},
+            content_type='application/json',
+        )
+        self.assertFalse(Task.objects.filter(pk__in=created_ids).exists())
+        self.assert_counters_are_exact()
+
+    def test_dashboard(self):
+        response = self.client.get(reverse('index'))
+        dashboard = response.context['dashboard']
+        self.assertEqual(dashboard['total'], Task.objects.count())
+        self.assertIn(('Sam Adams', 1), dashboard['executors'])
+        self.assertIn(('urgent', 1), dashboard['labels'])
+        self.assertContains(response, 'По статусам')
+
+    def test_dashboard_queries_do_not_depend_on_tasks(self):
+        self.client.get(reverse('index'))
+        with CaptureQueriesContext(connection) as index_queries:
+            self.client.get(reverse('index'))
+            query_count = len(index_queries)
+        for index in range(self.many_tasks):
+            self.client.post(
+                reverse('create_task'),
+                data={**self.valid_data, 'name': 'task {0}'.format(index)},
+            )
+        with self.assertNumQueries(query_count):
+            self.client.get(reverse('index'))
+
+    def test_anonymous_index_has_no_dashboard(self):
+        self.client.logout()
+        response = self.client.get(reverse('index'))
+        self.assertNotIn('dashboard', response.context)
+
+
+class ConditionalGetTest(BaseSetup):
+    """Test that unchanged task pages are answered with 304."""
+
+    def setUp(self):
+        super().setUp()
+        self.task_detail_url = reverse('task_detail', args=[self.task.pk])
+
+    def assert_not_modified(self, url, etag):
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, HTTPStatus.NOT_MODIFIED)
+
+    def assert_modified(self, url, etag):
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertNotEqual(response['ETag'], etag)
+        return response['ETag']
+
+    def test_tasks_list(self):
+        response = self.client.get(self.tasks_list_url)
+        self.assertIn('private', response['Cache-Control'])
+        etag = response['ETag']
+        self.assert_not_modified(self.tasks_list_url, etag)
+
+        self.assert_modified(
+            '{0}?status={1}'.format(self.tasks_list_url, self.status.pk),
+            etag,
+        )
+        self.task.name = 'Renamed task'
+        self.task.save()
+        etag = self.assert_modified(self.tasks_list_url, etag)
+        self.status.name = 'Renamed status'
+        self.status.save()
+        etag = self.assert_modified(self.tasks_list_url, etag)
+        self.task.labels.add(Label.objects.get(pk=2))
+        self.assert_modified(self.tasks_list_url, etag)
+
+    def test_tasks_list_after_user_rename(self):
+        etag = self.client.get(self.tasks_list_url)['ETag']
+        self.task.author.first_name = 'Johnny'
+        self.task.author.save()
+        response = self.client.get(
+            self.tasks_list_url,
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertContains(response, 'Johnny')
+
+    def test_task_detail_loads_task_once(self):
+        with CaptureQueriesContext(connection) as captured:
+            self.client.get(self.task_detail_url)
+            task_queries = [
+                query['sql']
+                for query in captured
+                if query['sql'].startswith('SELECT "tasks_task"."id"')
+            ]
+        self.assertEqual(len(task_queries), 1)
+
+    def test_task_detail(self):
+        etag = self.client.get(self.task_detail_url)['ETag']
+        self.assert_not_modified(self.task_detail_url, etag)
+
+        self.task.labels.add(Label.objects.get(pk=2))
+        etag = self.assert_modified(self.task_detail_url, etag)
+        self.executor.first_name = 'Samuel'
+        self.executor.save()
+        self.assert_modified(self.task_detail_url, etag)
+
+    def test_etag_depends_on_user(self):
+        etag = self.client.get(self.tasks_list_url)['ETag']
+        self.client.force_login(self.executor)
+        self.assert_modified(self.tasks_list_url, etag)
+
+    def test_no_etag_with_pending_messages(self):
+        response = self.client.post(self.create_url, data=self.valid_data)
+        response = self.client.get(response.url)
+        self.assertFalse(response.has_header('ETag'))
+
+
+class UniqueTaskNameTest(BaseSetup):
+    """Test that task names are kept unique by the unique index."""
+
+    def setUp(self):
+        super().setUp()
+        self.update_url = reverse('update_task', kwargs={'pk': self.task.pk})
+
+    def assert_name_taken(self, response):
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertIn('name', response.context['form'].errors)
+
+    def create_rival(self, form):
+        Task.objects.create(
+            name=form.cleaned_data['name'],
+            status=self.status,
+            author=self.executor,
+        )
+        return form.cleaned_data
+
+    def test_create_with_taken_name(self):
+        response = self.client.post(
+            self.create_url,
+            data={**self.valid_data, 'name': 'task2'},
+        )
+        self.assert_name_taken(response)
+        self.assertEqual(Task.objects.filter(name='task2').count(), 1)
+
+    def test_update_keeps_name(self):
+        response = self.client.post(
+            self.update_url,
+            data={**self.valid_data, 'name': self.task.name},
+        )
+        self.assertRedirects(response, self.tasks_list_url)
+
+    def test_update_with_taken_name(self):
+        response = self.client.post(
+            self.update_url,
+            data={**self.valid_data, 'name': 'task2'},
+        )
+        self.assert_name_taken(response)
+        self.assertEqual(Task.objects.get(pk=self.task.pk).name, 'task1')
+
+    def test_name_taken_after_validation(self):
+        # Another request saves the name between validation and saving.
+        with patch.object(
+            TaskCreationForm,
+            'clean',
+            autospec=True,
+            side_effect=self.create_rival,
+        ):
+            response = self.client.post(self.create_url, data=self.valid_data)
+        self.assert_name_taken(response)
+        rival = Task.objects.get(name=self.valid_data['name'])
+        self.assertEqual(rival.author, self.executor)
+
+
+class ConcurrentTaskCreateTest(TransactionTestCase):
+    """Test that parallel creates of the same task save it once."""
+
+    fixtures = ['users.json', 'statuses.json', 'labels.json']
+    threads = 8
+
+    def setUp(self):
+        self.create_url = reverse('create_task')
+
+    def post_task(self, responses):
+        client = Client()
+        client.force_login(User.objects.get(pk=1))
+        responses.append(client.post(self.create_url, data={
+            'name': 'Parallel task',
+            'description': '',
+            'status': 1,
+        }))
+        # Every thread opens a connection of its own.
+        connection.close()
+
+    def test_parallel_creates(self):
+        responses = []
+        workers = [
+            threading.Thread(target=self.post_task, args=(responses,))
+            for _ in range(self.threads)
+        ]
+        for worker in workers:
+            worker.start()
+        for started in workers:
+            started.join()
+
+        status_codes = Counter(response.status_code for response in responses)
+        self.assertEqual(status_codes, {
+            HTTPStatus.FOUND: 1,
+            HTTPStatus.OK: self.threads - 1,
+        })
+        self.assertEqual(Task.objects.filter(name='Parallel task').count(), 1)
+
+
+class TaskLabelWritesTest(BaseSetup):
+    """Test that saving a task only writes the labels that changed."""
+
+    # Session, user, task, its labels, status and executor choices,
+    # then the save with its counters.
+    unchanged_update_queries = 10
+
+    def setUp(self):
+        super().setUp()
+        self.update_url = reverse('update_task', kwargs={'pk': self.task.pk})
+        self.form_data = {**self.valid_data, 'name': self.task.name}
+
+    def post_labels(self, label_ids):
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.post(
+                self.update_url,
+                data={**self.form_data, 'labels': label_ids},
+            )
+            link_writes = [
+                query['sql'].split()[0]
+                for query in captured
+                if ' '.join(query['sql'].split()[:3]) in LINK_WRITES
+            ]
+        self.assertRedirects(response, self.tasks_list_url)
+        return link_writes
+
+    def assert_labels(self, label_ids):
+        self.assertEqual(
+            sorted(self.task.labels.values_list('pk', flat=True)),
+            label_ids,
+        )
+        counters = TaskCounter.objects.filter(dimension='label')
+        counted = dict(counters.values_list('key', 'count'))
+        for label_id in label_ids:
+            self.assertEqual(counted[str(label_id)], 1)
+
+    def test_unchanged_labels(self):
+        with self.assertNumQueries(self.unchanged_update_queries):
+            self.client.post(
+                self.update_url,
+                data={**self.form_data, 'labels': [1]},
+            )
+        self.assertEqual(self.post_labels([1]), [])
+        self.assert_labels([1])
+
+    def test_changed_labels(self):
+        self.assertEqual(self.post_labels([2, 3]), ['DELETE', 'INSERT'])
+        self.assert_labels([2, 3])
+        self.assertEqual(self.post_labels([3]), ['DELETE'])
+        self.assertEqual(self.post_labels([1, 3]), ['INSERT'])
+        self.assertEqual(self.post_labels([]), ['DELETE'])
+        self.assert_labels([])
@@ -0,0 +1,279 @@
+import csv
+import dataclasses
+import itertools
+import json
+import types
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import dateparse, timezone
+
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.counters import count_tasks
+from task_manager.tasks.models import Task
+
+COLUMNS = (
+    'name',
+    'description',
+    'status',
+    'author',
+    'executor',
+    'labels',
+    'created_at',
+)
+FORMATS = ('csv', 'jsonl')
+LABEL_SEPARATOR = '|'
+DEFAULT_CHUNK_SIZE = 1000
+# Fields that identify related objects in the transferred rows.
+LOOKUP_FIELDS = types.MappingProxyType({
+    Status: 'name',
+    User: 'username',
+    Label: 'name',
+})
+
+
+class TransferError(ValueError):
+    """Raised when imported rows cannot be turned into tasks."""
+
+
+@dataclasses.dataclass
+class TaskRow(object):
+    """A task with its related objects referred to by name."""
+
+    name: str
+    status: str
+    author: str
+    description: str = ''
+    executor: str = None
+    labels: list = dataclasses.field(default_factory=list)
+    created_at: str = None
+
+    @classmethod
+    def from_task(cls, task):
+        """Return the row of a task loaded by `export_rows`."""
+        return cls(
+            name=task.name,
+            description=task.description,
+            status=task.status.name,
+            author=task.author.username,
+            executor=task.executor.username if task.executor else None,
+            labels=[label.name for label in task.labels.all()],
+            created_at=task.created_at.isoformat(),
+        )
+
+    def parse_created_at(self):
+        """Return the creation time as an aware datetime, or None."""
+        if self.created_at is None:
+            return None
+        created_at = dateparse.parse_datetime(self.created_at)
+        if created_at is None:
+            raise ValueError('Invalid datetime: {0}'.format(self.created_at))
+        if timezone.is_naive(created_at):
+            return timezone.make_aware(created_at)
+        return created_at
+
+    def as_dict(self):
+        """Return the row as a dictionary of the transfer columns."""
+        return {column: getattr(self, column) for column in COLUMNS}
+
+    def as_csv(self):
+        """Return the row as a list of CSV cells."""
+        csv_row = {
+            **self.as_dict(),
+            'executor': self.executor or '',
+            'labels': LABEL_SEPARATOR.join(self.labels),
+        }
+        return [csv_row[column] for column in COLUMNS]
+
+
+def export_rows(queryset, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Return an iterator over tasks as rows of the transfer columns.
+
+    Related objects are referred to by name (usernames for users), so the
+    rows can be imported into a database with different ids. Tasks are
+    fetched `chunk_size` at a time, so memory use does not grow with the
+    number of tasks.
+    """
+    tasks = queryset.select_related(
+        'status',
+        'author',
+        'executor',
+    ).only(
+        'name',
+        'description',
+        'created_at',
+        'status__name',
+        'author__username',
+        'executor__username',
+    ).prefetch_related('labels').order_by('created_at', 'id')
+    return (
+        TaskRow.from_task(task)
+        for task in tasks.iterator(chunk_size=chunk_size)
+    )
+
+
+def write_rows(rows, stream, file_format):
+    """Write rows to a text stream as CSV or JSON lines, one per write."""
+    if file_format == 'csv':
+        writer = csv.writer(stream)
+        writer.writerow(COLUMNS)
+        writer.writerows(row.as_csv() for row in rows)
+        return
+    for row in rows:
+        json_row = json.dumps(row.as_dict(), ensure_ascii=False)
+        stream.write('{0}\n'.format(json_row))
+
+
+def read_rows(stream, file_format):
+    """Return an iterator over the rows of a CSV or JSON lines stream."""
+    if file_format == 'csv':
+        return csv.DictReader(stream)
+    return (json.loads(line) for line in stream if line.strip())
+
+
+def get_format(path, file_format=None):
+    """Return the explicit format, or the one of the file extension."""
+    if file_format:
+        return file_format
+    return 'jsonl' if path.endswith(('.jsonl', '.ndjson')) else 'csv'
+
+
+class TaskImporter(object):
+    """
+    Create tasks from rows in chunks.
+
+    Status, user and label names of a chunk are resolved to ids with one
+    query per model, and every chunk is written with one `bulk_create`
+    for the tasks and one for their labels. Resolved names are remembered
+    between chunks.
+    """
+
+    def __init__(
+        self,
+        default_author=None,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        skip_existing=False,
+    ):
+        """Configure the import."""
+        self.default_author = default_author
+        self.chunk_size = chunk_size
+        self.skip_existing = skip_existing
+        self.ids = {model: {} for model in LOOKUP_FIELDS}
+        self.created = 0
+        self.skipped = 0
+
+    @transaction.atomic
+    def run(self, records):
+        """Import all records, or none of them if any of them is invalid."""
+        numbered = enumerate(records, start=1)
+        chunk = list(itertools.islice(numbered, self.chunk_size))
+        while chunk:
+            rows = [self.clean(number, record) for number, record in chunk]
+            self.resolve_names(rows)
+            self.create_tasks(self.exclude_existing(rows))
+            chunk = list(itertools.islice(numbered, self.chunk_size))
+
+    def clean(self, number, record):
+        """Return a row of a record read from the input."""
+        if not isinstance(record, dict):
+            raise TransferError('Row {0}: not an object.'.format(number))
+        row = TaskRow(**{
+            column: record.get(column) or None for column in COLUMNS
+        })
+        labels = row.labels or []
+        if isinstance(labels, str):
+            labels = [label for label in labels.split(LABEL_SEPARATOR) if label]
+        row = dataclasses.replace(
+            row,
+            description=row.description or '',
+            author=row.author or self.default_author,
+            labels=labels,
+        )
+        if not (row.name and row.status and row.author):
+            raise TransferError(
+                'Row {0}: name, status and author are required.'.format(
+                    number,
+                ),
+            )
+        try:
+            created_at = row.parse_created_at()
+        except (TypeError, ValueError):
+            raise TransferError(
+                'Row {0}: created_at is not a date and time.'.format(number),
+            )
+        return dataclasses.replace(row, created_at=created_at)
+
+    def resolve_names(self, rows):
+        """Look up the ids of the names used by the rows."""
+        usernames = {row.author for row in rows}
+        usernames.update(row.executor for row in rows if row.executor)
+        self.resolve(Status, {row.status for row in rows})
+        self.resolve(User, usernames)
+        label_names = itertools.chain.from_iterable(row.labels for row in rows)
+        self.resolve(Label, set(label_names))
+
+    def resolve(self, model, names):
+        """Look up the ids of the names that were not resolved before."""
+        ids = self.ids[model]
+        missing = names.difference(ids)
+        if missing:
+            field_name = LOOKUP_FIELDS[model]
+            found = model.objects.filter(
+                **{'{0}__in'.format(field_name): missing},
+            )
+            ids.update(found.values_list(field_name, 'id'))
+        unknown = names.difference(ids)
+        if unknown:
+            raise TransferError('Unknown {0}: {1}'.format(
+                model._meta.verbose_name_plural,  # noqa: WPS437
+                ', '.join(sorted(unknown)),
+            ))
+
+    def exclude_existing(self, rows):
+        """Return the rows of tasks that do not exist yet."""
+        existing_names = Task.objects.filter(
+            name__in=[row.name for row in rows],
+        ).values_list('name', flat=True)
+        existing = set(existing_names)
+        new_rows = []
+        for row in rows:
+            if row.name not in existing:
+                existing.add(row.name)
+                new_rows.append(row)
+            elif not self.skip_existing:
+                raise TransferError(
+                    'Task "{0}" already exists.'.format(row.name),
+                )
+        self.skipped += len(rows) - len(new_rows)
+        return new_rows
+
+    def create_tasks(self, rows):
+        """Insert the tasks of the rows and their labels."""
+        user_ids = self.ids[User]
+        tasks = Task.objects.bulk_create(
+            Task(
+                name=row.name,
+                description=row.description,
+                status_id=self.ids[Status][row.status],
+                author_id=user_ids[row.author],
+                executor_id=user_ids.get(row.executor),
+            )
+            for row in rows
+        )
+        dated = []
+        for dated_task, dated_row in zip(tasks, rows):
+            if dated_row.created_at:
+                # `auto_now_add` has overwritten the exported value.
+                dated_task.created_at = dated_row.created_at
+                dated.append(dated_task)
+        Task.objects.bulk_update(dated, ['created_at'])
+        label_ids = self.ids[Label]
+        Task.labels.through.objects.bulk_create(
+            Task.labels.through(task_id=task.pk, label_id=label_ids[label])
+            for task, row in zip(tasks, rows)
+            for label in row.labels
+        )
+        count_tasks([task.pk for task in tasks])
+        self.created += len(tasks)
@@ -1,5 +1,6 @@
 from django.urls import path
 
+from task_manager.tasks.exports import TasksExportView
 from task_manager.tasks.views import (
     CreateTaskView,
     DeleteTaskView,
@@ -11,6 +12,11 @@ from task_manager.tasks.views import (
 urlpatterns = [
     path('', TasksListView.as_view(), name='tasks_list'),
     path('create/', CreateTaskView.as_view(), name='create_task'),
+    path(
+        'export/<str:export_format>/',
+        TasksExportView.as_view(),
+        name='export_tasks',
+    ),
     path('<int:pk>/', TaskDetailView.as_view(), name='task_detail'),
     path('<int:pk>/update/', UpdateTaskView.as_view(), name='update_task'),
     path('<int:pk>/delete/', DeleteTaskView.as_view(), name='delete_task'),
@@ -1,5 +1,3 @@
-from django.contrib import messages
-from django.shortcuts import redirect
 from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import CreateView, DeleteView, DetailView, UpdateView
@@ -8,9 +6,17 @@ from django_filters.views import FilterView
 from task_manager.tasks.filters import TasksFilter
 from task_manager.tasks.forms import TaskCreationForm
 from task_manager.tasks.models import Task
+from task_manager.tasks.search import SEARCH_ORDERING
+from task_manager.utils.conditional import (
+    ConditionalGetMixin,
+    get_update_stamp,
+)
+from task_manager.utils.pagination import KeysetPaginationMixin
 from task_manager.utils.tm_utils import (
+    ObjectPermissionMixin,
     TaskManagerFormValidMixin,
     TaskManagerLoginMixin,
+    UniqueNameMixin,
 )
 
 
@@ -21,19 +27,63 @@ class TasksMixin(TaskManagerLoginMixin, TaskManagerFormValidMixin):
     success_url = reverse_lazy('tasks_list')
 
 
-class TasksListView(TasksMixin, FilterView):
+class TaskObjectMixin(TasksMixin, ObjectPermissionMixin):
+    """Mixin class for the views of a single task."""
+
+
+class TasksListView(  # noqa: WPS215
+    TasksMixin,
+    ConditionalGetMixin,
+    KeysetPaginationMixin,
+    FilterView,
+):
     """A view for displaying a list of tasks."""
 
     template_name = 'tasks/tasks_list.html'
     filterset_class = TasksFilter
-
-
-class CreateTaskView(TasksMixin, CreateView):
+    paginate_by = 50
+    etag_namespaces = (
+        'tasks.task',
+        'tasks.task_labels',
+        'statuses.status',
+        'labels.label',
+        'auth.user',
+    )
+
+    def get_etag_parts(self):
+        """Return the filters and the versions of the rendered data."""
+        return [self.request.GET.urlencode(), *super().get_etag_parts()]
+
+    def get_queryset(self):
+        """Return tasks with only the columns rendered by the list."""
+        return Task.objects.select_related(
+            'status',
+            'author',
+            'executor',
+        ).only(
+            'name',
+            'created_at',
+            'status__name',
+            'author__first_name',
+            'author__last_name',
+            'executor__first_name',
+            'executor__last_name',
+        )
+
+    def get_paginate_ordering(self, queryset):
+        """Order search results by rank and other lists by creation."""
+        if 'search_rank' in queryset.query.annotations:
+            return SEARCH_ORDERING
+        return self.paginate_ordering
+
+
+class CreateTaskView(UniqueNameMixin, TasksMixin, CreateView):
     """A view for creating a new task."""
 
     form_class = TaskCreationForm
     template_name = 'tasks/create_task.html'
     success_message = _('The task was successfully created')
+    unique_name_message = _('Task with this name already exists.')
 
     def form_valid(self, form):
         """Handle the case when the form is valid."""
@@ -41,21 +91,28 @@ class CreateTaskView(TasksMixin, CreateView):
         return super().form_valid(form)
 
 
-class UpdateTaskView(TasksMixin, UpdateView):
+class UpdateTaskView(UniqueNameMixin, TaskObjectMixin, UpdateView):
     """A view for updating an existing task."""
 
     success_url = reverse_lazy('tasks_list')
     form_class = TaskCreationForm
     template_name = 'tasks/update_task.html'
     success_message = _('The task was successfully updated')
+    unique_name_message = _('Task with this name already exists.')
 
+    def get_queryset(self):
+        """Return tasks with their labels, read by the form and its save."""
+        return super().get_queryset().prefetch_related('labels')
 
-class DeleteTaskView(TasksMixin, DeleteView):
+
+class DeleteTaskView(TaskObjectMixin, DeleteView):
     """A view for deleting a task."""
 
     success_url = reverse_lazy('tasks_list')
     success_message = _("The task was successfully deleted")
     template_name = 'tasks/delete_task.html'
+    permission_denied_message = _('Only the author can delete the task')
+    permission_denied_url = 'tasks_list'
 
     def get_context_data(self, **kwargs):
         """Return context for the delete task view."""
@@ -66,21 +123,31 @@ class DeleteTaskView(TasksMixin, DeleteView):
         context['message'] = message
         return context
 
-    def get(self, request, *args, **kwargs):
-        """Handle GET requests."""
-        self.object = self.get_object()
-
-        if self.object.author != self.request.user:
-            messages.error(
-                self.request,
-                _('Only the author can delete the task'),
-            )
-            return redirect('tasks_list')
+    def has_object_permission(self, instance):
+        """Let only the author delete the task."""
+        return instance.author_id == self.request.user.pk
 
-        return super().get(request, *args, **kwargs)
 
-
-class TaskDetailView(TasksMixin, DetailView):
+class TaskDetailView(TaskObjectMixin, ConditionalGetMixin, DetailView):
     """A view for displaying detailed information about a task."""
 
     template_name = 'tasks/task_detail.html'
+
+    def get_queryset(self):
+        """Return tasks with the related objects shown by the page."""
+        return super().get_queryset().select_related(
+            'status',
+            'author',
+            'executor',
+        )
+
+    def get_etag_parts(self):
+        """Return what the page shows of the task, its status and labels."""
+        task = self.get_object()
+        return [
+            task.updated_at,
+            task.status.updated_at,
+            str(task.author),
+            str(task.executor),
+            get_update_stamp(task.labels.all()),
+        ]
@@ -0,0 +1,33 @@
+from django import template
+from django.conf import settings
+from django.utils.translation import get_language
+
+from task_manager.utils.cache import get_version
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def fragment_cache(context, *namespaces, per_user=False):
+    """
+    Return the timeout and the key of a cached list fragment.
+
+    The key holds the data versions of the namespaces rendered by the
+    fragment, the query string and the language, so any change of the
+    data, of the filters or of the language renders it again. Fragments
+    depending on the current user, like the list of their own tasks, also
+    hold the user id. Per-user parts of the page, like the navbar and CSRF
+    tokens, must stay out of the fragment.
+    """
+    request = context['request']
+    key_parts = [
+        *(get_version(namespace) for namespace in namespaces),
+        request.GET.urlencode(),
+        get_language(),
+    ]
+    if per_user:
+        key_parts.append(str(request.user.pk))
+    return {
+        'timeout': settings.FRAGMENT_CACHE_TIMEOUT,
+        'key': ':'.join(key_parts),
+    }
@@ -12,4 +12,6 @@ urlpatterns = [
     path('statuses/', include('task_manager.statuses.urls')),
     path('tasks/', include('task_manager.tasks.urls')),
     path('labels/', include('task_manager.labels.urls')),
+    path('api/', include('task_manager.api.urls')),
+    path('metrics', views.MetricsView.as_view(), name='metrics'),
 ]
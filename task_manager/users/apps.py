@@ -6,3 +6,15 @@ class UsersConfig(AppConfig):
 
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'task_manager.users'
+
+    def ready(self):
+        from django.contrib.auth.models import User
+        from django.db.models.signals import post_delete, post_save
+
+        from task_manager.users.models import CustomUser
+        from task_manager.utils.cache import invalidate_choices
+
+        # Signals are sent with the class the instance was loaded as.
+        for user_model in (User, CustomUser):
+            post_save.connect(invalidate_choices, sender=user_model)
+            post_delete.connect(invalidate_choices, sender=user_model)
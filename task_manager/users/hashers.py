@@ -0,0 +1,43 @@
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    PBKDF2PasswordHasher,
+)
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2 hasher running `PASSWORD_PBKDF2_ITERATIONS` iterations.
+
+    The algorithm name is Django's, so existing hashes still verify, and
+    hashes made with another count are upgraded on the next login.
+    """
+
+    @property
+    def iterations(self):
+        """Return the iteration count of new hashes."""
+        return settings.PASSWORD_PBKDF2_ITERATIONS
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2 hasher with the costs of the `PASSWORD_ARGON2_*` settings.
+
+    Requires the `argon2-cffi` package. Hashes made with other costs are
+    upgraded on the next login.
+    """
+
+    @property
+    def time_cost(self):
+        """Return the number of passes of new hashes."""
+        return settings.PASSWORD_ARGON2_TIME_COST
+
+    @property
+    def memory_cost(self):
+        """Return the memory, in KiB, used by new hashes."""
+        return settings.PASSWORD_ARGON2_MEMORY_COST
+
+    @property
+    def parallelism(self):
+        """Return the number of lanes of new hashes."""
+        return settings.PASSWORD_ARGON2_PARALLELISM
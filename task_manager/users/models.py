@@ -1,5 +1,9 @@
 from django.contrib.auth.models import User
 
+# Columns of the users kept in the shared choice cache, which must never
+# hold their password hash. The full name is their label.
+CHOICE_FIELDS = ('first_name', 'last_name')
+
 
 class CustomUser(User):
     """Model representing a user."""
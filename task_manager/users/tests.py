@@ -1,10 +1,19 @@
+import io
 from http import HTTPStatus
+from unittest.mock import patch
 
 from django.contrib.auth.models import User
 from django.contrib.messages import get_messages
-from django.test import Client, TestCase
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
+from task_manager.checks import check_password_hasher
+from task_manager.utils.cache import get_version
+
 valid_form = {
     'first_name': 'John',
     'last_name': 'Doe',
@@ -48,6 +57,34 @@ class UserListViewTestCase(TestCase):
         self.assert_user_list_equal(response)
 
 
+class UserTaskCountsTestCase(TestCase):
+    """Tests for the task counts of the UserListView."""
+
+    fixtures = ['users.json', 'statuses.json', 'tasks.json', 'labels.json']
+
+    def test_users_list_task_counts(self):
+        response = self.client.get(reverse('user_list'))
+        tasks_counts = {
+            user.username: user.tasks_count
+            for user in response.context['object_list']
+        }
+
+        self.assertEqual(tasks_counts, {'user1': 3, 'user2': 2})
+
+    @override_settings(FRAGMENT_CACHE_TIMEOUT=0)
+    def test_users_list_query_count(self):
+        url = reverse('user_list')
+        with CaptureQueriesContext(connection) as captured:
+            self.client.get(url)
+            queries = len(captured)
+        User.objects.bulk_create(
+            User(username='user{0}'.format(index)) for index in range(3, 8)
+        )
+
+        with self.assertNumQueries(queries):
+            self.client.get(url)
+
+
 class CreateUserViewTestCase(TestCase):
     """Tests for the CreateUserView view."""
 
@@ -93,6 +130,8 @@ class UserUpdateViewTestCase(TestCase):
     """Tests for UserUpdateView view."""
 
     fixtures = ['users.json']
+    # Session, signed in user and the edited user, loaded once.
+    page_queries = 3
 
     def setUp(self):
         self.user1 = User.objects.get(pk=1)
@@ -119,6 +158,11 @@ class UserUpdateViewTestCase(TestCase):
         self.assertEqual(response.status_code, HTTPStatus.OK)
         self.assertTemplateUsed(response, 'users/update_user.html')
 
+    def test_user_update_loads_user_once(self):
+        for url_name in ('update_user', 'delete_user'):
+            with self.assertNumQueries(self.page_queries):
+                self.client.get(reverse(url_name, args=[self.user1.pk]))
+
     def test_user_update_view_with_invalid_user(self):
         response = self.client.get(
             reverse('update_user', args=[self.user2.pk]),
@@ -215,3 +259,132 @@ class UserDeleteViewTest(TestCase):
         self.assertEqual(len(messages), 1)
         self.assertEqual(str(messages[0]), "Пользователь успешно удален")
         self.assertFalse(User.objects.filter(pk=self.user1.pk).exists())
+
+
+class UsersAutocompleteViewTest(TestCase):
+    """Tests for UsersAutocompleteView view."""
+
+    fixtures = ['users.json']
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse('users_autocomplete')
+        self.client.force_login(User.objects.get(pk=1))
+
+    def test_users_autocomplete_unauthenticated_user(self):
+        self.client.logout()
+        response = self.client.get(self.url)
+        self.assertRedirects(response, reverse('login'))
+
+    def test_users_autocomplete_prefix(self):
+        response = self.client.get(self.url, {'q': 'sa'})
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            response.json(),
+            {'results': [{'id': 2, 'text': 'Sam Adams'}]},
+        )
+
+    def test_users_autocomplete_limit(self):
+        response = self.client.get(self.url, {'limit': 1})
+        self.assertEqual(len(response.json()['results']), 1)
+
+        response = self.client.get(self.url, {'limit': 'all'})
+        self.assertEqual(len(response.json()['results']), 2)
+
+    def test_users_autocomplete_etag(self):
+        response = self.client.get(self.url, {'q': 'user'})
+        etag = response.headers['ETag']
+
+        response = self.client.get(
+            self.url,
+            {'q': 'user'},
+            HTTP_IF_NONE_MATCH=etag,
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+
+    def test_users_autocomplete_revalidation_queries(self):
+        response = self.client.get(self.url, {'q': 'user'})
+        etag = response.headers['ETag']
+
+        # Only the session and the signed in user are loaded.
+        with self.assertNumQueries(2):
+            self.client.get(self.url, {'q': 'user'}, HTTP_IF_NONE_MATCH=etag)
+
+    def test_users_autocomplete_etag_changes(self):
+        response = self.client.get(self.url, {'q': 'sa'})
+        etag = response.headers['ETag']
+        user = User.objects.get(pk=2)
+        user.first_name = 'Sarah'
+        user.save()
+
+        response = self.client.get(
+            self.url,
+            {'q': 'sa'},
+            HTTP_IF_NONE_MATCH=etag,
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json()['results'][0]['text'], 'Sarah Adams')
+
+
+@override_settings(PASSWORD_PBKDF2_ITERATIONS=1000)
+class PasswordHasherTest(TestCase):
+    """Test the password hashing policy."""
+
+    fixtures = ['users.json']
+    password = 'secret password'  # noqa: S105
+    new_iterations = 2000
+
+    def setUp(self):
+        self.user = User.objects.get(pk=1)
+        self.user.set_password(self.password)
+        self.user.save()
+
+    def log_in(self):
+        return self.client.post(reverse('login'), data={
+            'username': self.user.username,
+            'password': self.password,
+        })
+
+    def test_hashes_use_configured_iterations(self):
+        self.assertTrue(self.user.password.startswith('pbkdf2_sha256$1000$'))
+
+    def test_policy_change_rehashes_on_login(self):
+        users_version = get_version('auth.user')
+        with self.settings(PASSWORD_PBKDF2_ITERATIONS=self.new_iterations):
+            response = self.log_in()
+        self.assertRedirects(response, reverse('index'))
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith(
+            'pbkdf2_sha256${0}$'.format(self.new_iterations),
+        ))
+        self.assertTrue(self.user.check_password(self.password))
+        self.assertEqual(get_version('auth.user'), users_version)
+
+    def test_unchanged_policy_keeps_hash(self):
+        old_hash = self.user.password
+        self.log_in()
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.password, old_hash)
+
+    def test_check_rejects_unknown_hasher(self):
+        with self.settings(PASSWORD_HASHER='md5'):  # noqa: S106
+            errors = check_password_hasher(None)
+        self.assertEqual([error.id for error in errors], ['task_manager.E003'])
+
+    def test_check_requires_argon2_library(self):
+        with self.settings(PASSWORD_HASHER='argon2'):  # noqa: S106
+            with patch('task_manager.checks.find_spec', return_value=None):
+                errors = check_password_hasher(None)
+        self.assertEqual([error.id for error in errors], ['task_manager.E004'])
+        self.assertEqual(check_password_hasher(None), [])
+
+    def test_benchmark_login(self):
+        stdout = io.StringIO()
+        call_command('benchmark_login', repeat=2, threads=2, stdout=stdout)
+        output = stdout.getvalue()
+        self.assertIn('pbkdf2_sha256: p50', output)
+        self.assertIn('2 thread(s)', output)
@@ -5,6 +5,11 @@ from task_manager.users import views
 urlpatterns = [
     path('', views.UserListView.as_view(), name='user_list'),
     path('create/', views.CreateUserView.as_view(), name='create_user'),
+    path(
+        'autocomplete/',
+        views.UsersAutocompleteView.as_view(),
+        name='users_autocomplete',
+    ),
     path(
         '<int:pk>/update/',
         views.UserUpdateView.as_view(),
@@ -8,24 +8,40 @@ from django.views.generic.edit import CreateView
 
 from task_manager.users.forms import UserRegistryForm
 from task_manager.users.models import CustomUser
+from task_manager.utils.autocomplete import AutocompleteView
 from task_manager.utils.tm_utils import (
+    ObjectPermissionMixin,
     TaskManagerFormValidMixin,
     TaskManagerLoginMixin,
+    TaskUsageMixin,
 )
 
 
-class UsersMixin(TaskManagerLoginMixin, TaskManagerFormValidMixin):
+class UsersMixin(
+    TaskManagerLoginMixin,
+    ObjectPermissionMixin,
+    TaskManagerFormValidMixin,
+):
     """Mixin class that provides common functionality for users app views."""
 
     model = CustomUser
     success_url = reverse_lazy('user_list')
+    permission_denied_message = _(
+        "You don't have the rights to modify another user.",
+    )
+    permission_denied_url = 'user_list'
+
+    def has_object_permission(self, instance):
+        """Let users change only their own profile."""
+        return instance.pk == self.request.user.pk
 
 
-class UserListView(ListView):
+class UserListView(TaskUsageMixin, ListView):
     """View for displaying a list of all registered users."""
 
     model = CustomUser
     template_name = 'users/user_list.html'
+    task_lookups = ('author', 'executor')
 
 
 class CreateUserView(TaskManagerFormValidMixin, CreateView):
@@ -45,29 +61,13 @@ class UserUpdateView(UsersMixin, UpdateView):
     template_name = 'users/update_user.html'
     success_message = _('The user has been successfully updated')
 
-    def dispatch(self, request, *args, **kwargs):
-        """Edit the profile if the user is authenticated and authorized."""
-        if not request.user.is_authenticated:
-            messages.error(
-                request,
-                _('You are not signed in! Please, sign in'),
-            )
-            return redirect('login')
-        elif self.get_object().pk != request.user.pk:
-            messages.error(
-                request,
-                _("You don't have the rights to modify another user."),
-            )
-            return redirect('user_list')
-
-        return super().dispatch(request, *args, **kwargs)
-
 
 class UserDeleteView(UsersMixin, DeleteView):
     """A view to delete a user's profile."""
 
     template_name = 'users/delete_user.html'
     success_message = _("The user was successfuly deleted")
+    login_required_message = _('You are not signed in! Please, sign in.')
 
     def get_context_data(self, **kwargs):
         """Return the context data for the view."""
@@ -80,23 +80,6 @@ class UserDeleteView(UsersMixin, DeleteView):
         context['message'] = message
         return context
 
-    def dispatch(self, request, *args, **kwargs):
-        """Delete the profile if the user is authenticated and authorized."""
-        if not request.user.is_authenticated:
-            messages.error(
-                request,
-                _('You are not signed in! Please, sign in.'),
-            )
-            return redirect('login')
-        elif self.get_object().pk != request.user.pk:
-            messages.error(
-                request,
-                _("You don't have the rights to modify another user."),
-            )
-            return redirect('user_list')
-
-        return super().dispatch(request, *args, **kwargs)
-
     def form_valid(self, form):
         """Call when a valid form has been submitted."""
         try:
@@ -108,3 +91,11 @@ class UserDeleteView(UsersMixin, DeleteView):
             )
 
             return redirect(self.success_url)
+
+
+class UsersAutocompleteView(AutocompleteView):
+    """JSON endpoint for searching users by a name prefix."""
+
+    model = CustomUser
+    search_fields = ('username', 'first_name', 'last_name')
+    ordering = ('first_name', 'last_name', 'id')
@@ -0,0 +1,157 @@
+import hashlib
+
+from django import forms
+from django.db import models
+from django.http import JsonResponse
+from django.urls import reverse_lazy
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.translation import gettext_lazy as _
+from django.views import View
+
+from task_manager.utils.cache import (
+    get_cached_choices,
+    get_cached_results,
+    get_namespace,
+    get_version,
+)
+from task_manager.utils.tm_utils import TaskManagerLoginMixin
+
+
+class AutocompleteView(TaskManagerLoginMixin, View):
+    """Return JSON choices whose search fields start with the `q` prefix."""
+
+    model = None
+    search_fields = ()
+    ordering = ('id',)
+    default_limit = 20
+    max_limit = 50
+
+    def get(self, request, *args, **kwargs):
+        """
+        Handle GET requests.
+
+        Results are cached under the data version of the model, and the
+        ETag is derived from that version, so a revalidation that ends with
+        304 Not Modified costs no database query.
+        """
+        namespace = get_namespace(self.model)
+        key_parts = (
+            'autocomplete',
+            request.GET.get('q', '').strip(),
+            self.get_limit(),
+        )
+        etag = self.get_etag(namespace, key_parts)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            choices = get_cached_results(
+                namespace,
+                key_parts,
+                lambda: self.get_results(*key_parts[1:]),
+            )
+            response = JsonResponse({'results': choices})
+        response.headers['ETag'] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    def get_etag(self, namespace, key_parts):
+        """Return the ETag of the results for the current data version."""
+        etag_source = ':'.join(
+            str(part) for part in (get_version(namespace), *key_parts)
+        )
+        digest = hashlib.md5(etag_source.encode())  # noqa: S324
+        return '"{0}"'.format(digest.hexdigest())
+
+    def get_results(self, prefix, limit):
+        """Return at most `limit` choices matching the prefix."""
+        queryset = self.model.objects.only(*self.search_fields)
+        if prefix:
+            condition = models.Q()
+            for field_name in self.search_fields:
+                condition |= models.Q(
+                    **{'{0}__istartswith'.format(field_name): prefix},
+                )
+            queryset = queryset.filter(condition)
+        queryset = queryset.order_by(*self.ordering)[:limit]
+        return [{'id': choice.pk, 'text': str(choice)} for choice in queryset]
+
+    def get_limit(self):
+        """Return the requested number of results within the bounds."""
+        try:
+            limit = int(self.request.GET.get('limit', self.default_limit))
+        except ValueError:
+            return self.default_limit
+        return min(max(limit, 1), self.max_limit)
+
+
+class AutocompleteWidgetMixin(object):
+    """
+    Render only the selected choices of a model choice field.
+
+    The rest of the choices are loaded by `static/js/autocomplete.js`
+    from the JSON endpoint with the given URL name.
+    """
+
+    def __init__(self, url_name, attrs=None):
+        """Store the URL name of the autocomplete endpoint."""
+        super().__init__(attrs)
+        self.url_name = url_name
+
+    def get_context(self, name, field_value, attrs):
+        """Add the endpoint URL to the widget attributes."""
+        context = super().get_context(name, field_value, attrs)
+        widget_attrs = context['widget']['attrs']
+        widget_attrs['data-autocomplete-url'] = reverse_lazy(self.url_name)
+        widget_attrs['data-autocomplete-placeholder'] = _(
+            'Start typing to search',
+        )
+        return context
+
+    def optgroups(self, name, field_value, attrs=None):
+        """Return options for the blank choice and the selected values."""
+        selected_values = [choice for choice in field_value if choice]
+        options = []
+        if not self.allow_multiple_selected:
+            options.append(self.create_option(
+                name,
+                '',
+                self.choices.field.empty_label or '',
+                selected=not selected_values,
+                index=0,
+            ))
+        for choice in self.get_selected_choices(selected_values):
+            option_value, label = self.choices.choice(choice)
+            options.append(self.create_option(
+                name,
+                option_value,
+                label,
+                selected=True,
+                index=len(options),
+            ))
+        return [(None, [option], option['index']) for option in options]
+
+    def get_selected_choices(self, selected_values):
+        """Return the model instances of the selected values."""
+        if not selected_values:
+            return []
+        field = self.choices.field
+        choices = get_cached_choices(
+            field.queryset,
+            selected_values,
+            field.to_field_name or 'pk',
+        )
+        return [
+            choices[str(choice)]
+            for choice in selected_values
+            if str(choice) in choices
+        ]
+
+
+class AutocompleteSelect(AutocompleteWidgetMixin, forms.Select):
+    """Select widget that loads its choices from an autocomplete endpoint."""
+
+
+class AutocompleteSelectMultiple(
+    AutocompleteWidgetMixin,
+    forms.SelectMultiple,
+):
+    """Multiple select widget that loads choices from an endpoint."""
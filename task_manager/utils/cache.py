@@ -0,0 +1,109 @@
+import uuid
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+
+from task_manager.utils.cache_stats import record_lookups
+
+LOGIN_FIELDS = frozenset(('last_login', 'password'))
+
+
+def get_namespace(model):
+    """Return the cache namespace shared by a model and its proxies."""
+    return model._meta.concrete_model._meta.label_lower  # noqa: WPS437
+
+
+def get_version(namespace):
+    """
+    Return the current data version token of a namespace.
+
+    Cached entries embed the token in their keys, so bumping it makes all
+    of them unreachable at once. A random token (instead of a counter) is
+    used so that an evicted version never resurrects old entries.
+    """
+    key = 'choices:{0}:version'.format(namespace)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(namespace):
+    """Invalidate every entry cached under the namespace."""
+    key = 'choices:{0}:version'.format(namespace)
+    cache.set(key, uuid.uuid4().hex, timeout=None)
+
+
+def invalidate_choices(sender, **kwargs):
+    """Bump the version of the saved or deleted model's choices."""
+    update_fields = kwargs.get('update_fields')
+    # Logging in only touches `last_login`, and the password when it is
+    # rehashed, which no choice label shows.
+    if update_fields and set(update_fields) <= LOGIN_FIELDS:
+        return
+    bump_version(get_namespace(sender))
+
+
+def get_cached_choices(queryset, choice_values, field_name='pk'):
+    """
+    Return the objects of the queryset matching the values, by value.
+
+    Objects are cached one by one under the model namespace, and the
+    missing ones are fetched with a single query. The queryset must not
+    be filtered, as its results are shared by every user of the model.
+    """
+    namespace = get_namespace(queryset.model)
+    key_prefix = 'choices:{0}:{1}:{2}:'.format(
+        namespace,
+        get_version(namespace),
+        field_name,
+    )
+    keys = {
+        str(choice): '{0}{1}'.format(key_prefix, choice)
+        for choice in choice_values
+    }
+    cached = cache.get_many(keys.values())
+    choices = {
+        choice: cached[key]
+        for choice, key in keys.items()
+        if key in cached
+    }
+    hits = len(choices)
+    record_lookups(hits=hits, misses=len(keys) - hits)
+    missing = [choice for choice in keys if choice not in choices]
+    if missing:
+        choices.update(_fetch_choices(queryset, missing, field_name, keys))
+    return choices
+
+
+def get_cached_results(namespace, key_parts, compute):
+    """Return a cached value computed from the namespace data."""
+    key = 'choices:{0}:{1}:{2}'.format(
+        namespace,
+        get_version(namespace),
+        ':'.join(str(part) for part in key_parts),
+    )
+    cached = cache.get(key)
+    if cached is not None:
+        record_lookups(hits=1)
+        return cached
+    record_lookups(misses=1)
+    computed = compute()
+    cache.set(key, computed)
+    return computed
+
+
+def _fetch_choices(queryset, choice_values, field_name, keys):
+    lookup = {'{0}__in'.format(field_name): choice_values}
+    try:
+        fetched = {
+            str(getattr(instance, field_name)): instance
+            for instance in queryset.filter(**lookup)
+        }
+    except (ValidationError, ValueError):
+        return {}
+    cache.set_many({
+        keys[choice]: instance for choice, instance in fetched.items()
+    })
+    return fetched
@@ -0,0 +1,36 @@
+from django.core.cache import caches
+from django.utils.connection import ConnectionProxy
+
+# Counters live in their own cache, where cached data cannot cull them.
+metrics_cache = ConnectionProxy(caches, 'metrics')
+
+HITS_KEY = 'choices:stats:hits'
+MISSES_KEY = 'choices:stats:misses'
+
+
+def record_lookups(hits=0, misses=0):
+    """Add lookups to the shared hit and miss counters."""
+    for key, delta in ((HITS_KEY, hits), (MISSES_KEY, misses)):
+        if not delta:
+            continue
+        try:
+            metrics_cache.incr(key, delta)
+        except ValueError:
+            metrics_cache.set(key, delta, timeout=None)
+
+
+def get_stats():
+    """Return the hit and miss counters and the hit ratio."""
+    hits = metrics_cache.get(HITS_KEY, 0)
+    misses = metrics_cache.get(MISSES_KEY, 0)
+    lookups = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': hits / lookups if lookups else 0,
+    }
+
+
+def reset_stats():
+    """Reset the hit and miss counters."""
+    metrics_cache.delete_many([HITS_KEY, MISSES_KEY])
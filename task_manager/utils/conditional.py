@@ -0,0 +1,71 @@
+import hashlib
+
+from django.contrib import messages
+from django.db import models
+from django.middleware.csrf import get_token
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.translation import get_language
+
+from task_manager.utils.cache import get_version
+
+
+def get_update_stamp(queryset):
+    """Return the last update time and the number of rows of the queryset."""
+    stamp = queryset.order_by().aggregate(
+        last_update=models.Max('updated_at'),
+        rows=models.Count('pk'),
+    )
+    return stamp['last_update'], stamp['rows']
+
+
+class ConditionalGetMixin(object):
+    """
+    Mixin answering `304 Not Modified` to GET requests of unchanged pages.
+
+    The ETag is a hash of `get_etag_parts`, which must change whenever the
+    page would, and should be cheaper than rendering it. By default it is
+    the data version of every namespace of `etag_namespaces`, which the
+    signals and the bulk writes bump, so no table is read. The user and
+    the language are part of the ETag, and none is sent while flash
+    messages wait to be shown. Pages with a form also set `etag_csrf`:
+    the CSRF secret rotates on login, and a cached form would then be
+    rejected.
+    """
+
+    # Cache namespaces of the rendered models, like 'tasks.task'.
+    etag_namespaces = ()
+    etag_csrf = False
+
+    def get(self, request, *args, **kwargs):
+        """Answer with `304 Not Modified` if the page has not changed."""
+        etag = self.get_etag()
+        if etag is not None:
+            not_modified = get_conditional_response(request, etag=etag)
+            if not_modified is not None:
+                return not_modified
+        response = super().get(request, *args, **kwargs)
+        if etag is not None:
+            response.headers['ETag'] = etag
+            # Browsers have to revalidate, shared caches must not store it.
+            patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    def get_etag(self):
+        """Return the quoted ETag of the page, or None to skip it."""
+        if messages.get_messages(self.request):
+            return None
+        etag_parts = [
+            self.request.user.pk,
+            get_language(),
+            *self.get_etag_parts(),
+        ]
+        if self.etag_csrf:
+            # Creates the secret, and its cookie, for a new visitor.
+            get_token(self.request)
+            etag_parts.append(self.request.META['CSRF_COOKIE'])
+        digest = hashlib.sha256(repr(etag_parts).encode()).hexdigest()
+        return '"{0}"'.format(digest)
+
+    def get_etag_parts(self):
+        """Return the values the page is rendered from."""
+        return [get_version(namespace) for namespace in self.etag_namespaces]
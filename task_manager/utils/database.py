@@ -0,0 +1,44 @@
+import dj_database_url
+
+DEFAULT_CONN_MAX_AGE = 500
+ENABLED_VALUES = frozenset(('yes', '1', 'true'))
+POSTGRESQL_ENGINE = 'django.db.backends.postgresql'
+
+
+def is_enabled(flag):
+    """Return whether an environment flag like 'true' or '1' is set."""
+    return str(flag).lower() in ENABLED_VALUES
+
+
+def get_conn_max_age(environ):
+    """Return how long, in seconds, a worker keeps its connection open."""
+    return int(environ.get('DB_CONN_MAX_AGE', DEFAULT_CONN_MAX_AGE))
+
+
+def get_database_config(database_url, environ):
+    """
+    Return the `DATABASES` entry of a database URL.
+
+    Persistent connections are checked before each request reuses them,
+    so a connection dropped by the server or a pooler costs a reconnect
+    instead of a failed request. With `DB_PGBOUNCER` set, connections go
+    through PgBouncer in transaction mode, where a cursor cannot outlive
+    its transaction, so server-side cursors are disabled and
+    `QuerySet.iterator()` fetches its rows at once.
+    """
+    config = dj_database_url.parse(
+        database_url,
+        conn_max_age=get_conn_max_age(environ),
+        conn_health_checks=is_enabled(
+            environ.get('DB_CONN_HEALTH_CHECKS', 'true'),
+        ),
+    )
+    config['DISABLE_SERVER_SIDE_CURSORS'] = is_enabled(
+        environ.get('DB_PGBOUNCER', 'false'),
+    )
+    connect_timeout = environ.get('DB_CONNECT_TIMEOUT')
+    if connect_timeout and config['ENGINE'] == POSTGRESQL_ENGINE:
+        config.setdefault('OPTIONS', {})['connect_timeout'] = int(
+            connect_timeout,
+        )
+    return config
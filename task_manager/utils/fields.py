@@ -0,0 +1,43 @@
+from django import forms
+from django_filters import fields as filter_fields
+
+from task_manager.utils.cache import get_cached_choices
+
+
+class CachedChoiceMixin(object):
+    """Validate model choices through the per-object choice cache."""
+
+    def to_python(self, value):  # noqa: WPS110
+        """Return the cached object for the value if there is one."""
+        if value in self.empty_values or isinstance(value, self.queryset.model):
+            return super().to_python(value)
+        choices = get_cached_choices(
+            self.queryset,
+            [value],
+            self.to_field_name or 'pk',
+        )
+        choice = choices.get(str(value))
+        return choice if choice is not None else super().to_python(value)
+
+
+class CachedModelChoiceField(CachedChoiceMixin, forms.ModelChoiceField):
+    """Model choice field backed by the choice cache."""
+
+
+class CachedFilterModelChoiceField(
+    CachedChoiceMixin,
+    filter_fields.ModelChoiceField,
+):
+    """Model choice field of django-filter backed by the choice cache."""
+
+
+class CachedModelMultipleChoiceField(forms.ModelMultipleChoiceField):
+    """Model multiple choice field backed by the choice cache."""
+
+    def _check_values(self, value):  # noqa: WPS110
+        field_name = self.to_field_name or 'pk'
+        submitted = list(dict.fromkeys(str(choice) for choice in value))
+        choices = get_cached_choices(self.queryset, submitted, field_name)
+        if len(choices) < len(submitted):
+            return super()._check_values(value)
+        return [choices[choice] for choice in submitted]
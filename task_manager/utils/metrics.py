@@ -0,0 +1,109 @@
+import bisect
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+from django.urls import URLResolver, get_resolver
+
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task
+from task_manager.utils.cache_stats import metrics_cache
+
+# Upper bounds of the request latency histogram, in seconds.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+# The cache only increments integers, so durations are summed in
+# microseconds.
+MICROSECONDS = 1000000
+UNNAMED_VIEW = 'unnamed'
+BUSINESS_KEY = 'metrics:business'
+DB_CONNECTIONS_KEY = 'metrics:db:{0}'
+
+
+def increment(key, delta=1):
+    """
+    Add to a counter shared by every worker through the metrics cache.
+
+    With several gunicorn workers the cache has to be shared as well (see
+    REDIS_URL), otherwise each worker reports its own counters.
+    """
+    try:
+        metrics_cache.incr(key, delta)
+    except ValueError:
+        metrics_cache.set(key, delta, timeout=None)
+
+
+def get_request_key(view_name, suffix):
+    """Return the cache key of a request counter of the view."""
+    return 'metrics:requests:{0}:{1}'.format(view_name, suffix)
+
+
+def observe_request(view_name, duration):
+    """Count a request to the view in its latency histogram bucket."""
+    bucket = bisect.bisect_left(LATENCY_BUCKETS, duration)
+    increment(get_request_key(view_name, bucket))
+    increment(
+        get_request_key(view_name, 'sum'),
+        round(duration * MICROSECONDS),
+    )
+
+
+def record_db_connection(reused):
+    """Count a database connection opened or reused by a request."""
+    increment(DB_CONNECTIONS_KEY.format('reused' if reused else 'opened'))
+
+
+def count_connection(sender, **kwargs):
+    """Count a database connection opened by the process."""
+    record_db_connection(reused=False)
+
+
+def get_view_names(url_patterns=None, namespace=''):
+    """Return the names of every named URL pattern, with namespaces."""
+    if url_patterns is None:
+        url_patterns = get_resolver().url_patterns
+    view_names = []
+    for url_pattern in url_patterns:
+        if isinstance(url_pattern, URLResolver):
+            child_namespace = namespace
+            if url_pattern.namespace:
+                child_namespace = '{0}{1}:'.format(
+                    namespace,
+                    url_pattern.namespace,
+                )
+            view_names.extend(
+                get_view_names(url_pattern.url_patterns, child_namespace),
+            )
+        elif url_pattern.name:
+            view_names.append(namespace + url_pattern.name)
+    return [*dict.fromkeys(view_names), UNNAMED_VIEW]
+
+
+def get_business_metrics():
+    """
+    Return the task counts per status and per executor.
+
+    The counts are aggregated at most once per METRICS_REFRESH_SECONDS and
+    shared through the cache, so scrapes do not query the tasks table.
+    """
+    business_metrics = cache.get(BUSINESS_KEY)
+    if business_metrics is None:
+        business_metrics = {
+            'refreshed_at': time.time(),
+            'statuses': list(
+                Status.objects.annotate(
+                    tasks_count=Count('task'),
+                ).order_by('name').values_list('name', 'tasks_count'),
+            ),
+            'executors': list(
+                Task.objects.values_list('executor__username').annotate(
+                    tasks_count=Count('id'),
+                ).order_by('executor__username'),
+            ),
+        }
+        cache.set(
+            BUSINESS_KEY,
+            business_metrics,
+            timeout=settings.METRICS_REFRESH_SECONDS,
+        )
+    return business_metrics
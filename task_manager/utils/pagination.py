@@ -0,0 +1,217 @@
+import base64
+import json
+import types
+from datetime import datetime
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import models
+
+INCLUSIVE_LOOKUPS = types.MappingProxyType({'gt': 'gte', 'lt': 'lte'})
+CURSOR_VALUE_TYPES = (str, int, float)
+
+
+class KeysetPage(object):
+    """A page of objects fetched by a keyset (cursor) query."""
+
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        """Store the objects of the page and the neighbouring cursors."""
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        """Iterate over the objects of the page."""
+        return iter(self.object_list)
+
+    def __len__(self):
+        """Return the number of objects on the page."""
+        return len(self.object_list)
+
+    def has_next(self):
+        """Check if there is a page after this one."""
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        """Check if there is a page before this one."""
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        """Check if there are pages around this one."""
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator(object):
+    """
+    Paginate a queryset by the values of its ordering fields.
+
+    Unlike offset pagination, every page is fetched with a range condition
+    on the ordering fields, so the cost of a page does not depend on its
+    position. The last ordering field must be unique to make the order total.
+    """
+
+    def __init__(self, queryset, per_page, ordering=('created_at', 'id')):
+        """Order the queryset by the fields the pages are cut by."""
+        self.queryset = queryset.order_by(*ordering)
+        self.per_page = per_page
+        self.names = [name.lstrip('-') for name in ordering]
+        self.descending = [name.startswith('-') for name in ordering]
+
+    def get_page(self, after=None, before=None):
+        """Return the page following `after` or preceding `before`."""
+        after_key = self._parse_cursor(after)
+        if after_key is not None:
+            queryset = self.queryset.filter(self._keyset_filter(after_key))
+            return self._build_page(queryset, has_previous=True)
+        before_key = self._parse_cursor(before)
+        if before_key is not None:
+            return self._page_before(before_key)
+        return self._build_page(self.queryset, has_previous=False)
+
+    def _parse_cursor(self, cursor):
+        key = decode_cursor(cursor) if cursor else None
+        if key is None or len(key) != len(self.names):
+            return None
+        # Ordering values are never NULL, and cursors only store strings and
+        # numbers: anything else was not made by this paginator.
+        if not all(isinstance(raw, CURSOR_VALUE_TYPES) for raw in key):
+            return None
+        try:
+            return [
+                self._get_field(name).to_python(raw_value)
+                for name, raw_value in zip(self.names, key)
+            ]
+        except (FieldDoesNotExist, ValidationError, TypeError, ValueError):
+            return None
+
+    def _page_before(self, key):
+        reverse_ordering = [
+            name if descending else f'-{name}'
+            for name, descending in zip(self.names, self.descending)
+        ]
+        preceding = self.queryset.filter(
+            self._keyset_filter(key, forward=False),
+        ).order_by(*reverse_ordering).values_list(*self.names)
+        first_index = self.per_page - 1
+        boundary = list(preceding[first_index:first_index + 2])
+        if not boundary:
+            return self._build_page(self.queryset, has_previous=False)
+        queryset = self.queryset.filter(
+            self._keyset_filter(boundary[0], inclusive=True),
+        )
+        return self._build_page(queryset, has_previous=len(boundary) > 1)
+
+    def _build_page(self, queryset, has_previous):
+        object_list = queryset[:self.per_page]
+        rows = list(object_list)
+        next_cursor = None
+        previous_cursor = None
+        if len(rows) == self.per_page:
+            last_key = _get_key(rows[-1], self.names)
+            if self.queryset.filter(self._keyset_filter(last_key)).exists():
+                next_cursor = encode_cursor(last_key)
+        if has_previous and rows:
+            previous_cursor = encode_cursor(_get_key(rows[0], self.names))
+        return KeysetPage(object_list, next_cursor, previous_cursor)
+
+    def _keyset_filter(self, key, forward=True, inclusive=False):
+        """
+        Build the condition selecting rows after (or before) the key.
+
+        For the ordering (a, b) and the key (x, y) moving forward this is
+        `a > x OR (a = x AND b > y)`.
+        """
+        lookups = [
+            'lt' if forward == descending else 'gt'
+            for descending in self.descending
+        ]
+        if inclusive:
+            lookups[-1] = INCLUSIVE_LOOKUPS[lookups[-1]]
+        condition = models.Q()
+        equal = {}
+        for name, lookup, key_value in zip(self.names, lookups, key):
+            range_lookup = {f'{name}__{lookup}': key_value}
+            condition |= models.Q(**equal, **range_lookup)
+            equal[name] = key_value
+        return condition
+
+    def _get_field(self, name):
+        annotation = self.queryset.query.annotations.get(name)
+        if annotation is not None:
+            return annotation.output_field
+        return self.queryset.model._meta.get_field(name)  # noqa: WPS437
+
+
+class KeysetPaginationMixin(object):
+    """Mixin for list views that are paginated by a keyset cursor."""
+
+    paginate_ordering = ('created_at', 'id')
+    after_kwarg = 'after'
+    before_kwarg = 'before'
+
+    def paginate_queryset(self, queryset, page_size):
+        """Paginate the queryset by the cursor from the query string."""
+        paginator = KeysetPaginator(
+            queryset,
+            page_size,
+            self.get_paginate_ordering(queryset),
+        )
+        page = paginator.get_page(
+            after=self.request.GET.get(self.after_kwarg),
+            before=self.request.GET.get(self.before_kwarg),
+        )
+        return (paginator, page, page.object_list, page.has_other_pages())
+
+    def get_paginate_ordering(self, queryset):  # noqa: WPS615
+        """Return the ordering the pages of the queryset are cut by."""
+        return self.paginate_ordering
+
+    def get_context_data(self, **kwargs):
+        """Add query strings of the neighbouring pages to the context."""
+        context = super().get_context_data(**kwargs)
+        page = context.get('page_obj')
+        if page is not None:
+            context['first_page_query'] = self.get_page_query()
+            context['next_page_query'] = self.get_page_query(
+                self.after_kwarg,
+                page.next_cursor,
+            )
+            context['previous_page_query'] = self.get_page_query(
+                self.before_kwarg,
+                page.previous_cursor,
+            )
+        return context
+
+    def get_page_query(self, cursor_kwarg=None, cursor=None):
+        """Return the current query string pointing at another page."""
+        query = self.request.GET.copy()
+        query.pop(self.after_kwarg, None)
+        query.pop(self.before_kwarg, None)
+        if cursor_kwarg and cursor:
+            query[cursor_kwarg] = cursor
+        return query.urlencode()
+
+
+def encode_cursor(key):
+    """Pack the ordering values of an object into an opaque cursor."""
+    raw_key = json.dumps(key, default=_encode_value).encode()
+    return base64.urlsafe_b64encode(raw_key).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Unpack a cursor into raw ordering values, or None if it is broken."""
+    padding = '=' * (-len(cursor) % 4)
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor + padding))
+    except ValueError:
+        return None
+    return key if isinstance(key, list) else None
+
+
+def _get_key(instance, names):
+    return [getattr(instance, name) for name in names]
+
+
+def _encode_value(key_value):
+    if isinstance(key_value, datetime):
+        return key_value.isoformat()
+    raise TypeError('Only JSON types and datetimes can be stored in a cursor')
@@ -0,0 +1,159 @@
+from django.conf import settings
+
+from task_manager.utils.cache_stats import get_stats, metrics_cache
+from task_manager.utils.metrics import (
+    DB_CONNECTIONS_KEY,
+    LATENCY_BUCKETS,
+    MICROSECONDS,
+    get_business_metrics,
+    get_request_key,
+    get_view_names,
+)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+PREFIX = 'taskmanager_'
+DB_CONNECTION_STATES = ('opened', 'reused')
+
+
+def render_metrics():
+    """Return every metric in the Prometheus text exposition format."""
+    cache_stats = get_stats()
+    db_connections = metrics_cache.get_many([
+        DB_CONNECTIONS_KEY.format(state) for state in DB_CONNECTION_STATES
+    ])
+    db_connection_samples = [
+        ({'state': state}, db_connections.get(
+            DB_CONNECTIONS_KEY.format(state),
+            0,
+        ))
+        for state in DB_CONNECTION_STATES
+    ]
+    cache_lookup_samples = [
+        ({'result': 'hit'}, cache_stats['hits']),
+        ({'result': 'miss'}, cache_stats['misses']),
+    ]
+    lines = [
+        *_request_lines(),
+        *_family(
+            'db_connections_total',
+            'counter',
+            'Database connections opened or reused by requests.',
+            db_connection_samples,
+        ),
+        *_family(
+            'db_conn_max_age_seconds',
+            'gauge',
+            'Lifetime of persistent database connections.',
+            [({}, settings.CONN_MAX_AGE or 0)],
+        ),
+        *_family(
+            'choices_cache_lookups_total',
+            'counter',
+            'Lookups of the choice cache by result.',
+            cache_lookup_samples,
+        ),
+        *_family(
+            'choices_cache_hit_ratio',
+            'gauge',
+            'Share of choice cache lookups that were hits.',
+            [({}, cache_stats['hit_ratio'])],
+        ),
+        *_business_lines(),
+    ]
+    return '{0}\n'.format('\n'.join(lines))
+
+
+def _request_lines():
+    view_names = get_view_names()
+    counters = metrics_cache.get_many([
+        get_request_key(view_name, suffix)
+        for view_name in view_names
+        for suffix in (*range(len(LATENCY_BUCKETS) + 1), 'sum')
+    ])
+    name = 'http_request_duration_seconds'
+    lines = [
+        '# HELP {0}{1} Request latency by URL name.'.format(PREFIX, name),
+        '# TYPE {0}{1} histogram'.format(PREFIX, name),
+    ]
+    for view_name in view_names:
+        lines.extend(
+            _format_sample(name + suffix, labels, sample_value)
+            for suffix, labels, sample_value in _histogram_samples(
+                view_name,
+                counters,
+            )
+        )
+    return lines
+
+
+def _histogram_samples(view_name, counters):
+    counts = [
+        counters.get(get_request_key(view_name, index), 0)
+        for index in range(len(LATENCY_BUCKETS) + 1)
+    ]
+    if not any(counts):
+        return []
+    samples = []
+    total = 0
+    for bound, count in zip((*LATENCY_BUCKETS, '+Inf'), counts):
+        total += count
+        samples.append(('_bucket', {'view': view_name, 'le': bound}, total))
+    duration_sum = counters.get(get_request_key(view_name, 'sum'), 0)
+    samples.append(
+        ('_sum', {'view': view_name}, duration_sum / MICROSECONDS),
+    )
+    samples.append(('_count', {'view': view_name}, total))
+    return samples
+
+
+def _business_lines():
+    business_metrics = get_business_metrics()
+    status_samples = [
+        ({'status': status}, count)
+        for status, count in business_metrics['statuses']
+    ]
+    executor_samples = [
+        ({'executor': executor or ''}, count)
+        for executor, count in business_metrics['executors']
+    ]
+    return [
+        *_family('tasks', 'gauge', 'Tasks by status.', status_samples),
+        *_family(
+            'executor_tasks',
+            'gauge',
+            'Tasks by executor username, empty for unassigned tasks.',
+            executor_samples,
+        ),
+        *_family(
+            'business_metrics_refreshed_timestamp_seconds',
+            'gauge',
+            'Time the task counts were last aggregated.',
+            [({}, business_metrics['refreshed_at'])],
+        ),
+    ]
+
+
+def _family(name, kind, help_text, samples):
+    return [
+        '# HELP {0}{1} {2}'.format(PREFIX, name, help_text),
+        '# TYPE {0}{1} {2}'.format(PREFIX, name, kind),
+        *(
+            _format_sample(name, labels, sample_value)
+            for labels, sample_value in samples
+        ),
+    ]
+
+
+def _format_sample(name, labels, sample_value):
+    label_pairs = ','.join(
+        '{0}="{1}"'.format(label, _escape(str(label_value)))
+        for label, label_value in labels.items()
+    )
+    if label_pairs:
+        label_pairs = '{{{0}}}'.format(label_pairs)
+    return '{0}{1}{2} {3}'.format(PREFIX, name, label_pairs, sample_value)
+
+
+def _escape(label_value):
+    escaped = label_value.replace('\\', r'\\').replace('"', r'\"')
+    return escaped.replace('\n', r'\n')
@@ -0,0 +1,197 @@
+import csv
+import io
+import itertools
+import re
+import types
+import zipfile
+
+from django.http import Http404, StreamingHttpResponse
+from django.utils.html import escape
+
+ROWS_PER_CHUNK = 500
+# Spreadsheet applications run text cells starting with these as formulas.
+CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+XLSX_CONTENT_TYPE = (
+    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+)
+
+XLSX_PARTS = (
+    (
+        '[Content_Types].xml',
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/'
+        'content-types">'
+        '<Default Extension="rels" ContentType="application/'
+        'vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>',
+    ),
+    (
+        '_rels/.rels',
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/'
+        '2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/'
+        'officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>',
+    ),
+    (
+        'xl/workbook.xml',
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/'
+        'spreadsheetml/2006/main" xmlns:r="http://schemas.openxmlformats.org/'
+        'officeDocument/2006/relationships">'
+        '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>',
+    ),
+    (
+        'xl/_rels/workbook.xml.rels',
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/'
+        '2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/'
+        'officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '</Relationships>',
+    ),
+)
+
+XLSX_SHEET_START = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/'
+    '2006/main"><sheetData>'
+)
+XLSX_SHEET_END = '</sheetData></worksheet>'
+XLSX_TEXT_CELL = '<c t="inlineStr"><is><t xml:space="preserve">{0}</t></is></c>'
+
+# Control characters that XML 1.0 does not allow.
+XML_ILLEGAL_CHARACTERS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def spreadsheet_response(export_format, header, rows, file_name):
+    """Return a response streaming the header and the rows as a file."""
+    if export_format not in SPREADSHEET_FORMATS:
+        raise Http404
+    stream, content_type = SPREADSHEET_FORMATS[export_format]
+    response = StreamingHttpResponse(
+        stream(itertools.chain([header], rows)),
+        content_type=content_type,
+    )
+    response['Content-Disposition'] = 'attachment; filename="{0}.{1}"'.format(
+        file_name,
+        export_format,
+    )
+    return response
+
+
+def stream_csv(rows):
+    """
+    Stream the rows as CSV, a chunk at a time.
+
+    The output starts with a byte order mark, so spreadsheet applications
+    detect the UTF-8 encoding. Text that would be run as a formula, like a
+    task named `=HYPERLINK(...)`, is prefixed with a quote.
+
+    Yields:
+        Bytes of the next chunk of rows.
+    """
+    buffer = io.StringIO()
+    buffer.write('\ufeff')
+    writer = csv.writer(buffer)
+    for chunk in _chunks(rows):
+        writer.writerows(
+            [
+                "'{0}".format(cell)
+                if isinstance(cell, str) and cell[:1] in CSV_FORMULA_PREFIXES
+                else cell
+                for cell in row
+            ]
+            for row in chunk
+        )
+        yield _drain(buffer).encode()
+    remaining = _drain(buffer)
+    if remaining:
+        yield remaining.encode()
+
+
+def stream_xlsx(rows):
+    """
+    Stream the rows as an XLSX workbook, a chunk at a time.
+
+    The workbook holds a single sheet of inline strings and numbers. The
+    sheet is compressed as it is written, and the ZIP archive is written
+    to a buffer without seeking, so only the current chunk is in memory.
+
+    Yields:
+        Bytes of the archive written for the next chunk of rows.
+    """
+    buffer = _ArchiveBuffer()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for part_name, part in XLSX_PARTS:
+            archive.writestr(part_name, part)
+        with archive.open('xl/worksheets/sheet1.xml', 'w') as sheet:
+            sheet.write(XLSX_SHEET_START.encode())
+            for chunk in _chunks(rows):
+                sheet.write(''.join(map(_xlsx_row, chunk)).encode())
+                yield buffer.drain()
+            sheet.write(XLSX_SHEET_END.encode())
+    yield buffer.drain()
+
+
+class _ArchiveBuffer(object):
+    """Unseekable file-like object collecting the bytes of an archive."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, archive_bytes):
+        self.chunks.append(bytes(archive_bytes))
+        return len(archive_bytes)
+
+    def flush(self):
+        """Do nothing, the bytes are taken out by `drain`."""
+
+    def drain(self):
+        """Return and forget the bytes written so far."""
+        written = b''.join(self.chunks)
+        self.chunks = []
+        return written
+
+
+def _chunks(rows):
+    rows = iter(rows)
+    chunk = list(itertools.islice(rows, ROWS_PER_CHUNK))
+    while chunk:
+        yield chunk
+        chunk = list(itertools.islice(rows, ROWS_PER_CHUNK))
+
+
+def _drain(buffer):
+    text = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return text
+
+
+def _xlsx_row(row):
+    cells = []
+    for cell in row:
+        if isinstance(cell, int) and not isinstance(cell, bool):
+            cells.append('<c><v>{0}</v></c>'.format(cell))
+        else:
+            text = XML_ILLEGAL_CHARACTERS.sub('', str(cell))
+            cells.append(XLSX_TEXT_CELL.format(escape(text)))
+    return '<row>{0}</row>'.format(''.join(cells))
+
+
+SPREADSHEET_FORMATS = types.MappingProxyType({
+    'csv': (stream_csv, 'text/csv; charset=utf-8'),
+    'xlsx': (stream_xlsx, XLSX_CONTENT_TYPE),
+})
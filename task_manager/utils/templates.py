@@ -0,0 +1,40 @@
+from pathlib import Path
+
+from django.apps import apps
+from django.template import Engine, TemplateDoesNotExist, TemplateSyntaxError
+
+
+def get_project_templates():
+    """Return the names of every template under task_manager/templates."""
+    templates_dir = Path(apps.get_app_config('task_manager').path) / (
+        'templates'
+    )
+    return sorted(
+        str(path.relative_to(templates_dir))
+        for path in templates_dir.rglob('*.html')
+    )
+
+
+def warm_up_templates(engine=None):
+    """
+    Compile every project template and return the errors by template name.
+
+    With the cached loader the compiled templates are kept for the life
+    of the process, so requests never parse a template. Each worker has
+    its own cache, so this runs once per worker process.
+    """
+    engine = engine or Engine.get_default()
+    errors = {}
+    for template_name in get_project_templates():
+        try:
+            engine.get_template(template_name)
+        except (TemplateDoesNotExist, TemplateSyntaxError) as error:
+            errors[template_name] = error
+    return errors
+
+
+def reset_template_cache(engine=None):
+    """Forget the compiled templates of the cached loaders."""
+    engine = engine or Engine.get_default()
+    for loader in engine.template_loaders:
+        loader.reset()
@@ -1,24 +1,60 @@
+import functools
+import operator
+
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db import IntegrityError, models, transaction
+from django.shortcuts import redirect
 from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 
+from task_manager.tasks.models import Task
+
 
 class TaskManagerLoginMixin(LoginRequiredMixin):
     """Mixin for views that require login."""
 
     login_url = reverse_lazy('login')
     redirect_field_name = None
+    login_required_message = _('You are not signed in! Please, sign in')
 
     def handle_no_permission(self):
         """Handle the case when the user does not signed in."""
-        messages.error(
-            self.request,
-            _('You are not signed in! Please, sign in'),
-        )
+        messages.error(self.request, self.login_required_message)
         return super().handle_no_permission()
 
 
+class ObjectPermissionMixin(object):
+    """
+    Mixin for views of one object checking that the user may access it.
+
+    The object is loaded once per request and shared by the check and the
+    view. Users refused by `has_object_permission` are redirected to
+    `permission_denied_url` with `permission_denied_message`. The mixin
+    goes after the login mixin, so that only signed in users are checked.
+    """
+
+    permission_denied_message = None
+    permission_denied_url = None
+
+    def dispatch(self, request, *args, **kwargs):
+        """Redirect the users who may not access the object."""
+        if not self.has_object_permission(self.get_object()):
+            messages.error(request, self.permission_denied_message)
+            return redirect(self.permission_denied_url)
+        return super().dispatch(request, *args, **kwargs)
+
+    def get_object(self, queryset=None):  # noqa: WPS615
+        """Return the object of the request, loaded by the first call."""
+        if getattr(self, 'object', None) is None:
+            self.object = super().get_object(queryset)
+        return self.object
+
+    def has_object_permission(self, instance):
+        """Return whether the user may access the object, any user may."""
+        return True
+
+
 class TaskManagerFormValidMixin(object):
     """Mixin for views that handle valid forms."""
 
@@ -30,3 +66,64 @@ class TaskManagerFormValidMixin(object):
             _(self.success_message),
         )
         return response
+
+
+class UniqueNameMixin(object):
+    """
+    Mixin for views saving a model with a unique name.
+
+    The name is not looked up before saving: the unique index rejects a
+    taken name inside a savepoint and the error is shown on the form.
+    This saves a query per save, and two requests saving the same name at
+    once cannot both pass the check.
+    """
+
+    unique_name_message = None
+
+    def form_valid(self, form):
+        """Save the form, or show it again if the name is already taken."""
+        try:
+            with transaction.atomic():
+                return super().form_valid(form)
+        except IntegrityError:
+            if not self.is_name_taken(form.instance):
+                raise
+        form.add_error('name', self.unique_name_message)
+        return self.form_invalid(form)
+
+    def is_name_taken(self, instance):
+        """Return whether another row has the name of the instance."""
+        return self.model.objects.filter(
+            name=instance.name,
+        ).exclude(pk=instance.pk).exists()
+
+
+def tasks_count_subquery(*lookups):
+    """
+    Return an expression counting the tasks that use the row.
+
+    A task uses the row when any of the lookups points to it. Each row is
+    counted by a correlated subquery, so a task referring to the row
+    twice, like a user who is both author and executor, counts once and
+    the list is still fetched with a single query.
+    """
+    condition = functools.reduce(
+        operator.or_,
+        (models.Q(**{lookup: models.OuterRef('pk')}) for lookup in lookups),
+    )
+    tasks = Task.objects.filter(condition).order_by().annotate(
+        tasks_count=models.Func('pk', function='COUNT'),
+    ).values('tasks_count')
+    return models.Subquery(tasks, output_field=models.IntegerField())
+
+
+class TaskUsageMixin(object):
+    """Mixin for list views annotating each row with its task count."""
+
+    task_lookups = ()
+
+    def get_queryset(self):
+        """Annotate the rows with `tasks_count`."""
+        return super().get_queryset().annotate(
+            tasks_count=tasks_count_subquery(*self.task_lookups),
+        )
@@ -0,0 +1,95 @@
+import base64
+import dataclasses
+import hashlib
+import re
+from pathlib import Path
+from urllib.request import urlopen
+
+from django.conf import settings
+
+VENDOR_DIR = 'vendor'
+# Collectstatic fails on source map comments whose maps are not vendored.
+SOURCE_MAP_COMMENT = re.compile(rb'\s*/[*/]# sourceMappingURL=[^\n]*')
+
+
+class VendorError(Exception):
+    """Raised when a downloaded asset does not match its integrity hash."""
+
+
+@dataclasses.dataclass(frozen=True)
+class VendorAsset(object):
+    """A third-party static file served from the project static files."""
+
+    path: str
+    url: str
+    integrity: str
+
+    @property
+    def static_path(self):
+        """Return the path of the asset under the static files."""
+        return '{0}/{1}'.format(VENDOR_DIR, self.path)
+
+
+# The versions django-bootstrap4 used to load from CDNs.
+VENDOR_ASSETS = (
+    VendorAsset(
+        'bootstrap/bootstrap.min.css',
+        'https://cdn.jsdelivr.net/npm/bootstrap@4.6.2/dist/css/'
+        'bootstrap.min.css',
+        'sha384-xOolHFLEh07PJGoPkLv1IbcEPTNtaed2'
+        'xpHsD9ESMhqIYd0nLMwNLD69Npy4HI+N',
+    ),
+    VendorAsset(
+        'bootstrap/bootstrap.bundle.min.js',
+        'https://cdn.jsdelivr.net/npm/bootstrap@4.6.2/dist/js/'
+        'bootstrap.bundle.min.js',
+        'sha384-Fy6S3B9q64WdZWQUiU+q4/2Lc9npb8tC'
+        'aSX9FK7E8HnRr0Jz8D6OP9dO5Vg3Q9ct',
+    ),
+    VendorAsset(
+        'jquery/jquery.slim.min.js',
+        'https://code.jquery.com/jquery-3.5.1.slim.min.js',
+        'sha384-DfXdz2htPH0lsSSs5nCTpuj/zy4C+OGp'
+        'amoFVy38MVBnE+IbbVYUew+OrCXaRkfj',
+    ),
+)
+
+
+def get_vendor_root():
+    """Return the directory of the vendored assets."""
+    return Path(settings.BASE_DIR) / 'static' / VENDOR_DIR
+
+
+def get_missing_assets(vendor_root=None):
+    """Return the vendored assets missing from the static files."""
+    vendor_root = vendor_root or get_vendor_root()
+    return [
+        asset
+        for asset in VENDOR_ASSETS
+        if not (vendor_root / asset.path).is_file()
+    ]
+
+
+def get_integrity(asset_content):
+    """Return the subresource integrity hash of the content."""
+    digest = hashlib.sha384(asset_content).digest()
+    return 'sha384-{0}'.format(base64.b64encode(digest).decode())
+
+
+def download_asset(asset, vendor_root=None):
+    """
+    Download an asset into the static files after checking its hash.
+
+    Source map comments are removed, as the maps themselves are not
+    vendored and the manifest storage refuses references to missing files.
+    """
+    vendor_root = vendor_root or get_vendor_root()
+    with urlopen(asset.url) as response:  # noqa: S310
+        asset_content = response.read()
+    if get_integrity(asset_content) != asset.integrity:
+        raise VendorError(
+            '{0} does not match its integrity hash.'.format(asset.url),
+        )
+    target = vendor_root / asset.path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(SOURCE_MAP_COMMENT.sub(b'', asset_content))
@@ -1,15 +1,29 @@
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.views import LoginView, LogoutView
+from django.http import HttpResponse, HttpResponseForbidden
 from django.urls import reverse_lazy
+from django.utils.crypto import constant_time_compare
 from django.utils.translation import gettext_lazy as _
+from django.views import View
 from django.views.generic import TemplateView
 
+from task_manager.tasks.dashboard import get_dashboard
+from task_manager.utils.prometheus import CONTENT_TYPE, render_metrics
+
 
 class Index(TemplateView):
-    """Render the index template."""
+    """Render the index template, with task counts for signed in users."""
 
     template_name = 'index.html'
 
+    def get_context_data(self, **kwargs):
+        """Add the task counts of the dashboard."""
+        context = super().get_context_data(**kwargs)
+        if self.request.user.is_authenticated:
+            context['dashboard'] = get_dashboard()
+        return context
+
 
 class UserLoginView(LoginView):
     """View for logging in a user."""
@@ -35,3 +49,18 @@ class UserLogoutView(LogoutView):
         """Dispatch method for logging the user out."""
         messages.success(self.request, _('You are logged out'))
         return super().dispatch(request, *args, **kwargs)
+
+
+class MetricsView(View):
+    """Expose the metrics of the application to Prometheus."""
+
+    def get(self, request, *args, **kwargs):
+        """Return the metrics if the request carries the metrics token."""
+        token = settings.METRICS_TOKEN
+        is_authorized = not token or constant_time_compare(
+            request.headers.get('Authorization', ''),
+            'Bearer {0}'.format(token),
+        )
+        if not is_authorized:
+            return HttpResponseForbidden()
+        return HttpResponse(render_metrics(), content_type=CONTENT_TYPE)